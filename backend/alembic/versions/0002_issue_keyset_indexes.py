@@ -0,0 +1,26 @@
+"""issue keyset pagination indexes
+
+Revision ID: 0002_issue_keyset_indexes
+Revises: 0001_initial
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_issue_keyset_indexes"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_issues_project_created", "issues", ["project_id", "created_at", "id"])
+    op.create_index("ix_issues_project_priority", "issues", ["project_id", "priority", "id"])
+    op.create_index("ix_issues_project_status", "issues", ["project_id", "status", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issues_project_status", table_name="issues")
+    op.drop_index("ix_issues_project_priority", table_name="issues")
+    op.drop_index("ix_issues_project_created", table_name="issues")
@@ -0,0 +1,32 @@
+"""issue full-text search index
+
+Revision ID: 0003_issue_search_index
+Revises: 0002_issue_keyset_indexes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.search import SqliteFtsBackend
+
+revision = "0003_issue_search_index"
+down_revision = "0002_issue_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+    backend = SqliteFtsBackend()
+    backend.install(bind)
+    backend.rebuild(bind)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+    SqliteFtsBackend().uninstall(bind)
@@ -0,0 +1,22 @@
+"""comment keyset pagination index
+
+Revision ID: 0004_comment_keyset_index
+Revises: 0003_issue_search_index
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_comment_keyset_index"
+down_revision = "0003_issue_search_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_comments_issue_created", "comments", ["issue_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comments_issue_created", table_name="comments")
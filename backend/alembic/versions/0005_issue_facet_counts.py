@@ -0,0 +1,31 @@
+"""issue facet counters
+
+Revision ID: 0005_issue_facet_counts
+Revises: 0004_comment_keyset_index
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.crud.facets import rebuild_facet_counts
+
+revision = "0005_issue_facet_counts"
+down_revision = "0004_comment_keyset_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_facet_counts",
+        sa.Column("project_id", sa.Integer(), sa.ForeignKey("projects.id"), primary_key=True),
+        sa.Column("facet", sa.String(length=20), primary_key=True),
+        sa.Column("value", sa.String(length=40), primary_key=True),
+        sa.Column("count", sa.Integer(), nullable=False),
+    )
+    rebuild_facet_counts(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_table("issue_facet_counts")
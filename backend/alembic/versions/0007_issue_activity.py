@@ -0,0 +1,34 @@
+"""issue activity history
+
+Revision ID: 0007_issue_activity
+Revises: 0006_project_version
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_issue_activity"
+down_revision = "0006_project_version"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "issue_activity",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("issue_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("actor_id", sa.Integer(), nullable=True),
+        sa.Column("field", sa.String(length=20), nullable=False),
+        sa.Column("old_value", sa.String(length=40), nullable=True),
+        sa.Column("new_value", sa.String(length=40), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_issue_activity_issue_id_id", "issue_activity", ["issue_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issue_activity_issue_id_id", table_name="issue_activity")
+    op.drop_table("issue_activity")
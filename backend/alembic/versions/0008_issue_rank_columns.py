@@ -0,0 +1,31 @@
+"""generated priority/status rank columns for keyset ordering
+
+Revision ID: 0008_issue_rank_columns
+Revises: 0007_issue_activity
+Create Date: 2026-10-18 00:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.issue import PRIORITY_ORDER, STATUS_ORDER, rank_expression
+
+revision = "0008_issue_rank_columns"
+down_revision = "0007_issue_activity"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Virtual generated columns: SQLite can add them in place, and only the indexes store the ranks.
+    op.add_column("issues", sa.Column("status_rank", sa.Integer(), sa.Computed(rank_expression("status", STATUS_ORDER))))
+    op.add_column("issues", sa.Column("priority_rank", sa.Integer(), sa.Computed(rank_expression("priority", PRIORITY_ORDER))))
+    op.create_index("ix_issues_project_priority_rank", "issues", ["project_id", "priority_rank", "id"])
+    op.create_index("ix_issues_project_status_rank", "issues", ["project_id", "status_rank", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_issues_project_status_rank", table_name="issues")
+    op.drop_index("ix_issues_project_priority_rank", table_name="issues")
+    op.drop_column("issues", "priority_rank")
+    op.drop_column("issues", "status_rank")
@@ -0,0 +1,210 @@
+"""Per-user rate limiting and per-route-class concurrency caps, applied before routing.
+
+Every ``/api`` request is put in a route class (``login``, ``search``,
+``export`` or ``default``). Each class has a token bucket per caller and a
+cap on requests in flight across all callers. Over budget, the request gets
+429 with ``Retry-After`` straight away, or after waiting at most
+``ADMISSION_QUEUE_TIMEOUT_SECONDS`` for a concurrency slot. Callers are keyed
+by the JWT principal, falling back to the client address (always for login,
+which has no token yet). Everything lives in memory and costs O(1) per request.
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import OrderedDict, deque
+from urllib.parse import parse_qs
+
+from fastapi.responses import JSONResponse
+
+from app.api.deps import principal_from_token
+from app.core import metrics
+from app.core.config import settings
+
+_LOGIN_PATHS = frozenset({"/api/auth/login", "/api/auth/signup"})
+_ISSUE_LIST = re.compile(r"^/api/projects/\d+/issues$")
+_ISSUE_EXPORT = re.compile(r"^/api/projects/\d+/issues/export$")
+# Live event streams stay open indefinitely, so they are rate limited but hold no concurrency slot.
+_EVENT_STREAM = re.compile(r"^/api/(projects|issues)/\d+/events$")
+
+rejections = metrics.Counter("admission_rejected_total", "Requests rejected by admission control.", ("route_class", "reason"))
+
+
+class RouteClassState:
+    def __init__(self, rate: float, burst: float, concurrency: int):
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future] = deque()
+        # key -> [tokens, last refill time], least recently used first
+        self.buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+
+class AdmissionController:
+    def __init__(self, budgets: dict[str, dict[str, float]], queue_timeout: float, max_queued: int, max_keys: int):
+        self.configure(budgets, queue_timeout, max_queued, max_keys)
+
+    def configure(self, budgets: dict[str, dict[str, float]], queue_timeout: float, max_queued: int, max_keys: int) -> None:
+        """Apply new budgets, resetting all buckets and counters."""
+        self.queue_timeout = queue_timeout
+        self.max_queued = max_queued
+        self.max_keys = max_keys
+        self.classes = {
+            name: RouteClassState(budget["rate"], budget["burst"], int(budget["concurrency"]))
+            for name, budget in budgets.items()
+        }
+
+    @staticmethod
+    def classify(method: str, path: str, query_string: bytes) -> str | None:
+        if not path.startswith("/api/") or method == "OPTIONS":
+            return None
+        if path in _LOGIN_PATHS:
+            return "login"
+        if _ISSUE_EXPORT.match(path):
+            return "export"
+        if b"q=" in query_string and _ISSUE_LIST.match(path) and parse_qs(query_string.decode("latin-1")).get("q"):
+            return "search"
+        return "default"
+
+    def take_token(self, state: RouteClassState, key: str) -> float:
+        """Spend one token from ``key``'s bucket; return 0, or seconds until one is available."""
+        now = time.monotonic()
+        bucket = state.buckets.get(key)
+        if bucket is None:
+            bucket = state.buckets[key] = [state.burst, now]
+            if len(state.buckets) > self.max_keys:
+                state.buckets.popitem(last=False)
+        else:
+            state.buckets.move_to_end(key)
+            bucket[0] = min(state.burst, bucket[0] + (now - bucket[1]) * state.rate)
+            bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        return (1 - bucket[0]) / state.rate
+
+    async def acquire(self, state: RouteClassState) -> bool:
+        """Take a concurrency slot, waiting up to ``queue_timeout`` behind at most ``max_queued`` others."""
+        if state.in_flight < state.concurrency:
+            state.in_flight += 1
+            return True
+        if self.queue_timeout <= 0 or len(state.waiters) >= self.max_queued:
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        state.waiters.append(waiter)
+        try:
+            # release() hands its slot straight to the waiter, so in_flight is already counted.
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._forget(state, waiter)
+            return False
+        except BaseException:
+            # Cancelled while queued: give back a slot that was handed over at the same moment.
+            if waiter.done() and not waiter.cancelled():
+                self.release(state)
+            else:
+                self._forget(state, waiter)
+            raise
+        return True
+
+    @staticmethod
+    def _forget(state: RouteClassState, waiter: asyncio.Future) -> None:
+        try:
+            state.waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self, state: RouteClassState) -> None:
+        while state.waiters:
+            waiter = state.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        state.in_flight -= 1
+
+    def stats(self):
+        for name, state in self.classes.items():
+            yield (name, "in_flight"), state.in_flight
+            yield (name, "queued"), len(state.waiters)
+            yield (name, "tracked_callers"), len(state.buckets)
+
+
+def _caller_key(scope, route_class: str) -> str:
+    if route_class != "login":
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() == "bearer" and token:
+                    try:
+                        return f"user:{principal_from_token(token).id}"
+                    except Exception:
+                        break
+                break
+    client = scope.get("client")
+    return f"addr:{client[0] if client else 'unknown'}"
+
+
+def _too_many_requests(message: str, retry_after: float) -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"error": {"code": "rate_limited", "message": message}},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+admission = AdmissionController(
+    settings.ADMISSION_BUDGETS,
+    queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    max_queued=settings.ADMISSION_MAX_QUEUED,
+    max_keys=settings.ADMISSION_MAX_TRACKED_CALLERS,
+)
+
+metrics.register(rejections)
+metrics.register(metrics.Gauge(
+    "admission_state", "Admission control in-flight requests, queued waiters and tracked callers per route class.",
+    ("route_class", "state"), admission.stats,
+))
+
+
+async def admit(app, scope, receive, send, held_class: str | None = None) -> None:
+    """Run ``app`` within the budget of the request's route class, or answer 429.
+
+    ``held_class`` names a class whose concurrency slot the caller already
+    holds: a batch runs its sub-requests one at a time inside its own slot,
+    so only sub-requests of another class wait for a slot of their own.
+    """
+    route_class = admission.classify(scope["method"], scope["path"], scope["query_string"])
+    state = admission.classes.get(route_class)
+    if state is None or not settings.ADMISSION_ENABLED:
+        await app(scope, receive, send)
+        return
+
+    retry_after = admission.take_token(state, _caller_key(scope, route_class))
+    if retry_after:
+        rejections.inc(route_class, "rate")
+        await _too_many_requests("Rate limit exceeded", retry_after)(scope, receive, send)
+        return
+    if route_class == held_class or _EVENT_STREAM.match(scope["path"]):
+        await app(scope, receive, send)
+        return
+    if not await admission.acquire(state):
+        rejections.inc(route_class, "concurrency")
+        await _too_many_requests("Server busy, retry shortly", admission.queue_timeout)(scope, receive, send)
+        return
+    try:
+        await app(scope, receive, send)
+    finally:
+        admission.release(state)
+
+
+class AdmissionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.ADMISSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        await admit(self.app, scope, receive, send)
@@ -0,0 +1,81 @@
+"""Project membership checks backed by a shared (project_id, user_id) -> role cache."""
+
+from typing import NamedTuple
+
+from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.errors import api_error
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.project_member import ProjectMember
+
+
+class Membership(NamedTuple):
+    project_id: int
+    user_id: int
+    role: str
+
+
+# Non-members are cached as None so repeated 403s do not hit the database either.
+role_cache = TTLCache(
+    maxsize=settings.MEMBERSHIP_CACHE_SIZE,
+    ttl=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
+
+
+async def get_role(db: AsyncSession, project_id: int, user_id: int) -> str | None:
+    key = (project_id, user_id)
+    role = role_cache.get(key, default=False)
+    if role is not False:
+        return role
+    role = await db.scalar(
+        select(ProjectMember.role).where(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
+    )
+    role_cache.set(key, role)
+    return role
+
+
+async def get_membership(db: AsyncSession, project_id: int, user_id: int) -> Membership | None:
+    role = await get_role(db, project_id, user_id)
+    if role is None:
+        return None
+    return Membership(project_id, user_id, role)
+
+
+async def require_membership(db: AsyncSession, project_id: int, user_id: int) -> Membership:
+    member = await get_membership(db, project_id, user_id)
+    if not member:
+        raise api_error(status.HTTP_403_FORBIDDEN, "forbidden", "Project membership required")
+    return member
+
+
+async def require_maintainer(db: AsyncSession, project_id: int, user_id: int) -> Membership:
+    member = await require_membership(db, project_id, user_id)
+    if member.role != "maintainer":
+        raise api_error(status.HTTP_403_FORBIDDEN, "forbidden", "Maintainer role required")
+    return member
+
+
+async def filter_members(db: AsyncSession, project_id: int, user_ids: set[int]) -> set[int]:
+    """Return the subset of ``user_ids`` that belong to the project, in one query."""
+    if not user_ids:
+        return set()
+    rows = await db.execute(
+        select(ProjectMember.user_id, ProjectMember.role)
+        .where(ProjectMember.project_id == project_id, ProjectMember.user_id.in_(user_ids))
+    )
+    members = set()
+    for user_id, role in rows:
+        role_cache.set((project_id, user_id), role)
+        members.add(user_id)
+    return members
+
+
+def invalidate_membership(project_id: int, user_id: int | None = None) -> None:
+    """Drop cached roles for one member, or for every member of a project."""
+    if user_id is not None:
+        role_cache.invalidate((project_id, user_id))
+    else:
+        role_cache.invalidate_where(lambda key: key[0] == project_id)
@@ -0,0 +1,133 @@
+"""Run several API reads in-process and splice their responses into one body.
+
+Each sub-request is matched against the app's routes and handled by that
+route directly, without passing through middleware again. It is still
+charged to its own route class by admission control and recorded in the
+request metrics under its route, as if it had arrived on its own; its
+queries also count towards the batch. ``batch_context`` makes ``get_db`` and
+``get_current_principal`` hand every sub-request the batch's own session and
+principal, so the token is decoded and the user loaded once. Membership
+checks already go through the shared role cache, so after the first
+sub-request for a project the rest skip the database.
+"""
+
+import logging
+import time
+from urllib.parse import unquote
+
+import orjson
+from starlette.routing import Match
+
+from app.api.admission import admission, admit
+from app.api.metrics import observe_request
+from app.core.config import settings
+from app.core.metrics import RequestStats, request_stats
+from app.schemas.batch import BatchItem
+
+logger = logging.getLogger("app.batch")
+
+# Streams never finish (events) or are too large to buffer (exports).
+UNBATCHABLE_ROUTES = frozenset({
+    "/api/projects/{project_id}/events",
+    "/api/issues/{issue_id}/events",
+    "/api/projects/{project_id}/issues/export",
+})
+
+# Response headers passed through to each item.
+FORWARDED_HEADERS = (b"etag", b"x-next-cursor", b"x-last-cursor", b"retry-after")
+
+_NOT_FOUND = b'{"error":{"code":"not_found","message":"Not Found"}}'
+_NOT_ALLOWED = b'{"error":{"code":"method_not_allowed","message":"Method Not Allowed"}}'
+_NOT_BATCHABLE = b'{"error":{"code":"not_batchable","message":"Streaming endpoints cannot be batched"}}'
+_INTERNAL_ERROR = b'{"error":{"code":"internal_error","message":"Internal Server Error"}}'
+
+
+def _sub_scope(parent: dict, item: BatchItem) -> dict:
+    path, _, query = item.path.partition("?")
+    headers = [(name, value) for name, value in parent["headers"] if name == b"authorization"]
+    if item.if_none_match:
+        headers.append((b"if-none-match", item.if_none_match.encode("latin-1")))
+    scope = {
+        key: parent[key]
+        for key in ("type", "http_version", "scheme", "server", "client", "root_path", "app", "state", "starlette.exception_handlers")
+        if key in parent
+    }
+    scope.update(
+        method=item.method,
+        path=unquote(path),
+        raw_path=path.encode(),
+        query_string=query.encode(),
+        headers=headers,
+    )
+    return scope
+
+
+async def _empty_body():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def dispatch(app, parent_scope: dict, item: BatchItem) -> tuple[int, dict[str, str], bytes]:
+    """Run one sub-request through its route; return its status, forwarded headers and JSON body."""
+    scope = _sub_scope(parent_scope, item)
+    stats = RequestStats()
+    token = request_stats.set(stats)
+    status_code = 500
+    start = time.perf_counter()
+    try:
+        status_code, headers, body = await _run(app, parent_scope, scope, item)
+    finally:
+        elapsed = time.perf_counter() - start
+        request_stats.reset(token)
+        parent = request_stats.get()
+        if parent is not None:
+            parent.queries += stats.queries
+            parent.query_seconds += stats.query_seconds
+        if settings.METRICS_ENABLED:
+            observe_request(scope, status_code, elapsed, stats)
+    return status_code, headers, body
+
+
+async def _run(app, parent_scope: dict, scope: dict, item: BatchItem) -> tuple[int, dict[str, str], bytes]:
+    partial = None
+    for route in app.router.routes:
+        match, child_scope = route.matches(scope)
+        if match == Match.FULL:
+            break
+        if match == Match.PARTIAL and partial is None:
+            partial = route
+    else:
+        return (405, {}, _NOT_ALLOWED) if partial is not None else (404, {}, _NOT_FOUND)
+    if route.path in UNBATCHABLE_ROUTES:
+        return 400, {}, _NOT_BATCHABLE
+    scope.update(child_scope)
+
+    status_code = 500
+    headers = {}
+    chunks = []
+
+    async def send(message):
+        nonlocal status_code
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            for name, value in message.get("headers", ()):
+                if name in FORWARDED_HEADERS:
+                    headers[name.decode()] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    held_class = admission.classify(parent_scope["method"], parent_scope["path"], parent_scope["query_string"])
+    try:
+        await admit(route.handle, scope, _empty_body, send, held_class)
+    except Exception:
+        logger.exception("Batched request %s %s failed", item.method, item.path)
+        return 500, {}, _INTERNAL_ERROR
+    return status_code, headers, b"".join(chunks)
+
+
+def encode_results(results: list[tuple[BatchItem, int, dict[str, str], bytes]]) -> bytes:
+    """Build ``{"responses": [...]}``, splicing each already-encoded body in as-is."""
+    parts = []
+    for item, status_code, headers, body in results:
+        envelope = orjson.dumps({"id": item.id, "status": status_code, "headers": headers})
+        parts.append(envelope[:-1] + b',"body":' + (body or b"null") + b"}")
+    return b'{"responses":[' + b",".join(parts) + b"]}"
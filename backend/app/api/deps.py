@@ -1,31 +1,101 @@
-from fastapi import Depends
+import hashlib
+import time
+from contextvars import ContextVar
+from typing import NamedTuple
+
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from jose import jwt, JWTError
 
-from app.db.session import SessionLocal
+from app.db.session import new_session
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.models.user import User
 from app.api.errors import unauthorized
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+
+# Verified tokens, keyed by SHA-256 digest and kept until the token's own expiry.
+token_cache = TTLCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
+class Principal(NamedTuple):
+    """Authenticated caller identity, available without loading the user row."""
+
+    id: int
 
 
-def get_db():
-    db = SessionLocal()
+class BatchContext(NamedTuple):
+    """Principal and session shared by every sub-request of one ``POST /api/batch``."""
+
+    principal: Principal
+    db: AsyncSession
+
+
+batch_context: ContextVar[BatchContext | None] = ContextVar("batch_context", default=None)
+
+READ_METHODS = frozenset({"GET", "HEAD"})
+
+
+def get_session_factory():
+    """Session opener, for work that outlives the request's own session (e.g. streamed bodies)."""
+    return new_session
+
+
+async def get_db(request: Request, session_factory=Depends(get_session_factory)):
+    batch = batch_context.get()
+    if batch is not None:
+        # Owned, and closed, by the batch request.
+        yield batch.db
+        return
+    db = session_factory(readonly=request.method in READ_METHODS)
     try:
         yield db
     finally:
-        db.close()
+        await db.close()
 
 
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
+async def get_current_principal(token: str = Depends(oauth2_scheme)) -> Principal:
+    # Async so FastAPI runs it on the event loop: the lookup is a cache hit or a JWT decode, never I/O.
+    batch = batch_context.get()
+    if batch is not None:
+        return batch.principal
+    return principal_from_token(token)
+
+
+def principal_from_token(token: str) -> Principal:
+    """Verify ``token``, consulting ``token_cache`` first; raises 401 when it is invalid."""
+    key = hashlib.sha256(token.encode()).digest()
+    principal = token_cache.get(key, default=None)
+    if principal is not None:
+        return principal
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        user_id = int(payload.get("sub"))
+        principal = Principal(int(payload.get("sub")))
     except (JWTError, ValueError, TypeError):
         raise unauthorized("Invalid token")
-    user = db.query(User).filter(User.id == user_id).first()
+    exp = payload.get("exp")
+    ttl = exp - time.time() if exp is not None else None
+    if ttl is None or ttl > 0:
+        token_cache.set(key, principal, ttl=ttl)
+    return principal
+
+
+async def release_connection(db: AsyncSession) -> None:
+    """Hand the session's connection back before slow non-database work such as password hashing.
+
+    The session stays usable and checks a connection out again on its next
+    query; already loaded objects keep their attribute values.
+    """
+    await db.close()
+
+
+async def get_current_user(db: AsyncSession = Depends(get_db), principal: Principal = Depends(get_current_principal)) -> User:
+    user = await db.get(User, principal.id)
     if not user:
         raise unauthorized("User not found")
     return user
@@ -0,0 +1,57 @@
+"""Server-Sent Events framing for event broker subscriptions."""
+
+import asyncio
+
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.events import Event, Topic, broker
+
+RETRY_MS = 3000
+
+
+def format_event(event: Event) -> bytes:
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (event.id.encode(), event.type.encode(), event.data)
+
+
+async def event_stream(topic: Topic, last_event_id: str | None, heartbeat: float):
+    """Yield SSE frames for ``topic``: missed events after ``last_event_id`` first, then live ones.
+
+    Subscribing before reading history means nothing published in between is
+    lost; events seen in both are skipped by sequence number. A client whose
+    gap is no longer buffered gets a ``reset`` event and should refetch.
+    """
+    subscription = broker.subscribe(topic)
+    try:
+        yield b"retry: %d\n\n" % RETRY_MS
+        last_seq = 0
+        if last_event_id:
+            missed = broker.replay(topic, last_event_id)
+            if missed is None:
+                yield b"event: reset\ndata: {}\n\n"
+            for event in missed or ():
+                last_seq = event.seq
+                yield format_event(event)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if event is None:
+                # Evicted for falling behind; reconnecting with Last-Event-ID replays the gap.
+                yield b"event: evicted\ndata: {}\n\n"
+                return
+            if event.seq > last_seq:
+                last_seq = event.seq
+                yield format_event(event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def sse_response(topic: Topic, last_event_id: str | None) -> StreamingResponse:
+    return StreamingResponse(
+        event_stream(topic, last_event_id, settings.EVENTS_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,42 @@
+"""Encoders that turn batches of issue dicts into streamed NDJSON or CSV chunks."""
+
+import csv
+import io
+from collections.abc import AsyncIterator
+
+import orjson
+
+from app.crud.issue import ISSUE_COLUMNS
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+_CSV_FIELDS = [column.key for column in ISSUE_COLUMNS]
+
+
+async def ndjson_chunks(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        yield b"".join(orjson.dumps(issue) + b"\n" for issue in batch)
+
+
+async def csv_chunks(batches: AsyncIterator[list[dict]], with_comments: bool = False) -> AsyncIterator[bytes]:
+    fields = _CSV_FIELDS + (["comments"] if with_comments else [])
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields)
+    writer.writeheader()
+    async for batch in batches:
+        for issue in batch:
+            if with_comments:
+                # CSV has no nesting, so a row's comments travel as one JSON array cell.
+                issue["comments"] = orjson.dumps(issue["comments"]).decode()
+            writer.writerow({key: value.isoformat() if hasattr(value, "isoformat") else value for key, value in issue.items()})
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def encode(export_format: str, batches: AsyncIterator[list[dict]], with_comments: bool = False) -> AsyncIterator[bytes]:
+    if export_format == "csv":
+        return csv_chunks(batches, with_comments)
+    return ndjson_chunks(batches)
@@ -0,0 +1,27 @@
+"""The ``fields=`` query parameter for sparse list responses."""
+
+from collections.abc import Iterable
+
+from app.api.errors import api_error
+
+
+def parse_fields(raw: str | None, allowed: Iterable[str]) -> tuple[str, ...] | None:
+    """Return the requested field names in schema order, always including ``id``.
+
+    ``None`` (no parameter) means every field. Unknown names are a 400 that
+    lists them alongside the allowed ones.
+    """
+    if raw is None:
+        return None
+    allowed = tuple(allowed)
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = sorted(requested.difference(allowed))
+    if unknown or not requested:
+        raise api_error(
+            400,
+            "invalid_fields",
+            f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields requested",
+            {"unknown": unknown, "allowed": list(allowed)},
+        )
+    requested.add("id")
+    return tuple(name for name in allowed if name in requested)
@@ -0,0 +1,49 @@
+"""ASGI middleware recording per-route request metrics (see ``app.core.metrics``)."""
+
+import time
+
+from app.core.metrics import RequestStats, db_request_queries, db_request_seconds, http_latency, http_requests, request_stats
+
+
+def observe_request(scope, status_code: int, elapsed: float, stats: RequestStats) -> None:
+    """Record one finished request under its method and route template."""
+    route = scope.get("route")
+    labels = (scope["method"], route.path if route is not None else "unmatched")
+    http_requests.inc(*labels, f"{status_code // 100}xx")
+    http_latency.observe(elapsed, *labels)
+    db_request_queries.observe(stats.queries, *labels)
+    db_request_seconds.observe(stats.query_seconds, *labels)
+
+
+class MetricsMiddleware:
+    """Count requests by route template and status class, and time them including streamed bodies.
+
+    Routes are labelled by their path template (``/api/issues/{issue_id}``),
+    so label cardinality stays bounded; unrouted paths share ``unmatched``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            request_stats.reset(token)
+            observe_request(scope, status_code, elapsed, stats)
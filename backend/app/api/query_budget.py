@@ -0,0 +1,44 @@
+"""ASGI middleware that logs requests running more SQL statements than their budget."""
+
+import logging
+
+from app.core.config import settings
+from app.db.querycount import QueryLog, request_log
+
+logger = logging.getLogger("app.query_budget")
+
+
+def budget_for(method: str, route: str) -> int:
+    """``QUERY_BUDGET_OVERRIDES`` entries are keyed like ``"GET /api/issues/{issue_id}/comments"``."""
+    return settings.QUERY_BUDGET_OVERRIDES.get(f"{method} {route}", settings.QUERY_BUDGET)
+
+
+class QueryBudgetMiddleware:
+    """Record each request's statements and warn, listing them, when a budget is exceeded.
+
+    Budgets are read per request, so ``QUERY_BUDGET=0`` with no overrides
+    leaves requests untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not (settings.QUERY_BUDGET or settings.QUERY_BUDGET_OVERRIDES):
+            await self.app(scope, receive, send)
+            return
+
+        log = QueryLog()
+        token = request_log.set(log)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_log.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                budget = budget_for(scope["method"], route.path)
+                if budget and log.count > budget:
+                    logger.warning(
+                        "%s %s ran %d queries (budget %d):\n%s",
+                        scope["method"], scope["path"], log.count, budget, log.report(),
+                    )
@@ -0,0 +1,26 @@
+"""Fast JSON responses for list endpoints that already hold plain rows."""
+
+from collections.abc import Iterable, Mapping
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+
+def rows_response(rows: Iterable[Mapping], response: Response | None = None, fields: tuple[str, ...] | None = None) -> ORJSONResponse:
+    """Encode ``rows`` with orjson, bypassing ``response_model`` validation.
+
+    Only for rows selected from trusted columns that already match the
+    declared schema. Headers set on the injected ``response`` (ETag,
+    pagination cursors) are carried over, since FastAPI drops them when an
+    endpoint returns its own Response. ``fields`` trims each row to those
+    keys, dropping any extra columns selected only for sorting or paging.
+    """
+    if fields is None:
+        fast = ORJSONResponse([dict(row) for row in rows])
+    else:
+        fast = ORJSONResponse([{name: row[name] for name in fields} for row in rows])
+    if response is not None:
+        for key, value in response.headers.items():
+            if key not in ("content-length", "content-type"):
+                fast.headers.append(key, value)
+    return fast
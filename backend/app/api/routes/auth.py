@@ -1,26 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db
+from app.api.deps import get_db, release_connection
 from app.schemas.auth import SignupRequest, LoginRequest, TokenResponse
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import get_password_hash_async, verify_password_async, create_access_token
 from app.crud import user as user_crud
 
 router = APIRouter()
 
 @router.post("/signup", response_model=TokenResponse)
-def signup(data: SignupRequest, db: Session = Depends(get_db)):
-    existing = user_crud.get_by_email(db, data.email)
+async def signup(data: SignupRequest, db: AsyncSession = Depends(get_db)):
+    existing = await user_crud.get_by_email(db, data.email)
     if existing:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": {"code": "email_taken", "message": "Email already registered"}})
-    user = user_crud.create(db, data.name, data.email, get_password_hash(data.password))
+    await release_connection(db)
+    password_hash = await get_password_hash_async(data.password)
+    user = await user_crud.create(db, data.name, data.email, password_hash)
     token = create_access_token(str(user.id))
     return TokenResponse(access_token=token)
 
 @router.post("/login", response_model=TokenResponse)
-def login(data: LoginRequest, db: Session = Depends(get_db)):
-    user = user_crud.get_by_email(db, data.email)
-    if not user or not verify_password(data.password, user.password_hash):
+async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)):
+    user = await user_crud.get_by_email(db, data.email)
+    await release_connection(db)
+    if not user or not await verify_password_async(data.password, user.password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail={"error": {"code": "invalid_credentials", "message": "Invalid email or password"}})
     token = create_access_token(str(user.id))
     return TokenResponse(access_token=token)
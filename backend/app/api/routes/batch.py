@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Request, Response
+
+from app.api.batch import dispatch, encode_results
+from app.api.deps import BatchContext, Principal, batch_context, get_current_principal, get_session_factory
+from app.schemas.batch import BatchRequest
+
+router = APIRouter()
+
+
+@router.post("/batch")
+async def batch(
+    data: BatchRequest,
+    request: Request,
+    session_factory=Depends(get_session_factory),
+    current_user: Principal = Depends(get_current_principal),
+):
+    # Sub-requests run one after another: they share this session, which is not safe to use concurrently.
+    db = session_factory(readonly=True)
+    token = batch_context.set(BatchContext(current_user, db))
+    try:
+        results = []
+        for item in data.requests:
+            status_code, headers, body = await dispatch(request.app, request.scope, item)
+            if status_code >= 500:
+                # Don't let a failed read leave the shared session mid-transaction for the next one.
+                await db.rollback()
+            results.append((item, status_code, headers, body))
+    finally:
+        batch_context.reset(token)
+        await db.close()
+    return Response(encode_results(results), media_type="application/json")
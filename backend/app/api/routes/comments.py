@@ -1,31 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import Principal, get_db, get_current_principal
+from app.api.authz import require_membership
 from app.schemas.comment import CommentCreate, CommentOut
 from app.crud import comment as comment_crud
-from app.models.issue import Issue
-from app.models.project_member import ProjectMember
-from app.models.user import User
+from app.crud import issue as issue_crud
+from app.api.errors import api_error
+from app.api.etag import make_etag, matches, not_modified
+from app.api.fields import parse_fields
+from app.api.responses import rows_response
 
 router = APIRouter()
 
 @router.get("/issues/{issue_id}/comments", response_model=list[CommentOut])
-def list_comments(issue_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
-    if not issue:
+async def list_comments(
+    issue_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = None,
+    since: str | None = None,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    if cursor and since:
+        raise api_error(status.HTTP_400_BAD_REQUEST, "invalid_cursor", "Use either cursor or since, not both")
+    selected = parse_fields(fields, CommentOut.model_fields)
+    thread = await comment_crud.get_thread_state(db, issue_id)
+    if not thread:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
-    member = db.query(ProjectMember).filter(ProjectMember.project_id == issue.project_id, ProjectMember.user_id == current_user.id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail={"error": {"code": "forbidden", "message": "Project membership required"}})
-    return issue.comments
+    project_id, last_comment_id, comment_count = thread
+    await require_membership(db, project_id, current_user.id)
+    etag = make_etag("comments", issue_id, (last_comment_id, comment_count), sorted(request.query_params.multi_items()))
+    if matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        rows, next_cursor = await comment_crud.list_issue_comments(db, issue_id, limit, cursor or since, selected)
+    except comment_crud.InvalidCursor as exc:
+        raise api_error(status.HTTP_400_BAD_REQUEST, "invalid_cursor", str(exc))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if rows:
+        # Newest comment returned; pass it back as `since` to poll for new ones.
+        response.headers["X-Last-Cursor"] = comment_crud.encode_cursor(rows[-1])
+    return rows_response((row._mapping for row in rows), response, selected)
 
 @router.post("/issues/{issue_id}/comments", response_model=CommentOut)
-def add_comment(issue_id: int, data: CommentCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+async def add_comment(issue_id: int, data: CommentCreate, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    issue = await issue_crud.get_issue_version(db, issue_id)
     if not issue:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
-    member = db.query(ProjectMember).filter(ProjectMember.project_id == issue.project_id, ProjectMember.user_id == current_user.id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail={"error": {"code": "forbidden", "message": "Project membership required"}})
-    return comment_crud.create_comment(db, issue_id, current_user.id, data.body)
+    await require_membership(db, issue.project_id, current_user.id)
+    author_name = await comment_crud.get_author_name(db, current_user.id)
+    comment = await comment_crud.create_comment(db, issue.project_id, issue_id, current_user.id, data.body, author_name)
+    return CommentOut.model_validate(comment).model_copy(update={"author_name": author_name})
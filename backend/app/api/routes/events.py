@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import Principal, get_db, get_current_principal
+from app.api.authz import require_membership
+from app.api.events import sse_response
+from app.crud import issue as issue_crud
+
+router = APIRouter()
+
+
+@router.get("/projects/{project_id}/events")
+async def project_events(
+    project_id: int,
+    last_event_id: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    # Membership is checked once here; the stream itself does not touch the database.
+    await require_membership(db, project_id, current_user.id)
+    return sse_response(("project", project_id), last_event_id)
+
+
+@router.get("/issues/{issue_id}/events")
+async def issue_events(
+    issue_id: int,
+    last_event_id: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    issue = await issue_crud.get_issue_version(db, issue_id)
+    if not issue:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
+    await require_membership(db, issue.project_id, current_user.id)
+    return sse_response(("issue", issue_id), last_event_id)
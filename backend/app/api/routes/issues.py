@@ -1,26 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import io
+import tempfile
 
-from app.api.deps import get_db, get_current_user
-from app.schemas.issue import IssueCreate, IssueOut, IssueUpdate
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.api.deps import Principal, get_db, get_current_principal, get_session_factory
+from app.api.authz import filter_members, get_role, require_membership
+from app.schemas.activity import IssueActivityOut
+from app.schemas.issue import (
+    MAX_BULK_ISSUES,
+    IssueBulkCreate,
+    IssueBulkCreateResult,
+    IssueBulkItemResult,
+    IssueBulkUpdate,
+    IssueBulkUpdateResult,
+    IssueCreate,
+    IssueFacets,
+    IssueImportResult,
+    IssueOut,
+    IssueUpdate,
+)
+from app.crud import activity as activity_crud
+from app.crud import facets as facet_crud
 from app.crud import issue as issue_crud
-from app.models.project_member import ProjectMember
-from app.models.issue import Issue
-from app.models.user import User
+from app.crud import issue_import
+from app.crud import project as project_crud
+from app.models.issue import Issue
 from app.api.errors import api_error
+from app.api.etag import make_etag, matches, not_modified
+from app.api.fields import parse_fields
+from app.api.responses import rows_response
+from app.api import export
+from app.core.config import settings
 
 router = APIRouter()
 
 
-def require_membership(db: Session, project_id: int, user_id: int):
-    member = db.query(ProjectMember).filter(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id).first()
-    if not member:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail={"error": {"code": "forbidden", "message": "Project membership required"}})
-    return member
-
 @router.get("/projects/{project_id}/issues", response_model=list[IssueOut])
-def list_issues(
+async def list_issues(
     project_id: int,
+    request: Request,
+    response: Response,
     q: str | None = None,
     status: str | None = None,
     priority: str | None = None,
@@ -28,37 +51,229 @@ def list_issues(
     sort: str | None = Query(default=None),
     limit: int | None = Query(default=20, ge=1, le=100),
     offset: int | None = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: str | None = None,
+    fields: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    require_membership(db, project_id, current_user.id)
-    return issue_crud.list_project_issues(db, project_id, q, status, priority, assignee, sort, limit, offset)
+    selected = parse_fields(fields, IssueOut.model_fields)
+    await require_membership(db, project_id, current_user.id)
+    version = await project_crud.get_version(db, project_id)
+    etag = make_etag("issues", project_id, version, sorted(request.query_params.multi_items()))
+    if matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    try:
+        issues, next_cursor = await issue_crud.list_project_issues_page(db, project_id, q, status, priority, assignee, sort, limit, offset, cursor, selected)
+    except issue_crud.InvalidCursor as exc:
+        raise api_error(400, "invalid_cursor", str(exc))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return rows_response(issues, response, selected)
+
+@router.get("/projects/{project_id}/issues/export")
+async def export_issues(
+    project_id: int,
+    export_format: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    q: str | None = None,
+    status: str | None = None,
+    priority: str | None = None,
+    assignee: int | None = None,
+    include_comments: bool = False,
+    db: AsyncSession = Depends(get_db),
+    session_factory=Depends(get_session_factory),
+    current_user: Principal = Depends(get_current_principal),
+):
+    await require_membership(db, project_id, current_user.id)
+
+    # The request session is closed before the body streams, so the export opens its own.
+    async def batches():
+        export_db = session_factory(readonly=True)
+        try:
+            async for batch in issue_crud.stream_project_issues(
+                export_db, project_id, q, status, priority, assignee, settings.EXPORT_BATCH_SIZE, include_comments
+            ):
+                yield batch
+        finally:
+            await export_db.close()
+
+    return StreamingResponse(
+        export.encode(export_format, batches(), include_comments),
+        media_type=export.MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-issues.{export_format}"'},
+    )
+
+@router.post("/projects/{project_id}/issues/import", response_model=IssueImportResult)
+async def import_issues(
+    project_id: int,
+    request: Request,
+    import_format: str = Query(default="ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    dry_run: bool = False,
+    skip: int = Query(default=0, ge=0),
+    batch_size: int = Query(default=settings.IMPORT_BATCH_SIZE, ge=1, le=10000),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    member = await require_membership(db, project_id, current_user.id)
+    if member.role != "maintainer":
+        raise api_error(status.HTTP_403_FORBIDDEN, "forbidden", "Only maintainers can import issues")
+
+    # Spool the upload so large bodies go to disk instead of memory, then read it record by record.
+    # Past IMPORT_SPOOL_MAX_BYTES the spool is a real file, so its writes run in the threadpool.
+    with tempfile.SpooledTemporaryFile(max_size=settings.IMPORT_SPOOL_MAX_BYTES) as spool:
+        async for chunk in request.stream():
+            await run_in_threadpool(spool.write, chunk)
+        spool.seek(0)
+        text = io.TextIOWrapper(spool, encoding="utf-8-sig", newline="")
+        importer = issue_import.IssueImporter(db, project_id, batch_size, dry_run)
+        try:
+            return await importer.run(issue_import.read_records(text, import_format), skip)
+        except issue_import.UnreadableInput as exc:
+            committed = exc.result.committed_records
+            raise api_error(
+                status.HTTP_400_BAD_REQUEST,
+                "invalid_import_file",
+                f"Input could not be read after {committed} committed records: {exc}",
+                exc.result.model_dump(),
+            )
+        except issue_import.ImportFailed as exc:
+            committed = exc.result.committed_records
+            raise api_error(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "import_failed",
+                f"Import stopped after {committed} records: {exc}; retry with skip={committed} to resume",
+                exc.result.model_dump(),
+            )
+
+@router.get("/projects/{project_id}/issues/facets", response_model=IssueFacets)
+async def get_issue_facets(project_id: int, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    await require_membership(db, project_id, current_user.id)
+    return await facet_crud.get_facet_counts(db, project_id)
 
 @router.post("/projects/{project_id}/issues", response_model=IssueOut)
-def create_issue(project_id: int, data: IssueCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    member = require_membership(db, project_id, current_user.id)
+async def create_issue(project_id: int, data: IssueCreate, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    member = await require_membership(db, project_id, current_user.id)
     if member.role != "maintainer":
         raise api_error(status.HTTP_403_FORBIDDEN, "forbidden", "Only maintainers can create issues")
     if data.assignee_id is not None:
-        assignee_member = db.query(ProjectMember).filter(ProjectMember.project_id == project_id, ProjectMember.user_id == data.assignee_id).first()
-        if not assignee_member:
+        if await get_role(db, project_id, data.assignee_id) is None:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"error": {"code": "invalid_assignee", "message": "Assignee must be a project member"}})
-    return issue_crud.create_issue(db, project_id, data.title, data.description, data.priority, current_user.id, data.assignee_id)
+    return await issue_crud.create_issue(db, project_id, data.title, data.description, data.priority, current_user.id, data.assignee_id)
+
+@router.post("/projects/{project_id}/issues/bulk", response_model=IssueBulkCreateResult)
+async def create_issues_bulk(project_id: int, data: IssueBulkCreate, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    member = await require_membership(db, project_id, current_user.id)
+    if member.role != "maintainer":
+        raise api_error(status.HTTP_403_FORBIDDEN, "forbidden", "Only maintainers can create issues")
+
+    assignee_ids = {item.assignee_id for item in data.issues if item.assignee_id is not None}
+    valid_assignees = await filter_members(db, project_id, assignee_ids)
+
+    results: list[IssueBulkItemResult | None] = [None] * len(data.issues)
+    accepted: list[tuple[int, dict]] = []
+    for index, item in enumerate(data.issues):
+        if item.assignee_id is not None and item.assignee_id not in valid_assignees:
+            results[index] = IssueBulkItemResult(
+                index=index,
+                ok=False,
+                error={"code": "invalid_assignee", "message": "Assignee must be a project member"},
+            )
+        else:
+            accepted.append((index, item.model_dump()))
+
+    created = await issue_crud.create_issues_bulk(db, project_id, current_user.id, [item for _, item in accepted]) if accepted else []
+    for (index, _), issue in zip(accepted, created):
+        results[index] = IssueBulkItemResult(index=index, ok=True, issue=IssueOut.model_validate(issue))
+    return IssueBulkCreateResult(created=len(created), results=results)
+
+@router.patch("/issues/bulk", response_model=IssueBulkUpdateResult)
+async def update_issues_bulk(data: IssueBulkUpdate, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    changes = data.patch.model_dump(exclude_unset=True)
+    needs_maintainer = "status" in changes or "assignee_id" in changes
+
+    if data.filter is not None:
+        member = await require_membership(db, data.project_id, current_user.id)
+        if needs_maintainer and member.role != "maintainer":
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail={"error": {"code": "forbidden", "message": "Maintainer role required to change status or assignee"}})
+        f = data.filter
+        matching = issue_crud.filter_project_issues(db, data.project_id, f.q, f.status, f.priority, f.assignee)
+        criteria = Issue.id.in_(matching.with_only_columns(Issue.id))
+        if member.role != "maintainer":
+            criteria = and_(criteria, Issue.reporter_id == current_user.id)
+        try:
+            updated = await issue_crud.bulk_update_issues(db, criteria, changes, current_user.id, MAX_BULK_ISSUES)
+        except issue_crud.TooManyIssues as exc:
+            raise api_error(status.HTTP_422_UNPROCESSABLE_ENTITY, "too_many_issues", str(exc))
+        return IssueBulkUpdateResult(updated=updated)
+
+    requested = set(data.ids)
+    rows = (await db.execute(select(Issue.id, Issue.project_id, Issue.reporter_id).where(Issue.id.in_(requested)))).all()
+    by_project: dict[int, list] = {}
+    for row in rows:
+        by_project.setdefault(row.project_id, []).append(row)
+
+    forbidden: list[int] = []
+    allowed_clauses = []
+    for project_id, project_rows in by_project.items():
+        role = await get_role(db, project_id, current_user.id)
+        if role == "maintainer":
+            allowed_clauses.append(and_(Issue.project_id == project_id, Issue.id.in_([r.id for r in project_rows])))
+            continue
+        if role is None or needs_maintainer:
+            forbidden.extend(r.id for r in project_rows)
+            continue
+        own = [r.id for r in project_rows if r.reporter_id == current_user.id]
+        forbidden.extend(r.id for r in project_rows if r.reporter_id != current_user.id)
+        if own:
+            allowed_clauses.append(and_(Issue.project_id == project_id, Issue.id.in_(own), Issue.reporter_id == current_user.id))
+
+    updated = await issue_crud.bulk_update_issues(db, or_(*allowed_clauses), changes, current_user.id) if allowed_clauses else []
+    return IssueBulkUpdateResult(
+        updated=updated,
+        forbidden=sorted(forbidden),
+        not_found=sorted(requested - {row.id for row in rows}),
+    )
 
 @router.get("/issues/{issue_id}", response_model=IssueOut)
-def get_issue(issue_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+async def get_issue(issue_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    version = await issue_crud.get_issue_version(db, issue_id)
+    if not version:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
+    project_id, updated_at = version
+    await require_membership(db, project_id, current_user.id)
+    etag = make_etag("issue", issue_id, updated_at.isoformat())
+    if matches(request, etag):
+        return not_modified(etag)
+    issue = await issue_crud.get_issue(db, issue_id)
     if not issue:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
-    require_membership(db, issue.project_id, current_user.id)
+    response.headers["ETag"] = make_etag("issue", issue_id, issue.updated_at.isoformat())
     return issue
 
+@router.get("/issues/{issue_id}/activity", response_model=list[IssueActivityOut])
+async def list_issue_activity(
+    issue_id: int,
+    response: Response,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: int | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
+):
+    issue = await issue_crud.get_issue_version(db, issue_id)
+    if not issue:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
+    await require_membership(db, issue.project_id, current_user.id)
+    rows, next_cursor = await activity_crud.list_issue_activity(db, issue_id, limit, cursor)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return rows_response((row._mapping for row in rows), response)
+
 @router.patch("/issues/{issue_id}", response_model=IssueOut)
-def update_issue(issue_id: int, data: IssueUpdate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+async def update_issue(issue_id: int, data: IssueUpdate, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    issue = await issue_crud.get_issue(db, issue_id)
     if not issue:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
-    member = require_membership(db, issue.project_id, current_user.id)
+    member = await require_membership(db, issue.project_id, current_user.id)
     is_reporter = issue.reporter_id == current_user.id
     is_maintainer = member.role == "maintainer"
 
@@ -68,26 +283,17 @@ def update_issue(issue_id: int, data: IssueUpdate, db: Session = Depends(get_db)
     if not is_reporter and not is_maintainer:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail={"error": {"code": "forbidden", "message": "Only reporter or maintainer can update"}})
 
-    for field, value in data.model_dump(exclude_unset=True).items():
-        setattr(issue, field, value)
-    if data.model_dump(exclude_unset=True):
-        from datetime import datetime
-        issue.updated_at = datetime.utcnow()
-
-    db.commit()
-    db.refresh(issue)
-    return issue
+    return await issue_crud.update_issue(db, issue, data.model_dump(exclude_unset=True), current_user.id)
 
 @router.delete("/issues/{issue_id}")
-def delete_issue(issue_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    issue = db.query(Issue).filter(Issue.id == issue_id).first()
+async def delete_issue(issue_id: int, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    issue = await issue_crud.get_issue(db, issue_id)
     if not issue:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail={"error": {"code": "not_found", "message": "Issue not found"}})
-    member = require_membership(db, issue.project_id, current_user.id)
+    member = await require_membership(db, issue.project_id, current_user.id)
     is_reporter = issue.reporter_id == current_user.id
     is_maintainer = member.role == "maintainer"
     if not is_reporter and not is_maintainer:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail={"error": {"code": "forbidden", "message": "Only reporter or maintainer can delete"}})
-    db.delete(issue)
-    db.commit()
+    await issue_crud.delete_issue(db, issue_id)
     return {"ok": True}
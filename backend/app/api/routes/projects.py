@@ -1,92 +1,87 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response, status
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
-from app.api.deps import get_db, get_current_user
+from app.api.deps import Principal, get_db, get_current_principal, release_connection
+from app.api.authz import invalidate_membership, require_maintainer, require_membership
 from app.schemas.project import (
     ProjectCreate,
     ProjectOut,
+    ProjectStats,
     ProjectMemberAdd,
     ProjectMemberOut,
     ProjectMemberOnboard,
     ProjectMemberUpdate,
 )
 from app.crud import project as project_crud
+from app.crud.stats import get_project_stats, invalidate_project_stats
 from app.models.project_member import ProjectMember
 from app.models.user import User
 from app.api.errors import api_error
-from app.core.security import get_password_hash
+from app.api.etag import make_etag, matches, not_modified
+from app.api.responses import rows_response
+from app.core.security import get_password_hash_async
 
 router = APIRouter()
 
 
-def get_membership_or_403(db: Session, project_id: int, user_id: int) -> ProjectMember:
-    member = (
-        db.query(ProjectMember)
-        .filter(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
-        .first()
-    )
-    if not member:
-        raise api_error(status.HTTP_403_FORBIDDEN, "forbidden", "Project membership required")
-    return member
-
-
-def require_maintainer(db: Session, project_id: int, user_id: int) -> ProjectMember:
-    member = get_membership_or_403(db, project_id, user_id)
-    if member.role != "maintainer":
-        raise api_error(status.HTTP_403_FORBIDDEN, "forbidden", "Maintainer role required")
-    return member
-
 @router.post("", response_model=ProjectOut)
-def create_project(data: ProjectCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    memberships = db.query(ProjectMember).filter(ProjectMember.user_id == current_user.id).all()
-    if memberships and all(m.role != "maintainer" for m in memberships):
+async def create_project(data: ProjectCreate, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    roles = await project_crud.get_user_roles(db, current_user.id)
+    if roles and "maintainer" not in roles:
         raise api_error(
             status.HTTP_403_FORBIDDEN,
             "forbidden",
             "Only maintainers can create projects",
         )
     try:
-        project = project_crud.create_project(db, data.name, data.key, data.description, current_user.id)
+        project = await project_crud.create_project(db, data.name, data.key, data.description, current_user.id)
+        invalidate_membership(project.id)
         return project
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         raise api_error(status.HTTP_400_BAD_REQUEST, "project_key_taken", "Project key already exists")
 
 @router.get("", response_model=list[ProjectOut])
-def list_projects(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return project_crud.list_user_projects(db, current_user.id)
+async def list_projects(db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    return await project_crud.list_user_projects(db, current_user.id)
 
 @router.get("/maintained", response_model=list[ProjectOut])
-def list_maintained_projects(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return project_crud.list_maintained_projects(db, current_user.id)
+async def list_maintained_projects(db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    return await project_crud.list_maintained_projects(db, current_user.id)
 
 @router.post("/{project_id}/members")
-def add_member(project_id: int, data: ProjectMemberAdd, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    require_maintainer(db, project_id, current_user.id)
-    user = db.query(User).filter(User.email == data.email).first()
+async def add_member(project_id: int, data: ProjectMemberAdd, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    await require_maintainer(db, project_id, current_user.id)
+    user = await db.scalar(select(User).where(User.email == data.email))
     if not user:
         raise api_error(status.HTTP_404_NOT_FOUND, "user_not_found", "User not found")
-    existing = db.query(ProjectMember).filter(ProjectMember.project_id == project_id, ProjectMember.user_id == user.id).first()
+    existing = await db.get(ProjectMember, (project_id, user.id))
     if existing:
         existing.role = data.role
-        db.commit()
+        await project_crud.bump_version(db, project_id)
+        await db.commit()
+        invalidate_membership(project_id, user.id)
         return {"ok": True}
     new_member = ProjectMember(project_id=project_id, user_id=user.id, role=data.role)
     db.add(new_member)
-    db.commit()
+    await project_crud.bump_version(db, project_id)
+    await db.commit()
+    invalidate_membership(project_id, user.id)
+    invalidate_project_stats(project_id)
     return {"ok": True}
 
 
 @router.post("/{project_id}/members/onboard")
-def onboard_member(
+async def onboard_member(
     project_id: int,
     data: ProjectMemberOnboard,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    require_maintainer(db, project_id, current_user.id)
-    existing_user = db.query(User).filter(User.email == data.email).first()
+    await require_maintainer(db, project_id, current_user.id)
+    existing_user = await db.scalar(select(User).where(User.email == data.email))
     if existing_user:
         raise api_error(
             status.HTTP_400_BAD_REQUEST,
@@ -94,78 +89,92 @@ def onboard_member(
             "User already exists. Use invite by email for existing users.",
         )
 
-    user = User(name=data.name, email=data.email, password_hash=get_password_hash(data.password))
+    await release_connection(db)
+    user = User(name=data.name, email=data.email, password_hash=await get_password_hash_async(data.password))
     db.add(user)
-    db.flush()
+    await db.flush()
     db.add(ProjectMember(project_id=project_id, user_id=user.id, role=data.role))
-    db.commit()
+    await project_crud.bump_version(db, project_id)
+    await db.commit()
+    invalidate_membership(project_id, user.id)
+    invalidate_project_stats(project_id)
     return {"ok": True, "user_id": user.id}
 
+@router.get("/{project_id}/stats", response_model=ProjectStats)
+async def project_stats(project_id: int, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    await require_membership(db, project_id, current_user.id)
+    return await get_project_stats(db, project_id)
+
 @router.get("/{project_id}/members", response_model=list[ProjectMemberOut])
-def list_members(project_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    get_membership_or_403(db, project_id, current_user.id)
+async def list_members(project_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db), current_user: Principal = Depends(get_current_principal)):
+    await require_membership(db, project_id, current_user.id)
+    etag = make_etag("members", project_id, await project_crud.get_version(db, project_id))
+    if matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
     rows = (
-        db.query(ProjectMember, User)
-        .join(User, User.id == ProjectMember.user_id)
-        .filter(ProjectMember.project_id == project_id)
-        .all()
-    )
-    return [
-        ProjectMemberOut(user_id=u.id, name=u.name, email=u.email, role=pm.role)
-        for pm, u in rows
-    ]
+        await db.execute(
+            select(ProjectMember.user_id, User.name, User.email, ProjectMember.role)
+            .join(User, User.id == ProjectMember.user_id)
+            .where(ProjectMember.project_id == project_id)
+        )
+    ).all()
+    return rows_response((row._mapping for row in rows), response)
 
 
 @router.patch("/{project_id}/members/{user_id}")
-def update_member_role(
+async def update_member_role(
     project_id: int,
     user_id: int,
     data: ProjectMemberUpdate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    require_maintainer(db, project_id, current_user.id)
-    member = (
-        db.query(ProjectMember)
-        .filter(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
-        .first()
-    )
+    await require_maintainer(db, project_id, current_user.id)
+    member = await db.get(ProjectMember, (project_id, user_id))
     if not member:
         raise api_error(status.HTTP_404_NOT_FOUND, "member_not_found", "Project member not found")
     member.role = data.role
-    db.commit()
+    await project_crud.bump_version(db, project_id)
+    await db.commit()
+    invalidate_membership(project_id, user_id)
     return {"ok": True}
 
 
 @router.delete("/{project_id}/members/{user_id}")
-def remove_member(
+async def remove_member(
     project_id: int,
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_principal),
 ):
-    require_maintainer(db, project_id, current_user.id)
-    member = (
-        db.query(ProjectMember)
-        .filter(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
-        .first()
+    await require_maintainer(db, project_id, current_user.id)
+    maintainers = (
+        select(func.count())
+        .where(ProjectMember.project_id == project_id, ProjectMember.role == "maintainer")
+        .scalar_subquery()
     )
+    member = (
+        await db.execute(
+            select(ProjectMember.role, maintainers.label("maintainers"))
+            .where(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
+        )
+    ).first()
     if not member:
         raise api_error(status.HTTP_404_NOT_FOUND, "member_not_found", "Project member not found")
 
-    if member.role == "maintainer":
-        maintainers_count = (
-            db.query(ProjectMember)
-            .filter(ProjectMember.project_id == project_id, ProjectMember.role == "maintainer")
-            .count()
+    if member.role == "maintainer" and member.maintainers <= 1:
+        raise api_error(
+            status.HTTP_400_BAD_REQUEST,
+            "last_maintainer",
+            "Cannot remove the last maintainer from a project",
         )
-        if maintainers_count <= 1:
-            raise api_error(
-                status.HTTP_400_BAD_REQUEST,
-                "last_maintainer",
-                "Cannot remove the last maintainer from a project",
-            )
-
-    db.delete(member)
-    db.commit()
+
+    await db.execute(
+        delete(ProjectMember).where(ProjectMember.project_id == project_id, ProjectMember.user_id == user_id)
+    )
+    await project_crud.bump_version(db, project_id)
+    await db.commit()
+    invalidate_membership(project_id, user_id)
+    invalidate_project_stats(project_id)
     return {"ok": True}
@@ -5,5 +5,5 @@ from app.schemas.user import UserOut
 router = APIRouter()
 
 @router.get("/me", response_model=UserOut)
-def me(current_user = Depends(get_current_user)):
+async def me(current_user = Depends(get_current_user)):
     return current_user
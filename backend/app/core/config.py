@@ -5,6 +5,47 @@ class Settings(BaseSettings):
     JWT_SECRET: str = "change_me"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    DB_ASYNC: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    SQLITE_PROFILE: str = "default"
+    SQLITE_READ_POOL_SIZE: int = 8
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_CACHE_SIZE: int = -65536
+    SEARCH_BACKEND: str = "auto"
+    MEMBERSHIP_CACHE_SIZE: int = 10000
+    MEMBERSHIP_CACHE_TTL_SECONDS: float = 30.0
+    PROJECT_STATS_CACHE_SIZE: int = 1000
+    PROJECT_STATS_CACHE_TTL_SECONDS: float = 60.0
+    EXPORT_BATCH_SIZE: int = 1000
+    IMPORT_BATCH_SIZE: int = 2000
+    IMPORT_EMAIL_CACHE_SIZE: int = 100000
+    IMPORT_SPOOL_MAX_BYTES: int = 8 * 1024 * 1024
+    METRICS_ENABLED: bool = True
+    QUERY_BUDGET: int = 0
+    QUERY_BUDGET_OVERRIDES: dict[str, int] = {}
+    EVENTS_QUEUE_SIZE: int = 256
+    EVENTS_HISTORY_SIZE: int = 5000
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    ACTIVITY_WRITER: str = "async"
+    ACTIVITY_BATCH_SIZE: int = 500
+    ACTIVITY_FLUSH_INTERVAL_SECONDS: float = 0.5
+    ACTIVITY_MAX_PENDING: int = 50000
+    ADMISSION_ENABLED: bool = True
+    # Per route class: token refill rate (per second) and burst per caller, and requests in flight across callers.
+    ADMISSION_BUDGETS: dict[str, dict[str, float]] = {
+        "default": {"rate": 20, "burst": 40, "concurrency": 64},
+        "search": {"rate": 2, "burst": 10, "concurrency": 8},
+        "export": {"rate": 0.1, "burst": 2, "concurrency": 2},
+        "login": {"rate": 1, "burst": 10, "concurrency": 8},
+    }
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 0.5
+    ADMISSION_MAX_QUEUED: int = 64
+    ADMISSION_MAX_TRACKED_CALLERS: int = 100000
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,120 @@
+"""In-process pub/sub broker for live issue and comment change events.
+
+Subscribers listen on a topic, ``("project", id)`` or ``("issue", id)``, and
+get a bounded queue. Publishing never blocks: a subscriber whose queue is
+full is evicted and told so, and can reconnect with the last event id it
+saw to replay what it missed from the broker's recent history.
+
+Events live in this process only, so with several server workers a client
+sees the changes made through the worker it is connected to.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from typing import NamedTuple
+
+import orjson
+
+from app.core.config import settings
+
+Topic = tuple[str, int]
+
+
+class Event(NamedTuple):
+    id: str
+    seq: int
+    type: str
+    project_id: int
+    issue_id: int
+    data: bytes
+    # Bulk events cover several issues and reach each of their topics; issue_id is then 0.
+    issue_ids: tuple[int, ...] = ()
+
+    def topics(self) -> tuple[Topic, ...]:
+        if self.issue_ids:
+            return (("project", self.project_id), *(("issue", issue_id) for issue_id in self.issue_ids))
+        return ("project", self.project_id), ("issue", self.issue_id)
+
+
+class Subscription:
+    def __init__(self, topic: Topic, maxsize: int):
+        self.topic = topic
+        self.queue: asyncio.Queue[Event | None] = asyncio.Queue(maxsize)
+        self.evicted = False
+
+
+class EventBroker:
+    def __init__(self, queue_size: int, history_size: int):
+        self.queue_size = queue_size
+        # Ids are "<boot>-<seq>" so an id from before a restart is recognised as stale.
+        self.boot = str(int(time.time() * 1000))
+        self._seq = itertools.count(1)
+        self._history: deque[Event] = deque(maxlen=history_size)
+        self._subscribers: dict[Topic, set[Subscription]] = {}
+        self.published = 0
+        self.evictions = 0
+
+    def publish(self, type: str, project_id: int, issue_id: int, data: dict) -> Event:
+        seq = next(self._seq)
+        return self._deliver(Event(f"{self.boot}-{seq}", seq, type, project_id, issue_id, orjson.dumps(data)))
+
+    def publish_bulk(self, type: str, project_id: int, issue_ids: list[int], data: dict) -> Event:
+        """Publish one event for a change to many issues, so a bulk write costs each subscriber one queue slot."""
+        seq = next(self._seq)
+        return self._deliver(Event(f"{self.boot}-{seq}", seq, type, project_id, 0, orjson.dumps(data), tuple(issue_ids)))
+
+    def _deliver(self, event: Event) -> Event:
+        self._history.append(event)
+        self.published += 1
+        for topic in event.topics():
+            for subscription in list(self._subscribers.get(topic, ())):
+                try:
+                    subscription.queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    self._evict(subscription)
+        return event
+
+    def subscribe(self, topic: Topic) -> Subscription:
+        subscription = Subscription(topic, self.queue_size)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.topic)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.topic]
+
+    def _evict(self, subscription: Subscription) -> None:
+        self.unsubscribe(subscription)
+        subscription.evicted = True
+        self.evictions += 1
+        # Its backlog is replayable from history, so drop it to make room for the close marker.
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+    def replay(self, topic: Topic, last_event_id: str) -> list[Event] | None:
+        """Return ``topic``'s events after ``last_event_id``, or None if they are no longer all buffered."""
+        boot, _, seq = last_event_id.partition("-")
+        if boot != self.boot or not seq.isdigit():
+            return None
+        seq = int(seq)
+        if self._history and self._history[0].seq > seq + 1:
+            return None
+        return [event for event in self._history if event.seq > seq and topic in event.topics()]
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def clear(self) -> None:
+        self._history.clear()
+        self._subscribers.clear()
+        self.published = 0
+        self.evictions = 0
+
+
+broker = EventBroker(queue_size=settings.EVENTS_QUEUE_SIZE, history_size=settings.EVENTS_HISTORY_SIZE)
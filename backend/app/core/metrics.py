@@ -0,0 +1,212 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+Counters and histograms are plain dicts keyed by label tuples behind one
+lock, so recording a sample costs a dict lookup and a bisect. SQLAlchemy
+engine events count queries and their time into the current request's
+``RequestStats`` (a context variable set by the metrics middleware).
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labels, labels)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last one is +Inf), sum, count]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, *labels) -> int:
+        entry = self._values.get(labels)
+        return entry[2] if entry else 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, ([*counts], total, n)) for labels, (counts, total, n) in self._values.items())
+        for labels, (counts, total, n) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = _format_labels(self.labels, labels, f'le="{_format_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_number(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {n}")
+        return lines
+
+
+class Gauge:
+    """Gauge whose samples are read from ``collect()`` at render time."""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...], collect):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.collect = collect
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for labels, value in sorted(self.collect()):
+            lines.append(f"{self.name}{_format_labels(self.labels, labels)} {_format_number(value)}")
+        return lines
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    query_seconds: float = 0.0
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+http_requests = Counter("http_requests_total", "HTTP requests by route and status class.", ("method", "route", "status"))
+http_latency = Histogram("http_request_duration_seconds", "HTTP request latency by route.", ("method", "route"))
+db_queries = Counter("db_queries_total", "SQL statements executed.")
+db_query_seconds = Counter("db_query_seconds_total", "Time spent executing SQL statements.")
+db_request_queries = Histogram("db_queries_per_request", "SQL statements per HTTP request by route.", ("method", "route"), QUERY_COUNT_BUCKETS)
+db_request_seconds = Histogram("db_time_per_request_seconds", "Time spent in SQL per HTTP request by route.", ("method", "route"))
+db_pool_wait = Histogram("db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection.", ("pool",))
+
+_engines: dict[str, Engine] = {}
+
+
+def _collect_pool_stats():
+    for name, engine in list(_engines.items()):
+        for stat in ("size", "checkedout", "checkedin", "overflow"):
+            reader = getattr(engine.pool, stat, None)
+            if reader is not None:
+                yield (name, stat), reader()
+
+
+db_pool = Gauge("db_pool_connections", "Connection pool state (size, checkedout, checkedin, overflow).", ("pool", "state"), _collect_pool_stats)
+
+REGISTRY = [http_requests, http_latency, db_queries, db_query_seconds, db_request_queries, db_request_seconds, db_pool_wait, db_pool]
+
+
+def register(metric) -> None:
+    """Add a metric defined elsewhere to the ``/metrics`` output."""
+    REGISTRY.append(metric)
+
+
+def render() -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    for metric in REGISTRY:
+        if hasattr(metric, "clear"):
+            metric.clear()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    context._metrics_start = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - context._metrics_start
+    db_queries.inc()
+    db_query_seconds.inc(amount=elapsed)
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+
+
+def _time_checkouts(pool, name: str) -> None:
+    connect = pool.connect
+
+    def timed_connect():
+        start = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            db_pool_wait.observe(time.perf_counter() - start, name)
+
+    pool.connect = timed_connect
+
+
+def instrument_pool(engine: Engine, name: str) -> None:
+    """Time checkouts from ``engine``'s pool and report its size under ``name``."""
+    if name in _engines:
+        return
+    _engines[name] = engine
+    _time_checkouts(engine.pool, name)
+    # dispose() swaps in a fresh pool, which needs wrapping again.
+    event.listen(engine, "engine_disposed", lambda disposed: _time_checkouts(disposed.pool, name))
@@ -0,0 +1,180 @@
+"""Issue activity history and the background writer that batches it into the database.
+
+``record_activity`` hands rows to ``activity_writer`` so the PATCH path only
+appends to a list; the writer inserts them in batches shortly afterwards and
+flushes whatever is left when the app shuts down. With
+``ACTIVITY_WRITER=sync`` (or when the writer is not running or is backed
+up) rows are inserted inline before the request returns.
+"""
+
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import new_session
+from app.models.issue_activity import IssueActivity
+
+TRACKED_FIELDS = ("status", "priority", "assignee_id")
+
+logger = logging.getLogger("app.activity")
+
+
+def _text(value) -> str | None:
+    return None if value is None else str(value)
+
+
+def change_rows(issue_id: int, project_id: int, actor_id: int | None, before, changes: dict, at: datetime | None = None) -> list[dict]:
+    """Activity rows for the tracked fields ``changes`` actually alters on an issue whose prior state is ``before``."""
+    at = at or datetime.utcnow()
+    return [
+        {
+            "issue_id": issue_id,
+            "project_id": project_id,
+            "actor_id": actor_id,
+            "field": field,
+            "old_value": _text(getattr(before, field)),
+            "new_value": _text(changes[field]),
+            "created_at": at,
+        }
+        for field in TRACKED_FIELDS
+        if field in changes and changes[field] != getattr(before, field)
+    ]
+
+
+async def insert_activity(db: AsyncSession, rows: list[dict]) -> None:
+    await db.execute(insert(IssueActivity.__table__), rows)
+
+
+async def record_activity(db: AsyncSession, rows: list[dict]) -> None:
+    """Record rows for a change that has already been committed."""
+    if not rows:
+        return
+    if settings.ACTIVITY_WRITER == "async" and activity_writer.submit(rows):
+        return
+    await insert_activity(db, rows)
+    await db.commit()
+
+
+async def delete_issue_activity(db: AsyncSession, issue_id: int) -> None:
+    """Drop an issue's history, queued rows included; does not commit.
+
+    SQLite reuses the rowid of a deleted last issue, so history left behind
+    would show up on the next issue created.
+    """
+    activity_writer.discard(issue_id)
+    await db.execute(delete(IssueActivity).where(IssueActivity.issue_id == issue_id))
+
+
+async def list_issue_activity(db: AsyncSession, issue_id: int, limit: int, after: int | None = None):
+    """Return ``(rows, next_cursor)`` oldest first; the cursor is the last row's id."""
+    query = (
+        select(
+            IssueActivity.id,
+            IssueActivity.issue_id,
+            IssueActivity.actor_id,
+            IssueActivity.field,
+            IssueActivity.old_value,
+            IssueActivity.new_value,
+            IssueActivity.created_at,
+        )
+        .where(IssueActivity.issue_id == issue_id)
+        .order_by(IssueActivity.id)
+        .limit(limit + 1)
+    )
+    if after is not None:
+        query = query.where(IssueActivity.id > after)
+    rows = (await db.execute(query)).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, str(rows[-1].id)
+
+
+class ActivityWriter:
+    """Collect activity rows in memory and insert them in batches from a background task."""
+
+    def __init__(self, batch_size: int, flush_interval: float, max_pending: int, session_factory=new_session):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.session_factory = session_factory
+        self.written = 0
+        self._pending: list[dict] = []
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    def submit(self, rows: list[dict]) -> bool:
+        """Queue ``rows``; False if the writer is not running or already holds ``max_pending`` rows."""
+        if self._task is None or len(self._pending) >= self.max_pending:
+            return False
+        self._pending.extend(rows)
+        self._wake.set()
+        return True
+
+    def discard(self, issue_id: int) -> None:
+        """Drop queued rows for a deleted issue."""
+        self._pending = [row for row in self._pending if row["issue_id"] != issue_id]
+
+    async def flush(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+            try:
+                db = self.session_factory()
+                try:
+                    await insert_activity(db, batch)
+                    await db.commit()
+                finally:
+                    await db.close()
+            except BaseException:
+                # Keep the rows (including on cancellation) so the next flush retries them.
+                self._pending[:0] = batch
+                raise
+            self.written += len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if len(self._pending) < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("activity flush failed; %d rows pending, retrying", len(self._pending))
+                await asyncio.sleep(self.flush_interval)
+                self._wake.set()
+
+    async def stop(self) -> None:
+        """Stop the background task and write out everything still pending."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("activity flush on shutdown failed; %d rows lost", len(self._pending))
+            self._pending.clear()
+
+
+activity_writer = ActivityWriter(
+    batch_size=settings.ACTIVITY_BATCH_SIZE,
+    flush_interval=settings.ACTIVITY_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.ACTIVITY_MAX_PENDING,
+)
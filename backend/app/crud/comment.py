@@ -1,10 +1,102 @@
-from sqlalchemy.orm import Session
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, func, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.events import broker
 from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.user import User
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(comment: Comment) -> str:
+    raw = json.dumps({"k": comment.created_at.isoformat(), "id": comment.id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["k"]), int(data["id"])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor("Malformed cursor")
+
+
+COMMENT_COLUMNS = (Comment.id, Comment.issue_id, Comment.author_id, Comment.body, Comment.created_at)
 
 
-def create_comment(db: Session, issue_id: int, author_id: int, body: str) -> Comment:
+async def list_issue_comments(db: AsyncSession, issue_id: int, limit: int | None = None, after: str | None = None, fields: tuple[str, ...] | None = None):
+    """Return ``(rows, next_cursor)`` in (created_at, id) order; rows match CommentOut.
+
+    ``after`` seeks past the comment a cursor points at, so it serves both
+    paging forward and polling for comments newer than the last one seen.
+    With ``fields`` only those columns are read, plus the id and created_at
+    the cursor needs; the users join is skipped unless author_name is wanted.
+    """
+    if fields is None:
+        columns = COMMENT_COLUMNS
+    else:
+        needed = {*fields, "id", "created_at"}
+        columns = tuple(column for column in COMMENT_COLUMNS if column.key in needed)
+    query = select(*columns).where(Comment.issue_id == issue_id)
+    if fields is None or "author_name" in fields:
+        query = query.add_columns(User.name.label("author_name")).join(User, User.id == Comment.author_id)
+    if after:
+        last_created, last_id = decode_cursor(after)
+        query = query.where(
+            or_(
+                Comment.created_at > last_created,
+                and_(Comment.created_at == last_created, Comment.id > last_id),
+            )
+        )
+    query = query.order_by(Comment.created_at, Comment.id)
+    if limit:
+        # One extra row tells whether another page exists without a trailing empty fetch.
+        query = query.limit(limit + 1)
+    rows = (await db.execute(query)).all()
+    if not limit or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1])
+
+
+async def get_thread_state(db: AsyncSession, issue_id: int):
+    """Return ``(project_id, max comment id, comment count)`` for an issue in one query, or None.
+
+    Comments are append-only, so the last two change on every new comment.
+    """
+    thread = (
+        select(func.max(Comment.id).label("last_id"), func.count().label("count"))
+        .where(Comment.issue_id == issue_id)
+        .subquery()
+    )
+    return (
+        await db.execute(
+            select(Issue.project_id, thread.c.last_id, thread.c.count).join(thread, true()).where(Issue.id == issue_id)
+        )
+    ).first()
+
+
+async def create_comment(db: AsyncSession, project_id: int, issue_id: int, author_id: int, body: str, author_name: str | None = None) -> Comment:
     comment = Comment(issue_id=issue_id, author_id=author_id, body=body)
     db.add(comment)
-    db.commit()
-    db.refresh(comment)
+    await db.commit()
+    broker.publish("comment.created", project_id, issue_id, {
+        "id": comment.id,
+        "issue_id": issue_id,
+        "author_id": author_id,
+        "author_name": author_name,
+        "body": body,
+        "created_at": comment.created_at,
+    })
     return comment
+
+
+async def get_author_name(db: AsyncSession, author_id: int) -> str | None:
+    return await db.scalar(select(User.name).where(User.id == author_id))
@@ -1,42 +1,350 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, case
-from app.models.issue import Issue
+import base64
+import json
+from datetime import datetime
+from types import SimpleNamespace
 
-PRIORITY_ORDER = {"low": 1, "medium": 2, "high": 3, "critical": 4}
-STATUS_ORDER = {"open": 1, "in_progress": 2, "resolved": 3, "closed": 4}
+from sqlalchemy import or_, and_, insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from app.models.comment import Comment
+from app.models.issue import PRIORITY_ORDER, STATUS_ORDER, Issue
+from app.schemas.issue import IssueOut
+from app.db.search import get_search_backend
+from app.crud.facets import adjust_facet_counts, issue_deltas
+from app.crud.project import bump_version
+from app.crud.stats import invalidate_project_stats
+from app.crud.activity import change_rows, delete_issue_activity, record_activity
+from app.core.events import broker
 
+# Listing reads only the columns IssueOut exposes, as plain rows rather than ORM objects.
+ISSUE_COLUMNS = tuple(Issue.__table__.c[name] for name in IssueOut.model_fields)
 
-def list_project_issues(db: Session, project_id: int, q: str | None, status: str | None, priority: str | None, assignee: int | None, sort: str | None, limit: int | None, offset: int | None):
-    query = db.query(Issue).filter(Issue.project_id == project_id)
+
+def _listing_columns(fields: tuple[str, ...] | None, mode: str) -> tuple:
+    """Columns for ``fields`` plus the id and sort key the keyset cursor needs."""
+    if fields is None:
+        return ISSUE_COLUMNS
+    needed = {*fields, "id"}
+    if mode != "relevance":
+        needed.add(mode)
+    return tuple(column for column in ISSUE_COLUMNS if column.key in needed)
+
+
+def issue_payload(issue) -> dict:
+    return {column.key: getattr(issue, column.key) for column in ISSUE_COLUMNS}
+
+
+def publish_bulk(type: str, rows, **extra) -> None:
+    """Publish one ``type`` event per project listing the ids of the committed ``rows``.
+
+    Bulk writes can touch thousands of issues; one event per issue would
+    overflow subscriber queues and push replayable history out. Clients
+    refetch the listed issues instead.
+    """
+    ids_by_project: dict[int, list[int]] = {}
+    for row in rows:
+        ids_by_project.setdefault(row.project_id, []).append(row.id)
+    for project_id, ids in ids_by_project.items():
+        ids.sort()
+        broker.publish_bulk(type, project_id, ids, {"project_id": project_id, "ids": ids, **extra})
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class TooManyIssues(ValueError):
+    pass
+
+
+def filter_project_issues(db: AsyncSession, project_id: int, q: str | None, status: str | None, priority: str | None, assignee: int | None):
+    query = select(Issue).where(Issue.project_id == project_id)
     if q:
-        query = query.filter(Issue.title.ilike(f"%{q}%"))
+        matches = get_search_backend(db).match(q)
+        query = query.join(matches, matches.c.issue_id == Issue.id)
     if status:
-        query = query.filter(Issue.status == status)
+        query = query.where(Issue.status == status)
     if priority:
-        query = query.filter(Issue.priority == priority)
+        query = query.where(Issue.priority == priority)
     if assignee is not None:
-        query = query.filter(Issue.assignee_id == assignee)
-
-    if sort == "created_at":
-        query = query.order_by(Issue.created_at.desc())
-    elif sort == "priority":
-        query = query.order_by(case(PRIORITY_ORDER, value=Issue.priority))
-    elif sort == "status":
-        query = query.order_by(case(STATUS_ORDER, value=Issue.status))
-    else:
-        query = query.order_by(Issue.created_at.desc())
+        query = query.where(Issue.assignee_id == assignee)
+    return query
+
+
+def _sort_mode(sort: str | None, q: str | None = None) -> str:
+    if sort in ("created_at", "priority", "status"):
+        return sort
+    if q and sort in (None, "relevance"):
+        return "relevance"
+    return "created_at"
+
+
+def _rank_column(mode: str):
+    """Return ``(value column, generated rank column, value -> rank)`` for a ranked sort mode."""
+    if mode == "priority":
+        return Issue.priority, Issue.priority_rank, PRIORITY_ORDER
+    return Issue.status, Issue.status_rank, STATUS_ORDER
+
+
+def encode_cursor(mode: str, key, issue_id: int) -> str:
+    if mode == "created_at":
+        key = key.isoformat()
+    raw = json.dumps({"s": mode, "k": key, "id": issue_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
 
-    if offset:
+
+def decode_cursor(cursor: str, mode: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if data["s"] != mode:
+            raise InvalidCursor("Cursor does not match sort order")
+        last_id = int(data["id"])
+        if mode == "created_at":
+            return datetime.fromisoformat(data["k"]), last_id
+        if mode == "relevance":
+            return float(data["k"]), last_id
+        return int(data["k"]), last_id
+    except InvalidCursor:
+        raise
+    except (ValueError, TypeError, KeyError):
+        raise InvalidCursor("Malformed cursor")
+
+
+def _apply_keyset(query, mode: str, cursor: str | None, matches=None):
+    """Order by (sort key, id) and, given a cursor, seek past the last row seen."""
+    if mode == "relevance":
+        if cursor:
+            last_score, last_id = decode_cursor(cursor, mode)
+            query = query.where(
+                or_(
+                    matches.c.score > last_score,
+                    and_(matches.c.score == last_score, Issue.id > last_id),
+                )
+            )
+        return query.order_by(matches.c.score, Issue.id)
+
+    if mode == "created_at":
+        if cursor:
+            last_created, last_id = decode_cursor(cursor, mode)
+            query = query.where(
+                or_(
+                    Issue.created_at < last_created,
+                    and_(Issue.created_at == last_created, Issue.id < last_id),
+                )
+            )
+        return query.order_by(Issue.created_at.desc(), Issue.id.desc())
+
+    _, rank, _ = _rank_column(mode)
+    # Both the order and the seek use the (project_id, <rank>, id) index, so no sort step is needed.
+    if cursor:
+        last_rank, last_id = decode_cursor(cursor, mode)
+        query = query.where(tuple_(rank, Issue.id) > tuple_(last_rank, last_id))
+    return query.order_by(rank, Issue.id)
+
+
+async def _fetch_keyed(db: AsyncSession, project_id: int, q: str | None, status: str | None, priority: str | None, assignee: int | None, sort: str | None, limit: int | None, offset: int | None, cursor: str | None, fields: tuple[str, ...] | None = None):
+    """Return ``(mode, [(issue_row, sort_key), ...])`` for one window of the listing.
+
+    Issues come back as dicts keyed by IssueOut field names. With ``fields``
+    only those columns are read, plus the id and sort key.
+    """
+    mode = _sort_mode(sort, q)
+    query = filter_project_issues(db, project_id, None, status, priority, assignee).with_only_columns(*_listing_columns(fields, mode))
+    matches = None
+    if q:
+        matches = get_search_backend(db).match(q)
+        query = query.join(matches, matches.c.issue_id == Issue.id)
+    query = _apply_keyset(query, mode, cursor, matches)
+    if mode == "relevance":
+        query = query.add_columns(matches.c.score)
+
+    if offset and not cursor:
         query = query.offset(offset)
     if limit:
         query = query.limit(limit)
 
-    return query.all()
+    issues = [row._asdict() for row in (await db.execute(query)).all()]
+    if mode == "relevance":
+        return mode, [(issue, issue.pop("score")) for issue in issues]
+    if mode == "created_at":
+        return mode, [(issue, issue["created_at"]) for issue in issues]
+    column, _, order = _rank_column(mode)
+    return mode, [(issue, order[issue[column.key]]) for issue in issues]
+
+
+async def list_project_issues(db: AsyncSession, project_id: int, q: str | None, status: str | None, priority: str | None, assignee: int | None, sort: str | None, limit: int | None, offset: int | None, cursor: str | None = None, fields: tuple[str, ...] | None = None):
+    _, rows = await _fetch_keyed(db, project_id, q, status, priority, assignee, sort, limit, offset, cursor, fields)
+    return [issue for issue, _ in rows]
+
+
+async def list_project_issues_page(db: AsyncSession, project_id: int, q: str | None, status: str | None, priority: str | None, assignee: int | None, sort: str | None, limit: int, offset: int | None, cursor: str | None = None, fields: tuple[str, ...] | None = None) -> tuple[list[dict], str | None]:
+    """Return one page of issues plus the cursor for the next page, if any."""
+    mode, rows = await _fetch_keyed(db, project_id, q, status, priority, assignee, sort, limit + 1, offset, cursor, fields)
+    if len(rows) <= limit:
+        return [issue for issue, _ in rows], None
+    rows = rows[:limit]
+    last_issue, last_key = rows[-1]
+    return [issue for issue, _ in rows], encode_cursor(mode, last_key, last_issue["id"])
+
+
+async def stream_project_issues(db: AsyncSession, project_id: int, q: str | None, status: str | None, priority: str | None, assignee: int | None, batch_size: int = 1000, with_comments: bool = False):
+    """Yield batches of issue dicts in id order from a server-side cursor.
 
+    With ``with_comments`` each issue gets a ``comments`` list, loaded with one
+    query per batch so memory stays bounded by ``batch_size``.
+    """
+    query = (
+        filter_project_issues(db, project_id, q, status, priority, assignee)
+        .with_only_columns(*ISSUE_COLUMNS)
+        .order_by(Issue.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(query)
+    async for partition in result.partitions():
+        batch = [row._asdict() for row in partition]
+        if with_comments:
+            by_issue = {issue["id"]: issue for issue in batch}
+            for issue in batch:
+                issue["comments"] = []
+            comments = await db.execute(
+                select(Comment.issue_id, Comment.id, Comment.author_id, Comment.body, Comment.created_at)
+                .where(Comment.issue_id.in_(by_issue))
+                .order_by(Comment.issue_id, Comment.created_at, Comment.id)
+            )
+            for comment in comments:
+                comment = comment._asdict()
+                by_issue[comment.pop("issue_id")]["comments"].append(comment)
+        yield batch
 
-def create_issue(db: Session, project_id: int, title: str, description: str | None, priority: str, reporter_id: int, assignee_id: int | None):
+
+async def get_issue(db: AsyncSession, issue_id: int) -> Issue | None:
+    return await db.get(Issue, issue_id)
+
+
+async def get_issue_version(db: AsyncSession, issue_id: int):
+    """Return ``(project_id, updated_at)`` for an issue without loading it, or None."""
+    return (await db.execute(select(Issue.project_id, Issue.updated_at).where(Issue.id == issue_id))).first()
+
+
+async def create_issue(db: AsyncSession, project_id: int, title: str, description: str | None, priority: str, reporter_id: int, assignee_id: int | None):
     issue = Issue(project_id=project_id, title=title, description=description, priority=priority, reporter_id=reporter_id, assignee_id=assignee_id)
     db.add(issue)
-    db.commit()
-    db.refresh(issue)
+    await db.flush()
+    await adjust_facet_counts(db, issue_deltas([issue]))
+    await bump_version(db, project_id)
+    await db.commit()
+    invalidate_project_stats(project_id)
+    broker.publish("issue.created", project_id, issue.id, issue_payload(issue))
+    return issue
+
+
+async def create_issues_bulk(db: AsyncSession, project_id: int, reporter_id: int, items: list[dict]):
+    """Insert all ``items`` with one executemany INSERT ... RETURNING in a single transaction.
+
+    Returns Core rows in the same order as ``items``.
+    """
+    rows = [
+        {
+            "project_id": project_id,
+            "reporter_id": reporter_id,
+            "title": item["title"],
+            "description": item.get("description"),
+            "priority": item.get("priority", "medium"),
+            "assignee_id": item.get("assignee_id"),
+        }
+        for item in items
+    ]
+    created = await insert_issue_rows(db, project_id, rows)
+    await db.commit()
+    invalidate_project_stats(project_id)
+    publish_bulk("issues.bulk_created", created)
+    return created
+
+
+async def insert_issue_rows(db: AsyncSession, project_id: int, rows: list[dict]):
+    """Insert prepared ``issues`` rows for one project with a single executemany; does not commit.
+
+    Facet counters and the project version are updated in the same
+    transaction. Returns Core rows in the same order as ``rows``; the caller
+    publishes them with ``publish_bulk`` once it has committed.
+    """
+    table = Issue.__table__
+    if db.get_bind().dialect.name == "sqlite":
+        # SQLite hands out rowids in insertion order within one writer transaction,
+        # so sorting by id restores parameter order without the much slower
+        # sentinel-based sort_by_parameter_order path.
+        result = await db.execute(insert(table).returning(*table.c), rows)
+        created = sorted(result.all(), key=lambda row: row.id)
+    else:
+        result = await db.execute(insert(table).returning(*table.c, sort_by_parameter_order=True), rows)
+        created = result.all()
+    await adjust_facet_counts(db, issue_deltas(created))
+    await bump_version(db, project_id)
+    return created
+
+
+async def bulk_update_issues(db: AsyncSession, criteria, changes: dict, actor_id: int | None = None, max_issues: int | None = None) -> list[int]:
+    """Apply ``changes`` to every issue matching ``criteria`` in one UPDATE; return the affected ids.
+
+    Raises ``TooManyIssues``, changing nothing, when more than ``max_issues`` match.
+    """
+    query = select(Issue.id, Issue.project_id, Issue.status, Issue.priority, Issue.assignee_id).where(criteria)
+    if max_issues is not None:
+        query = query.limit(max_issues + 1)
+    before = (await db.execute(query)).all()
+    if max_issues is not None and len(before) > max_issues:
+        raise TooManyIssues(f"More than {max_issues} issues match; narrow the filter")
+    if not before:
+        return []
+    ids = [row.id for row in before]
+    now = datetime.utcnow()
+    await db.execute(
+        update(Issue)
+        .where(Issue.id.in_(ids))
+        .values(**changes, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    deltas = issue_deltas(before, -1)
+    deltas.update(issue_deltas(SimpleNamespace(**{**row._asdict(), **changes}) for row in before))
+    project_ids = {row.project_id for row in before}
+    await adjust_facet_counts(db, deltas)
+    await bump_version(db, *project_ids)
+    await db.commit()
+    invalidate_project_stats(*project_ids)
+    await record_activity(db, [
+        activity for row in before for activity in change_rows(row.id, row.project_id, actor_id, row, changes, now)
+    ])
+    publish_bulk("issues.bulk_updated", before, changed=sorted(changes))
+    return sorted(ids)
+
+
+async def update_issue(db: AsyncSession, issue: Issue, changes: dict, actor_id: int | None = None) -> Issue:
+    deltas = issue_deltas([issue], -1)
+    activity = change_rows(issue.id, issue.project_id, actor_id, issue, changes)
+    for field, value in changes.items():
+        setattr(issue, field, value)
+    if changes:
+        issue.updated_at = datetime.utcnow()
+    deltas.update(issue_deltas([issue]))
+    await adjust_facet_counts(db, deltas)
+    await bump_version(db, issue.project_id)
+    await db.commit()
+    invalidate_project_stats(issue.project_id)
+    await record_activity(db, activity)
+    if changes:
+        broker.publish("issue.updated", issue.project_id, issue.id, {**issue_payload(issue), "changed": sorted(changes)})
     return issue
+
+
+async def delete_issue(db: AsyncSession, issue_id: int) -> None:
+    # Load comments up front: the delete-orphan cascade must not lazy-load under asyncio.
+    issue = await db.scalar(select(Issue).options(selectinload(Issue.comments)).where(Issue.id == issue_id))
+    deltas = issue_deltas([issue], -1)
+    await delete_issue_activity(db, issue_id)
+    await db.delete(issue)
+    await adjust_facet_counts(db, deltas)
+    await bump_version(db, issue.project_id)
+    await db.commit()
+    invalidate_project_stats(issue.project_id)
+    broker.publish("issue.deleted", issue.project_id, issue_id, {"id": issue_id, "project_id": issue.project_id})
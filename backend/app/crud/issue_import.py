@@ -0,0 +1,212 @@
+"""Streaming import of issues (with their comments) from NDJSON or CSV.
+
+Input is consumed one record at a time and written in batches, each in its
+own transaction, so memory is bounded by the batch size rather than the
+input. After every committed batch the number of input records handled so
+far is reported as a checkpoint; feeding it back as ``skip`` resumes a
+partially completed import.
+"""
+
+import csv
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from datetime import datetime, timezone
+from typing import TextIO
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.crud.issue import insert_issue_rows, publish_bulk
+from app.crud.stats import invalidate_project_stats
+from app.models.comment import Comment
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from app.schemas.issue import IssueImportRecord, IssueImportResult
+
+FORMATS = ("ndjson", "csv")
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportFailed(Exception):
+    """A batch could not be written; ``result`` covers only the batches committed before it."""
+
+    def __init__(self, result: IssueImportResult, cause: Exception):
+        super().__init__(str(cause).splitlines()[0])
+        self.result = result
+
+
+class UnreadableInput(ImportFailed):
+    """The input stopped decoding (bad UTF-8, malformed CSV) after ``result.committed_records`` records."""
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[str | dict]:
+    """Yield raw records: NDJSON lines as text, CSV rows as dicts. Parsing happens per record on import."""
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield {key: value for key, value in row.items() if value not in ("", None)}
+        return
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+def _parse(raw: str | dict) -> IssueImportRecord:
+    data = orjson.loads(raw) if isinstance(raw, str) else raw
+    if not isinstance(data, dict):
+        raise ValueError("Record must be an object")
+    if isinstance(data.get("comments"), str):
+        # CSV carries comments as one JSON array cell, as the export writes them.
+        data["comments"] = orjson.loads(data["comments"])
+    return IssueImportRecord.model_validate(data)
+
+
+def _error_message(exc: ValueError) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'record'}: {error['msg']}" for error in exc.errors()
+        )
+    return str(exc).splitlines()[0]
+
+
+def _read_chunk(records: Iterator[str | dict], size: int) -> list[str | dict]:
+    return list(islice(records, size))
+
+
+def _utc(value: datetime | None, default: datetime) -> datetime:
+    if value is None:
+        return default
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class IssueImporter:
+    def __init__(self, db: AsyncSession, project_id: int, batch_size: int, dry_run: bool = False):
+        self.db = db
+        self.project_id = project_id
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.result = IssueImportResult(dry_run=dry_run)
+        # Email -> user id (None when unknown), shared across batches.
+        self.user_ids = TTLCache(maxsize=settings.IMPORT_EMAIL_CACHE_SIZE, ttl=float("inf"))
+        self.members: set[int] | None = None
+
+    async def run(self, records: Iterable[str | dict], skip: int = 0, on_checkpoint: Callable[[int], None] | None = None) -> IssueImportResult:
+        self.result.committed_records = skip
+        self.members = set(
+            await self.db.scalars(select(ProjectMember.user_id).where(ProjectMember.project_id == self.project_id))
+        )
+        records = iter(records)
+        start = 0
+        try:
+            while True:
+                # Reading (and, for skipped records, discarding) input is file I/O: keep it off the event loop.
+                chunk = await run_in_threadpool(_read_chunk, records, self.batch_size)
+                if not chunk:
+                    break
+                batch = [(start + n, raw) for n, raw in enumerate(chunk) if start + n >= skip]
+                start += len(chunk)
+                if batch:
+                    await self._write_batch(batch, on_checkpoint)
+        except SQLAlchemyError as exc:
+            await self.db.rollback()
+            raise ImportFailed(self.result, exc) from exc
+        except (UnicodeDecodeError, csv.Error) as exc:
+            # Raised by the reader between batches, so there is nothing uncommitted to roll back.
+            raise UnreadableInput(self.result, exc) from exc
+        finally:
+            if self.result.imported and not self.dry_run:
+                invalidate_project_stats(self.project_id)
+        return self.result
+
+    def _fail(self, index: int, message: str) -> None:
+        self.result.failed += 1
+        if len(self.result.errors) < MAX_REPORTED_ERRORS:
+            self.result.errors.append({"record": index, "message": message})
+
+    async def _resolve(self, emails: set[str]) -> dict[str, int | None]:
+        resolved = {email: self.user_ids.get(email, default=False) for email in emails}
+        missing = [email for email, user_id in resolved.items() if user_id is False]
+        if missing:
+            found = dict((await self.db.execute(select(User.email, User.id).where(User.email.in_(missing)))).all())
+            for email in missing:
+                resolved[email] = found.get(email)
+                self.user_ids.set(email, resolved[email])
+        return resolved
+
+    def _parse_batch(self, batch: list[tuple[int, str | dict]]) -> list[tuple[int, IssueImportRecord]]:
+        parsed = []
+        for index, raw in batch:
+            try:
+                parsed.append((index, _parse(raw)))
+            except ValueError as exc:
+                self._fail(index, _error_message(exc))
+        return parsed
+
+    async def _write_batch(self, batch: list[tuple[int, str | dict]], on_checkpoint) -> None:
+        parsed = await run_in_threadpool(self._parse_batch, batch)
+        self.result.records += len(batch)
+
+        emails = set()
+        for _, record in parsed:
+            emails.add(record.reporter_email)
+            if record.assignee_email:
+                emails.add(record.assignee_email)
+            emails.update(comment.author_email for comment in record.comments)
+        user_ids = await self._resolve(emails)
+
+        now = datetime.utcnow()
+        issue_rows, comment_lists = [], []
+        for index, record in parsed:
+            reporter_id = user_ids[record.reporter_email]
+            assignee_id = user_ids[record.assignee_email] if record.assignee_email else None
+            authors = [user_ids[comment.author_email] for comment in record.comments]
+            if reporter_id is None:
+                self._fail(index, f"Unknown reporter {record.reporter_email}")
+                continue
+            if record.assignee_email and assignee_id not in self.members:
+                self._fail(index, f"Assignee {record.assignee_email} is not a project member")
+                continue
+            if None in authors:
+                self._fail(index, "Unknown comment author")
+                continue
+            created_at = _utc(record.created_at, now)
+            issue_rows.append({
+                "project_id": self.project_id,
+                "title": record.title,
+                "description": record.description,
+                "status": record.status,
+                "priority": record.priority,
+                "reporter_id": reporter_id,
+                "assignee_id": assignee_id,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            comment_lists.append([
+                {"author_id": author_id, "body": comment.body, "created_at": _utc(comment.created_at, created_at)}
+                for author_id, comment in zip(authors, record.comments)
+            ])
+
+        comment_count = sum(len(comments) for comments in comment_lists)
+        if issue_rows and not self.dry_run:
+            created = await insert_issue_rows(self.db, self.project_id, issue_rows)
+            comment_rows = [
+                {**comment, "issue_id": issue.id}
+                for issue, comments in zip(created, comment_lists)
+                for comment in comments
+            ]
+            if comment_rows:
+                await self.db.execute(insert(Comment), comment_rows)
+            await self.db.commit()
+            publish_bulk("issues.bulk_created", created)
+        self.result.imported += len(issue_rows)
+        self.result.comments += comment_count
+        self.result.committed_records = batch[-1][0] + 1
+        if on_checkpoint is not None and not self.dry_run:
+            on_checkpoint(self.result.committed_records)
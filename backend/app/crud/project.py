@@ -1,32 +1,52 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.project import Project
 from app.models.project_member import ProjectMember
 
 
-def create_project(db: Session, name: str, key: str, description: str | None, owner_id: int) -> Project:
+async def create_project(db: AsyncSession, name: str, key: str, description: str | None, owner_id: int) -> Project:
     project = Project(name=name, key=key, description=description)
     db.add(project)
-    db.commit()
-    db.refresh(project)
+    await db.flush()
     member = ProjectMember(project_id=project.id, user_id=owner_id, role="maintainer")
     db.add(member)
-    db.commit()
+    # Column defaults are applied client-side, so the instance is complete without a refresh.
+    await db.commit()
     return project
 
 
-def list_user_projects(db: Session, user_id: int):
-    return (
-        db.query(Project)
+async def get_user_roles(db: AsyncSession, user_id: int) -> set[str]:
+    """Return the distinct roles ``user_id`` holds across projects."""
+    return set((await db.scalars(select(ProjectMember.role).where(ProjectMember.user_id == user_id).distinct())).all())
+
+
+async def bump_version(db: AsyncSession, *project_ids: int) -> None:
+    """Advance the change counter of ``project_ids``; the caller commits."""
+    await db.execute(
+        update(Project)
+        .where(Project.id.in_(project_ids))
+        .values(version=Project.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_version(db: AsyncSession, project_id: int) -> int | None:
+    return await db.scalar(select(Project.version).where(Project.id == project_id))
+
+
+async def list_user_projects(db: AsyncSession, user_id: int):
+    result = await db.scalars(
+        select(Project)
         .join(ProjectMember, ProjectMember.project_id == Project.id)
-        .filter(ProjectMember.user_id == user_id)
-        .all()
+        .where(ProjectMember.user_id == user_id)
     )
+    return result.all()
 
 
-def list_maintained_projects(db: Session, user_id: int):
-    return (
-        db.query(Project)
+async def list_maintained_projects(db: AsyncSession, user_id: int):
+    result = await db.scalars(
+        select(Project)
         .join(ProjectMember, ProjectMember.project_id == Project.id)
-        .filter(ProjectMember.user_id == user_id, ProjectMember.role == "maintainer")
-        .all()
+        .where(ProjectMember.user_id == user_id, ProjectMember.role == "maintainer")
     )
+    return result.all()
@@ -0,0 +1,94 @@
+"""Project dashboard aggregates, cached per project until its issues or members change."""
+
+from datetime import datetime, timedelta
+from typing import get_args
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.issue import Issue
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from app.schemas.issue import IssuePriority
+
+OPEN_STATUSES = ("open", "in_progress")
+RESOLVED_STATUSES = ("resolved", "closed")
+PRIORITIES = get_args(IssuePriority)
+TOP_ASSIGNEES = 5
+
+stats_cache = TTLCache(maxsize=settings.PROJECT_STATS_CACHE_SIZE, ttl=settings.PROJECT_STATS_CACHE_TTL_SECONDS)
+
+
+def invalidate_project_stats(*project_ids: int) -> None:
+    for project_id in project_ids:
+        stats_cache.invalidate(project_id)
+
+
+def _count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+async def compute_project_stats(db: AsyncSession, project_id: int, now: datetime | None = None) -> dict:
+    """Aggregate a project's issues in one grouped pass.
+
+    Rows are grouped by assignee (joined to current members for names), so
+    the result set is at most one row per assignee plus one for unassigned
+    issues; the per-group counters are summed here. Issues have no resolution
+    timestamp, so "resolved in the last N days" uses ``updated_at`` of issues
+    that are currently resolved or closed.
+    """
+    now = now or datetime.utcnow()
+    week_ago, month_ago = now - timedelta(days=7), now - timedelta(days=30)
+    is_open = Issue.status.in_(OPEN_STATUSES)
+    is_resolved = Issue.status.in_(RESOLVED_STATUSES)
+
+    columns = {
+        "open": _count_if(is_open),
+        **{f"open_{p}": _count_if(and_(is_open, Issue.priority == p)) for p in PRIORITIES},
+        "oldest_open": func.min(case((is_open, Issue.created_at))),
+        "created_7d": _count_if(Issue.created_at >= week_ago),
+        "created_30d": _count_if(Issue.created_at >= month_ago),
+        "resolved_7d": _count_if(and_(is_resolved, Issue.updated_at >= week_ago)),
+        "resolved_30d": _count_if(and_(is_resolved, Issue.updated_at >= month_ago)),
+    }
+    rows = (
+        await db.execute(
+            select(Issue.assignee_id, User.name, *(c.label(k) for k, c in columns.items()))
+            .outerjoin(
+                ProjectMember,
+                and_(ProjectMember.project_id == Issue.project_id, ProjectMember.user_id == Issue.assignee_id),
+            )
+            .outerjoin(User, User.id == ProjectMember.user_id)
+            .where(Issue.project_id == project_id)
+            .group_by(Issue.assignee_id, User.name)
+        )
+    ).all()
+
+    oldest = min((row.oldest_open for row in rows if row.oldest_open is not None), default=None)
+    assignees = sorted(
+        (row for row in rows if row.assignee_id is not None and row.open),
+        key=lambda row: (-row.open, row.assignee_id),
+    )
+    return {
+        "open_by_priority": {p: sum(getattr(row, f"open_{p}") for row in rows) for p in PRIORITIES},
+        "unassigned_open": sum(row.open for row in rows if row.assignee_id is None),
+        "oldest_open_age_seconds": int((now - oldest).total_seconds()) if oldest else None,
+        "created_last_7_days": sum(row.created_7d for row in rows),
+        "created_last_30_days": sum(row.created_30d for row in rows),
+        "resolved_last_7_days": sum(row.resolved_7d for row in rows),
+        "resolved_last_30_days": sum(row.resolved_30d for row in rows),
+        "top_assignees": [
+            {"user_id": row.assignee_id, "name": row.name, "open_issues": row.open}
+            for row in assignees[:TOP_ASSIGNEES]
+        ],
+    }
+
+
+async def get_project_stats(db: AsyncSession, project_id: int) -> dict:
+    stats = stats_cache.get(project_id, default=None)
+    if stats is None:
+        stats = await compute_project_stats(db, project_id)
+        stats_cache.set(project_id, stats)
+    return stats
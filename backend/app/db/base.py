@@ -4,5 +4,8 @@ from app.models.project import Project
 from app.models.project_member import ProjectMember
 from app.models.issue import Issue
 from app.models.comment import Comment
+from app.models.issue_facet import IssueFacetCount
+from app.models.issue_activity import IssueActivity
+from app.db import search  # noqa: F401  registers search index DDL hooks
 
-__all__ = ["Base", "User", "Project", "ProjectMember", "Issue", "Comment"]
+__all__ = ["Base", "User", "Project", "ProjectMember", "Issue", "Comment", "IssueFacetCount", "IssueActivity"]
@@ -1,5 +1,6 @@
 from app.db.session import engine
 from app.models.base import Base
+from app.db import base  # noqa: F401  ensures model and search index registration
 
 
 def init_db():
@@ -0,0 +1,69 @@
+"""Count the SQL statements a block of code or a single request executes.
+
+``count_queries()`` records every statement run by any engine while the
+block is active, which is what tests wrap around ``TestClient`` calls to
+hold endpoints to a query budget. ``request_log`` is the per-request
+variant used by ``QueryBudgetMiddleware`` at runtime.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryLog:
+    def __init__(self):
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def report(self) -> str:
+        return "\n".join(f"  {n}. {' '.join(statement.split())}" for n, statement in enumerate(self.statements, 1))
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+request_log: ContextVar[QueryLog | None] = ContextVar("request_log", default=None)
+
+_recorders: list[QueryLog] = []
+_lock = threading.Lock()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _recorders:
+        with _lock:
+            for log in _recorders:
+                log.statements.append(statement)
+    log = request_log.get()
+    if log is not None:
+        log.statements.append(statement)
+
+
+@contextmanager
+def count_queries():
+    """Yield a ``QueryLog`` collecting every statement executed until the block exits."""
+    log = QueryLog()
+    with _lock:
+        _recorders.append(log)
+    try:
+        yield log
+    finally:
+        with _lock:
+            _recorders.remove(log)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """Fail with the offending statements if the block runs more than ``limit`` queries."""
+    with count_queries() as log:
+        yield log
+    if log.count > limit:
+        raise QueryBudgetExceeded(f"{log.count} queries executed, budget is {limit}:\n{log.report()}")
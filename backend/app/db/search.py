@@ -0,0 +1,138 @@
+"""Full-text search backends for issue title/description lookups."""
+
+import re
+
+from sqlalchemy import event, func, literal, or_, select, table, column, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.base import Base
+from app.models.issue import Issue
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class SearchBackend:
+    """Resolves a free-text query to a subquery of ``(issue_id, score)`` rows.
+
+    Lower scores rank higher. Backends that need extra schema objects create
+    them in ``install`` and repopulate them in ``rebuild``.
+    """
+
+    name = "base"
+
+    def install(self, connection: Connection) -> None:
+        pass
+
+    def uninstall(self, connection: Connection) -> None:
+        pass
+
+    def rebuild(self, connection: Connection) -> None:
+        pass
+
+    def match(self, q: str):
+        raise NotImplementedError
+
+
+class LikeSearchBackend(SearchBackend):
+    """Portable fallback: substring match on title and description, no ranking."""
+
+    name = "like"
+
+    def match(self, q: str):
+        pattern = f"%{q}%"
+        return (
+            select(Issue.id.label("issue_id"), literal(0.0).label("score"))
+            .where(or_(Issue.title.ilike(pattern), Issue.description.ilike(pattern)))
+            .subquery()
+        )
+
+
+class SqliteFtsBackend(SearchBackend):
+    """SQLite FTS5 index over issues, kept in sync by triggers and ranked by bm25."""
+
+    name = "fts5"
+    table_name = "issues_fts"
+
+    _fts = table(table_name, column("rowid"))
+
+    _ddl = (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {table_name} USING fts5("
+        "title, description, content='issues', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS issues_fts_ai AFTER INSERT ON issues BEGIN "
+        f"INSERT INTO {table_name}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS issues_fts_ad AFTER DELETE ON issues BEGIN "
+        f"INSERT INTO {table_name}({table_name}, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); END",
+        f"CREATE TRIGGER IF NOT EXISTS issues_fts_au AFTER UPDATE OF title, description ON issues BEGIN "
+        f"INSERT INTO {table_name}({table_name}, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        f"INSERT INTO {table_name}(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    )
+
+    def install(self, connection: Connection) -> None:
+        for statement in self._ddl:
+            connection.execute(text(statement))
+
+    def uninstall(self, connection: Connection) -> None:
+        for trigger in ("issues_fts_ai", "issues_fts_ad", "issues_fts_au"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {self.table_name}"))
+
+    def rebuild(self, connection: Connection) -> None:
+        connection.execute(text(f"INSERT INTO {self.table_name}({self.table_name}) VALUES ('rebuild')"))
+
+    @staticmethod
+    def to_match_expression(q: str) -> str | None:
+        # Quote every token so user input can never be parsed as FTS5 syntax,
+        # and prefix-match it to stay close to the old substring behaviour.
+        tokens = _TOKEN_RE.findall(q)
+        if not tokens:
+            return None
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    def match(self, q: str):
+        expression = self.to_match_expression(q)
+        if expression is None:
+            return LikeSearchBackend().match(q)
+        return (
+            select(
+                self._fts.c.rowid.label("issue_id"),
+                func.bm25(text(self.table_name)).label("score"),
+            )
+            .select_from(self._fts)
+            .where(text(f"{self.table_name} MATCH :fts_query").bindparams(fts_query=expression))
+            .subquery()
+        )
+
+
+_BACKENDS: dict[str, type[SearchBackend]] = {
+    LikeSearchBackend.name: LikeSearchBackend,
+    SqliteFtsBackend.name: SqliteFtsBackend,
+}
+
+
+def register_backend(backend: type[SearchBackend]) -> None:
+    _BACKENDS[backend.name] = backend
+
+
+def backend_for_dialect(dialect_name: str) -> SearchBackend:
+    name = settings.SEARCH_BACKEND
+    if name == "auto":
+        name = SqliteFtsBackend.name if dialect_name == "sqlite" else LikeSearchBackend.name
+    return _BACKENDS[name]()
+
+
+def get_search_backend(db: Session) -> SearchBackend:
+    return backend_for_dialect(db.get_bind().dialect.name)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_search_backend(target, connection: Connection, **kw) -> None:
+    backend_for_dialect(connection.dialect.name).install(connection)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _uninstall_search_backend(target, connection: Connection, **kw) -> None:
+    backend_for_dialect(connection.dialect.name).uninstall(connection)
@@ -1,7 +1,215 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import asyncio
+import weakref
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.core.metrics import instrument_pool
+
+_ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_database_url(url: str) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{_ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def _is_sqlite_file(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url and not url.rstrip("/").endswith(":")
+
+
+def _pool_options(url: str) -> dict:
+    if url.startswith("sqlite") and not _is_sqlite_file(url):
+        return {}
+    return {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
+
+
+def use_production_sqlite(url: str) -> bool:
+    return settings.SQLITE_PROFILE == "production" and _is_sqlite_file(url)
+
+
+def apply_sqlite_pragmas(dbapi_connection, readonly: bool = False) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        if not readonly:
+            cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        if readonly:
+            cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
+def _with_pragmas(engine: Engine, readonly: bool) -> Engine:
+    event.listen(engine, "connect", lambda dbapi_connection, _: apply_sqlite_pragmas(dbapi_connection, readonly))
+    return engine
 
-engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {})
+
+def create_engines(url: str) -> tuple[Engine, Engine]:
+    """Return ``(writer, reader)`` sync engines; the same engine twice outside the production profile."""
+    connect_args = {"check_same_thread": False} if url.startswith("sqlite") else {}
+    if not use_production_sqlite(url):
+        writer = create_engine(url, connect_args=connect_args, **_pool_options(url))
+        return writer, writer
+    writer = create_engine(url, connect_args=connect_args, pool_size=1, max_overflow=0)
+    reader = create_engine(url, connect_args=connect_args, pool_size=settings.SQLITE_READ_POOL_SIZE, max_overflow=0)
+    return _with_pragmas(writer, readonly=False), _with_pragmas(reader, readonly=True)
+
+
+def create_async_engines(url: str) -> tuple[AsyncEngine, AsyncEngine]:
+    """Async counterpart of ``create_engines``."""
+    async_url = async_database_url(url)
+    if not use_production_sqlite(url):
+        # aiosqlite opens a connection (and thread) per checkout under NullPool; only size real pools.
+        writer = create_async_engine(async_url, **({} if url.startswith("sqlite") else _pool_options(url)))
+        return writer, writer
+    writer = create_async_engine(async_url, poolclass=AsyncAdaptedQueuePool, pool_size=1, max_overflow=0)
+    reader = create_async_engine(
+        async_url, poolclass=AsyncAdaptedQueuePool, pool_size=settings.SQLITE_READ_POOL_SIZE, max_overflow=0
+    )
+    _with_pragmas(writer.sync_engine, readonly=False)
+    _with_pragmas(reader.sync_engine, readonly=True)
+    return writer, reader
+
+
+engine, read_engine = create_engines(settings.DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+async_engine, async_read_engine = create_async_engines(settings.DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
+instrument_pool(engine, "writer")
+instrument_pool(async_engine.sync_engine, "async_writer")
+if read_engine is not engine:
+    instrument_pool(read_engine, "reader")
+    instrument_pool(async_read_engine.sync_engine, "async_reader")
+
+
+# Keyed by engine rather than by the readonly flag: outside the production
+# profile readers and writers share one engine, and so one pool.
+_slots_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, weakref.WeakKeyDictionary[Engine, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _session_capacity(bind: Engine) -> int:
+    if read_engine is not engine:
+        if bind is engine:
+            return 1
+        if bind is read_engine:
+            return settings.SQLITE_READ_POOL_SIZE
+    return settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+
+
+def _session_slots(bind: Engine) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    slots = _slots_by_loop.setdefault(loop, weakref.WeakKeyDictionary())
+    if bind not in slots:
+        slots[bind] = asyncio.Semaphore(_session_capacity(bind))
+    return slots[bind]
+
+
+class _ThreadedStreamResult:
+    """Async view of a sync streaming Result; each partition is fetched on the threadpool."""
+
+    def __init__(self, session: "ThreadedSession", result):
+        self._session = session
+        self._result = result
+
+    async def partitions(self, size: int | None = None):
+        parts = self._result.partitions(size)
+        while (part := await self._session._run(next, parts, None)) is not None:
+            yield part
+
+
+class ThreadedSession:
+    """AsyncSession-compatible facade over a sync Session.
+
+    Every database call is pushed to Starlette's threadpool, which is how the
+    API ran before the async stack. Selected with ``DB_ASYNC=false`` so both
+    paths can be compared under the same routes.
+
+    A session keeps its pooled connection between threadpool hops, so the
+    number of open sessions is capped at the pool capacity; otherwise worker
+    threads could all block on checkout while the sessions holding
+    connections wait for a free thread.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+        self._slots: asyncio.Semaphore | None = None
+
+    async def _run(self, fn, *args, **kwargs):
+        if self._slots is None:
+            slots = _session_slots(self.sync_session.get_bind())
+            await slots.acquire()
+            self._slots = slots
+        return await run_in_threadpool(fn, *args, **kwargs)
+
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    def get_bind(self, *args, **kwargs):
+        return self.sync_session.get_bind(*args, **kwargs)
+
+    async def execute(self, statement, *args, **kwargs):
+        return await self._run(self.sync_session.execute, statement, *args, **kwargs)
+
+    async def scalar(self, statement, *args, **kwargs):
+        return await self._run(self.sync_session.scalar, statement, *args, **kwargs)
+
+    async def scalars(self, statement, *args, **kwargs):
+        return await self._run(self.sync_session.scalars, statement, *args, **kwargs)
+
+    async def stream(self, statement, *args, **kwargs):
+        statement = statement.execution_options(stream_results=True)
+        return _ThreadedStreamResult(self, await self._run(self.sync_session.execute, statement, *args, **kwargs))
+
+    async def get(self, entity, ident, **kwargs):
+        return await self._run(self.sync_session.get, entity, ident, **kwargs)
+
+    async def flush(self) -> None:
+        await self._run(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await self._run(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await self._run(self.sync_session.rollback)
+
+    async def refresh(self, instance, *args, **kwargs) -> None:
+        await self._run(self.sync_session.refresh, instance, *args, **kwargs)
+
+    async def delete(self, instance) -> None:
+        await self._run(self.sync_session.delete, instance)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return await self._run(fn, self.sync_session, *args, **kwargs)
+
+    async def close(self) -> None:
+        try:
+            await run_in_threadpool(self.sync_session.close)
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+                self._slots = None
+
+
+def new_session(readonly: bool = False) -> AsyncSession | ThreadedSession:
+    """Open a session; ``readonly`` sessions use the reader pool in the production SQLite profile."""
+    if settings.DB_ASYNC:
+        return (AsyncReadSessionLocal if readonly else AsyncSessionLocal)()
+    factory = ReadSessionLocal if readonly else SessionLocal
+    return ThreadedSession(factory(expire_on_commit=False))
@@ -1,28 +1,56 @@
 """FastAPI application entrypoint with middleware, routes, and global error handlers."""
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import HTTPException, Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
-from app.api.routes import auth, projects, issues, comments, users
+from app.api.admission import AdmissionMiddleware
+from app.api.metrics import MetricsMiddleware
+from app.api.query_budget import QueryBudgetMiddleware
+from app.api.routes import auth, batch, projects, issues, comments, events, users, metrics
+from app.core.config import settings
+from app.core.security import shutdown_hash_pool
+from app.crud.activity import activity_writer
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    activity_writer.start()
+    yield
+    await activity_writer.stop()
+    shutdown_hash_pool()
+
 
-app = FastAPI(title="IssueHub")
+app = FastAPI(title="IssueHub", lifespan=lifespan)
 
+# Added before CORS so that 429 responses still carry CORS headers.
+app.add_middleware(AdmissionMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
     allow_credentials=True,
     allow_methods=["*"] ,
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Last-Cursor"],
 )
+app.add_middleware(QueryBudgetMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(users.router, prefix="/api", tags=["users"])
 app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
 app.include_router(issues.router, prefix="/api", tags=["issues"])
 app.include_router(comments.router, prefix="/api", tags=["comments"])
+app.include_router(events.router, prefix="/api", tags=["events"])
+app.include_router(batch.router, prefix="/api", tags=["batch"])
+if settings.METRICS_ENABLED:
+    app.include_router(metrics.router, tags=["metrics"])
 
 
 @app.exception_handler(HTTPException)
@@ -44,7 +72,7 @@ async def validation_exception_handler(_: Request, exc: RequestValidationError):
             "error": {
                 "code": "validation_error",
                 "message": "Request validation failed",
-                "details": exc.errors(),
+                "details": jsonable_encoder(exc.errors()),
             }
         },
     )
@@ -1,11 +1,28 @@
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, Integer, ForeignKey
+from sqlalchemy import Computed, String, DateTime, Integer, ForeignKey, Index
 
 from app.models.base import Base
 
+PRIORITY_ORDER = {"low": 1, "medium": 2, "high": 3, "critical": 4}
+STATUS_ORDER = {"open": 1, "in_progress": 2, "resolved": 3, "closed": 4}
+
+
+def rank_expression(column: str, order: dict[str, int]) -> str:
+    """SQL for a column's sort rank, e.g. ``CASE priority WHEN 'low' THEN 1 ... END``."""
+    cases = " ".join(f"WHEN '{value}' THEN {rank}" for value, rank in order.items())
+    return f"CASE {column} {cases} END"
+
+
 class Issue(Base):
     __tablename__ = "issues"
+    __table_args__ = (
+        Index("ix_issues_project_created", "project_id", "created_at", "id"),
+        Index("ix_issues_project_priority", "project_id", "priority", "id"),
+        Index("ix_issues_project_status", "project_id", "status", "id"),
+        Index("ix_issues_project_priority_rank", "project_id", "priority_rank", "id"),
+        Index("ix_issues_project_status_rank", "project_id", "status_rank", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"), index=True)
@@ -13,6 +30,9 @@ class Issue(Base):
     description: Mapped[str | None] = mapped_column(String(2000))
     status: Mapped[str] = mapped_column(String(20), default="open")
     priority: Mapped[str] = mapped_column(String(20), default="medium")
+    # Generated (virtual) sort ranks, so priority and status ordering can seek on an index.
+    status_rank: Mapped[int] = mapped_column(Integer, Computed(rank_expression("status", STATUS_ORDER)))
+    priority_rank: Mapped[int] = mapped_column(Integer, Computed(rank_expression("priority", PRIORITY_ORDER)))
     reporter_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     assignee_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,26 @@
+from datetime import datetime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, DateTime, Integer, Index
+
+from app.models.base import Base
+
+class IssueActivity(Base):
+    """Append-only record of triage field changes on an issue.
+
+    No foreign keys: rows arrive from a background writer, so ``delete_issue``
+    removes an issue's history itself.
+    """
+
+    __tablename__ = "issue_activity"
+    __table_args__ = (
+        Index("ix_issue_activity_issue_id_id", "issue_id", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    issue_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    project_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    actor_id: Mapped[int | None] = mapped_column(Integer)
+    field: Mapped[str] = mapped_column(String(20), nullable=False)
+    old_value: Mapped[str | None] = mapped_column(String(40))
+    new_value: Mapped[str | None] = mapped_column(String(40))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,14 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, ForeignKey
+
+from app.models.base import Base
+
+class IssueFacetCount(Base):
+    """Per-project issue counts by facet value, kept in step with issue writes."""
+
+    __tablename__ = "issue_facet_counts"
+
+    project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id"), primary_key=True)
+    facet: Mapped[str] = mapped_column(String(20), primary_key=True)
+    value: Mapped[str] = mapped_column(String(40), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -12,6 +12,8 @@ class Project(Base):
     key: Mapped[str] = mapped_column(String(20), unique=True, index=True, nullable=False)
     description: Mapped[str | None] = mapped_column(String(500))
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Bumped by every issue and member write; feeds ETags for project-scoped reads.
+    version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
     issues = relationship("Issue", back_populates="project", cascade="all, delete-orphan")
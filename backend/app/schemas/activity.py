@@ -0,0 +1,14 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+class IssueActivityOut(BaseModel):
+    id: int
+    issue_id: int
+    actor_id: int | None
+    field: str
+    old_value: str | None
+    new_value: str | None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
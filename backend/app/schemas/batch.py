@@ -0,0 +1,13 @@
+from typing import Literal
+from pydantic import BaseModel, Field
+
+MAX_BATCH_REQUESTS = 20
+
+class BatchItem(BaseModel):
+    id: str | None = None
+    method: Literal["GET"] = "GET"
+    path: str = Field(pattern=r"^/api/")
+    if_none_match: str | None = None
+
+class BatchRequest(BaseModel):
+    requests: list[BatchItem] = Field(min_length=1, max_length=MAX_BATCH_REQUESTS)
@@ -10,6 +10,7 @@ class CommentOut(BaseModel):
     author_id: int
     body: str
     created_at: datetime
+    author_name: str | None = None
 
     class Config:
         from_attributes = True
@@ -1,9 +1,11 @@
 from datetime import datetime
 from typing import Literal
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 IssueStatus = Literal["open", "in_progress", "resolved", "closed"]
 IssuePriority = Literal["low", "medium", "high", "critical"]
+
+MAX_BULK_ISSUES = 500
 
 class IssueCreate(BaseModel):
     title: str
@@ -17,6 +19,14 @@ class IssueUpdate(BaseModel):
     status: IssueStatus | None = None
     priority: IssuePriority | None = None
     assignee_id: int | None = None
+
+    @model_validator(mode="after")
+    def check_not_null(self):
+        # Omitted means unchanged; an explicit null would reach the NOT NULL columns.
+        for field in ("title", "status", "priority"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
 
 class IssueOut(BaseModel):
     id: int
@@ -32,3 +42,74 @@ class IssueOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+class IssueBulkCreate(BaseModel):
+    issues: list[IssueCreate] = Field(min_length=1, max_length=MAX_BULK_ISSUES)
+
+class IssueBulkItemResult(BaseModel):
+    index: int
+    ok: bool
+    issue: IssueOut | None = None
+    error: dict | None = None
+
+class IssueBulkCreateResult(BaseModel):
+    created: int
+    results: list[IssueBulkItemResult]
+
+class IssueFilter(BaseModel):
+    q: str | None = None
+    status: str | None = None
+    priority: str | None = None
+    assignee: int | None = None
+
+class IssueBulkUpdate(BaseModel):
+    ids: list[int] | None = Field(default=None, min_length=1, max_length=MAX_BULK_ISSUES)
+    project_id: int | None = None
+    filter: IssueFilter | None = None
+    patch: IssueUpdate
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Provide exactly one of ids or filter")
+        if self.filter is not None and self.project_id is None:
+            raise ValueError("project_id is required with filter")
+        if not self.patch.model_dump(exclude_unset=True):
+            raise ValueError("patch must set at least one field")
+        return self
+
+class IssueBulkUpdateResult(BaseModel):
+    updated: list[int]
+    forbidden: list[int] = []
+    not_found: list[int] = []
+
+class IssueFacets(BaseModel):
+    total: int
+    status: dict[str, int]
+    priority: dict[str, int]
+    assignee: dict[str, int]
+
+class IssueImportComment(BaseModel):
+    author_email: str
+    body: str = Field(min_length=1, max_length=2000)
+    created_at: datetime | None = None
+
+class IssueImportRecord(BaseModel):
+    title: str = Field(min_length=1, max_length=200)
+    description: str | None = Field(default=None, max_length=2000)
+    status: IssueStatus = "open"
+    priority: IssuePriority = "medium"
+    reporter_email: str
+    assignee_email: str | None = None
+    created_at: datetime | None = None
+    comments: list[IssueImportComment] = []
+
+class IssueImportResult(BaseModel):
+    dry_run: bool
+    records: int = 0
+    imported: int = 0
+    comments: int = 0
+    failed: int = 0
+    # Records fully handled, counted from the start of the input; pass back as `skip` to resume.
+    committed_records: int = 0
+    errors: list[dict] = []
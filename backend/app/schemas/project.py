@@ -37,3 +37,18 @@ class ProjectMemberOut(BaseModel):
     name: str
     email: EmailStr
     role: Literal["member", "maintainer"]
+
+class AssigneeLoad(BaseModel):
+    user_id: int
+    name: str | None
+    open_issues: int
+
+class ProjectStats(BaseModel):
+    open_by_priority: dict[str, int]
+    unassigned_open: int
+    oldest_open_age_seconds: int | None
+    created_last_7_days: int
+    created_last_30_days: int
+    resolved_last_7_days: int
+    resolved_last_30_days: int
+    top_assignees: list[AssigneeLoad]
@@ -1,33 +1,88 @@
+import os
+
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("ACTIVITY_WRITER", "sync")
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.api.deps import get_db
+from app.api.deps import get_session_factory, token_cache
+from app.api.admission import admission
+from app.api.authz import role_cache
+from app.core import metrics
+from app.core.config import settings
+from app.core.events import broker
+from app.crud.stats import stats_cache
+from app.db.session import ThreadedSession
 from app.models.base import Base
 
 
-@pytest.fixture()
-def client():
+def signup_and_token(client, name, email):
+    r = client.post(
+        "/api/auth/signup",
+        json={"name": name, "email": email, "password": "pass123"},
+    )
+    assert r.status_code == 200
+    return r.json()["access_token"]
+
+
+def auth_headers(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _sync_session_factory():
     engine = create_engine(
         "sqlite+pysqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     Base.metadata.create_all(bind=engine)
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+    return lambda: ThreadedSession(TestingSessionLocal()), engine.dispose
 
-    def override_get_db():
-        db = TestingSessionLocal()
-        try:
-            yield db
-        finally:
-            db.close()
 
-    app.dependency_overrides[get_db] = override_get_db
+def _async_session_factory(portal):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    async def create_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    portal.call(create_all)
+    TestingSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    return TestingSessionLocal, lambda: portal.call(engine.dispose)
+
+
+@pytest.fixture(params=["async", "sync"])
+def client(request):
     with TestClient(app) as c:
+        if request.param == "async":
+            session_factory, dispose = _async_session_factory(c.portal)
+        else:
+            session_factory, dispose = _sync_session_factory()
+
+        app.dependency_overrides[get_session_factory] = lambda: lambda readonly=False: session_factory()
+        role_cache.clear()
+        stats_cache.clear()
+        token_cache.clear()
+        metrics.reset()
+        broker.clear()
         yield c
+        app.dependency_overrides.clear()
+        dispose()
+
+
+@pytest.fixture
+def admission_budgets(monkeypatch):
+    def configure(budgets, queue_timeout=0.0, max_queued=4):
+        admission.configure(budgets, queue_timeout=queue_timeout, max_queued=max_queued, max_keys=100)
 
-    app.dependency_overrides.clear()
+    monkeypatch.setattr(settings, "ADMISSION_ENABLED", True)
+    yield configure
+    configure(settings.ADMISSION_BUDGETS, settings.ADMISSION_QUEUE_TIMEOUT_SECONDS, settings.ADMISSION_MAX_QUEUED)
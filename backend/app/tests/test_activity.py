@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+from app.api.deps import get_session_factory
+from app.crud.activity import ActivityWriter, change_rows
+from app.main import app
+from conftest import auth_headers, signup_and_token
+
+
+def test_issue_activity_records_triage_changes(client):
+    token = signup_and_token(client, "Triage", "triage@example.com")
+    member_token = signup_and_token(client, "Dev", "triage-dev@example.com")
+    headers = auth_headers(token)
+    me = client.get("/api/me", headers=headers).json()["id"]
+    dev = client.get("/api/me", headers=auth_headers(member_token)).json()["id"]
+    project_id = client.post(
+        "/api/projects", headers=headers, json={"name": "Triage", "key": "TRI", "description": "x"}
+    ).json()["id"]
+    client.post(f"/api/projects/{project_id}/members", headers=headers, json={"email": "triage-dev@example.com", "role": "member"})
+    issue_id = client.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Crash", "priority": "low"}).json()["id"]
+
+    client.patch(f"/api/issues/{issue_id}", headers=headers, json={"status": "in_progress", "assignee_id": dev, "title": "Crash on save"})
+    client.patch(f"/api/issues/{issue_id}", headers=headers, json={"priority": "low"})
+    client.patch("/api/issues/bulk", headers=headers, json={"ids": [issue_id], "patch": {"priority": "critical"}})
+
+    r = client.get(f"/api/issues/{issue_id}/activity?limit=2", headers=headers)
+    assert r.status_code == 200
+    first_page = r.json()
+    assert [(a["field"], a["old_value"], a["new_value"], a["actor_id"]) for a in first_page] == [
+        ("status", "open", "in_progress", me),
+        ("assignee_id", None, str(dev), me),
+    ]
+    rest = client.get(f"/api/issues/{issue_id}/activity?cursor={r.headers['X-Next-Cursor']}", headers=headers).json()
+    assert [(a["field"], a["old_value"], a["new_value"]) for a in rest] == [("priority", "low", "critical")]
+    exact = client.get(f"/api/issues/{issue_id}/activity?limit=3", headers=headers)
+    assert len(exact.json()) == 3 and "X-Next-Cursor" not in exact.headers
+    assert client.get(f"/api/issues/{issue_id}/activity", headers=auth_headers(signup_and_token(client, "X", "triage-x@example.com"))).status_code == 403
+
+
+def test_activity_writer_batches_and_flushes_on_stop(client):
+    token = signup_and_token(client, "Writer", "writer@example.com")
+    headers = auth_headers(token)
+    project_id = client.post(
+        "/api/projects", headers=headers, json={"name": "Writer", "key": "WRT", "description": "x"}
+    ).json()["id"]
+    issue_id = client.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Queued", "priority": "low"}).json()["id"]
+    issue = client.get(f"/api/issues/{issue_id}", headers=headers).json()
+
+    writer = ActivityWriter(batch_size=10, flush_interval=60, max_pending=3, session_factory=app.dependency_overrides[get_session_factory]())
+    rows = [change_rows(issue_id, project_id, None, SimpleNamespace(**issue), {"status": status}) for status in ("in_progress", "resolved", "closed")]
+
+    assert not writer.submit(rows[0])
+    client.portal.call(writer.start)
+    assert writer.submit(rows[0]) and writer.submit(rows[1]) and writer.submit(rows[2])
+    assert not writer.submit(rows[0])
+    assert client.get(f"/api/issues/{issue_id}/activity", headers=headers).json() == []
+
+    client.portal.call(writer.stop)
+    assert writer.written == 3 and not writer.running
+    timeline = client.get(f"/api/issues/{issue_id}/activity", headers=headers).json()
+    assert [a["new_value"] for a in timeline] == ["in_progress", "resolved", "closed"]
+
+
+def test_deleting_an_issue_drops_its_activity(client):
+    token = signup_and_token(client, "Reuse", "reuse@example.com")
+    headers = auth_headers(token)
+    project_id = client.post(
+        "/api/projects", headers=headers, json={"name": "Reuse", "key": "REU", "description": "x"}
+    ).json()["id"]
+    issue_id = client.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Old", "priority": "low"}).json()["id"]
+    client.patch(f"/api/issues/{issue_id}", headers=headers, json={"priority": "high"})
+    assert client.delete(f"/api/issues/{issue_id}", headers=headers).status_code == 200
+
+    # SQLite hands the deleted last rowid to the next insert.
+    new_id = client.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "New", "priority": "low"}).json()["id"]
+    assert new_id == issue_id
+    assert client.get(f"/api/issues/{new_id}/activity", headers=headers).json() == []
+
+    writer = ActivityWriter(batch_size=10, flush_interval=60, max_pending=10)
+    client.portal.call(writer.start)
+    before = SimpleNamespace(status="open", priority="low", assignee_id=None)
+    writer.submit(change_rows(new_id, project_id, None, before, {"priority": "high"}))
+    writer.submit(change_rows(new_id + 1, project_id, None, before, {"priority": "high"}))
+    writer.discard(new_id)
+    assert [row["issue_id"] for row in writer._pending] == [new_id + 1]
+    writer._pending.clear()
+    client.portal.call(writer.stop)
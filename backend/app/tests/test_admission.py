@@ -0,0 +1,55 @@
+import asyncio
+
+from app.api.admission import admission
+from conftest import auth_headers, signup_and_token
+
+
+def test_rate_limits_are_per_user_and_per_route_class(client, admission_budgets):
+    first = auth_headers(signup_and_token(client, "Burst", "burst@example.com"))
+    second = auth_headers(signup_and_token(client, "Calm", "calm@example.com"))
+    project_id = client.post("/api/projects", headers=first, json={"name": "Burst", "key": "BST", "description": "x"}).json()["id"]
+    admission_budgets({
+        "default": {"rate": 0.01, "burst": 2, "concurrency": 10},
+        "search": {"rate": 0.01, "burst": 1, "concurrency": 10},
+    })
+
+    url = f"/api/projects/{project_id}/issues"
+    assert client.get(url, headers=first).status_code == 200
+    assert client.get(url, headers=first).status_code == 200
+    limited = client.get(url, headers=first)
+    assert limited.status_code == 429
+    assert limited.json()["error"]["code"] == "rate_limited"
+    assert 1 <= int(limited.headers["Retry-After"]) <= 100
+
+    # Search has its own bucket, and other users are unaffected.
+    assert client.get(f"{url}?q=crash", headers=first).status_code == 200
+    assert client.get(f"{url}?q=crash", headers=first).status_code == 429
+    assert client.get("/api/me", headers=second).status_code == 200
+
+    lines = client.get("/metrics").text.splitlines()
+    assert 'admission_rejected_total{route_class="default",reason="rate"} 1' in lines
+    assert 'admission_rejected_total{route_class="search",reason="rate"} 1' in lines
+
+
+def test_concurrency_cap_queues_then_fast_fails(client, admission_budgets):
+    admission_budgets({"export": {"rate": 100, "burst": 100, "concurrency": 1}}, queue_timeout=0.05, max_queued=1)
+    state = admission.classes["export"]
+
+    async def scenario():
+        assert await admission.acquire(state)
+        assert not await admission.acquire(state)  # times out in the queue
+        queued = asyncio.ensure_future(admission.acquire(state))
+        await asyncio.sleep(0)
+        assert dict(admission.stats())[("export", "queued")] == 1
+        assert not await admission.acquire(state)  # queue full: rejected without waiting
+        admission.release(state)
+        assert await queued
+        assert state.in_flight == 1
+        admission.release(state)
+        assert state.in_flight == 0 and not state.waiters
+
+    client.portal.call(scenario)
+    assert admission.classify("GET", "/api/projects/3/issues/export", b"format=csv") == "export"
+    assert admission.classify("POST", "/api/auth/login", b"") == "login"
+    assert admission.classify("GET", "/api/projects/3/issues", b"q=") == "default"
+    assert admission.classify("GET", "/metrics", b"") is None
@@ -7,3 +7,54 @@ def test_signup_and_login(client):
     r2 = client.post("/api/auth/login", json={"email": "alice@example.com", "password": "pass123"})
     assert r2.status_code == 200
     assert r2.json().get("access_token")
+
+
+def test_verified_tokens_are_cached(client, monkeypatch):
+    import threading
+
+    from app.api import deps
+    from app.api.deps import token_cache
+
+    token = client.post("/api/auth/signup", json={"name": "Bob", "email": "bob@example.com", "password": "pass123"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/api/projects", headers=headers).status_code == 200
+    hits = token_cache.hits
+    assert client.get("/api/projects", headers=headers).status_code == 200
+    assert token_cache.hits == hits + 1
+
+    me = client.get("/api/me", headers=headers)
+    assert me.status_code == 200
+    assert me.json()["email"] == "bob@example.com"
+
+    assert client.get("/api/projects", headers={"Authorization": "Bearer not-a-token"}).status_code == 401
+
+    # Authentication is a cache hit or a JWT decode, so it runs on the event loop, not a worker thread.
+    threads = []
+    principal_from_token = deps.principal_from_token
+    monkeypatch.setattr(deps, "principal_from_token", lambda t: threads.append(threading.current_thread()) or principal_from_token(t))
+    assert client.get("/api/me", headers=headers).status_code == 200
+    assert threads and not threads[0].name.startswith("AnyIO worker")
+
+
+def test_login_hashes_on_the_process_pool_and_recovers_when_it_breaks(client, monkeypatch):
+    from app.core import security
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    security.shutdown_hash_pool()
+    try:
+        credentials = {"email": "pool@example.com", "password": "pass123"}
+        assert client.post("/api/auth/signup", json={"name": "Pool", **credentials}).status_code == 200
+        assert client.post("/api/auth/login", json=credentials).status_code == 200
+        pool = security._hash_pool
+        assert pool is not None
+
+        for process in list(pool._processes.values()):
+            process.kill()
+            process.join()
+        assert client.post("/api/auth/login", json=credentials).status_code == 200
+        assert client.post("/api/auth/login", json={**credentials, "password": "wrong"}).status_code == 401
+        assert security._hash_pool is not pool
+    finally:
+        security.shutdown_hash_pool()
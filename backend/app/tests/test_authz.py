@@ -0,0 +1,32 @@
+from app.api.authz import role_cache
+from conftest import auth_headers, signup_and_token
+
+
+def test_role_cache_is_invalidated_by_member_changes(client):
+    owner_token = signup_and_token(client, "Owner", "cache-owner@example.com")
+    other_token = signup_and_token(client, "Other", "cache-other@example.com")
+    other_id = client.get("/api/me", headers=auth_headers(other_token)).json()["id"]
+
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(owner_token),
+        json={"name": "Cache", "key": "CCH1", "description": "x"},
+    ).json()["id"]
+    members_url = f"/api/projects/{project_id}/members"
+
+    assert client.get(members_url, headers=auth_headers(other_token)).status_code == 403
+
+    client.post(members_url, headers=auth_headers(owner_token), json={"email": "cache-other@example.com", "role": "member"})
+    assert client.get(members_url, headers=auth_headers(other_token)).status_code == 200
+
+    hits = role_cache.hits
+    assert client.get(members_url, headers=auth_headers(other_token)).status_code == 200
+    assert role_cache.hits == hits + 1
+
+    onboard = {"name": "New", "email": "cache-new@example.com", "password": "pass123", "role": "member"}
+    assert client.post(f"{members_url}/onboard", headers=auth_headers(other_token), json=onboard).status_code == 403
+    client.patch(f"{members_url}/{other_id}", headers=auth_headers(owner_token), json={"role": "maintainer"})
+    assert client.post(f"{members_url}/onboard", headers=auth_headers(other_token), json=onboard).status_code == 200
+
+    client.delete(f"{members_url}/{other_id}", headers=auth_headers(owner_token))
+    assert client.get(members_url, headers=auth_headers(other_token)).status_code == 403
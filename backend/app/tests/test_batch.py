@@ -0,0 +1,68 @@
+from app.db.querycount import assert_max_queries
+from conftest import auth_headers, signup_and_token
+
+
+def test_batch_runs_reads_with_one_principal_and_session(client):
+    token = signup_and_token(client, "Batcher", "batcher@example.com")
+    outsider = signup_and_token(client, "Outsider", "batch-outsider@example.com")
+    headers = auth_headers(token)
+    project_id = client.post("/api/projects", headers=headers, json={"name": "Batch", "key": "BAT", "description": "x"}).json()["id"]
+    issue_id = client.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Batched", "priority": "high"}).json()["id"]
+    client.post(f"/api/issues/{issue_id}/comments", headers=headers, json={"body": "first"})
+    etag = client.get(f"/api/issues/{issue_id}", headers=headers).headers["ETag"]
+
+    # The user row is loaded once and membership comes from the role cache, so no sub-request repeats a lookup.
+    with assert_max_queries(7):
+        r = client.post("/api/batch", headers=headers, json={"requests": [
+            {"id": "me", "path": "/api/me"},
+            {"id": "issue", "path": f"/api/issues/{issue_id}", "if_none_match": etag},
+            {"id": "comments", "path": f"/api/issues/{issue_id}/comments?fields=body"},
+            {"id": "members", "path": f"/api/projects/{project_id}/members"},
+            {"id": "missing", "path": "/api/issues/999999"},
+            {"id": "nowhere", "path": "/api/nowhere"},
+            {"id": "stream", "path": f"/api/issues/{issue_id}/events"},
+        ]})
+    assert r.status_code == 200
+    results = {item["id"]: item for item in r.json()["responses"]}
+    assert list(results) == ["me", "issue", "comments", "members", "missing", "nowhere", "stream"]
+    assert results["me"]["status"] == 200 and results["me"]["body"]["email"] == "batcher@example.com"
+    assert results["issue"]["status"] == 304 and results["issue"]["body"] is None
+    assert results["issue"]["headers"]["etag"] == etag
+    assert results["comments"]["body"] == [{"id": results["comments"]["body"][0]["id"], "body": "first"}]
+    assert "etag" in results["comments"]["headers"]
+    assert [m["email"] for m in results["members"]["body"]] == ["batcher@example.com"]
+    assert results["missing"]["status"] == 404
+    assert results["nowhere"]["status"] == 404
+    assert results["stream"]["status"] == 400
+
+    denied = client.post("/api/batch", headers=auth_headers(outsider), json={"requests": [{"path": f"/api/issues/{issue_id}"}]})
+    assert [item["status"] for item in denied.json()["responses"]] == [403]
+    assert client.post("/api/batch", json={"requests": [{"path": "/api/me"}]}).status_code == 401
+    assert client.post("/api/batch", headers=headers, json={"requests": [{"path": "/api/me", "method": "POST"}]}).status_code == 422
+    assert client.post("/api/batch", headers=headers, json={"requests": [{"path": "/api/me"}] * 21}).status_code == 422
+
+
+def test_batch_sub_requests_are_admitted_and_counted_per_route(client, admission_budgets):
+    headers = auth_headers(signup_and_token(client, "Searcher", "batch-search@example.com"))
+    project_id = client.post("/api/projects", headers=headers, json={"name": "Search", "key": "BSE", "description": "x"}).json()["id"]
+    admission_budgets({
+        "default": {"rate": 0.01, "burst": 3, "concurrency": 10},
+        "search": {"rate": 0.01, "burst": 2, "concurrency": 10},
+    })
+
+    url = f"/api/projects/{project_id}/issues"
+    r = client.post("/api/batch", headers=headers, json={"requests": [{"path": f"{url}?q=crash{n}"} for n in range(20)]})
+    assert r.status_code == 200
+    statuses = [item["status"] for item in r.json()["responses"]]
+    assert statuses == [200, 200] + [429] * 18
+    assert "retry-after" in r.json()["responses"][-1]["headers"]
+
+    # The batch took one default token and its plain read another.
+    assert [item["status"] for item in client.post("/api/batch", headers=headers, json={"requests": [{"path": url}]}).json()["responses"]] == [200]
+    assert client.post("/api/batch", headers=headers, json={"requests": [{"path": url}]}).status_code == 429
+
+    lines = client.get("/metrics").text.splitlines()
+    route = 'method="GET",route="/api/projects/{project_id}/issues"'
+    assert f'http_requests_total{{{route},status="2xx"}} 3' in lines
+    assert f'http_requests_total{{{route},status="4xx"}} 18' in lines
+    assert 'admission_rejected_total{route_class="search",reason="rate"} 18' in lines
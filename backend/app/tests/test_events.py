@@ -0,0 +1,106 @@
+import json
+
+from app.api.events import event_stream
+from app.core.events import EventBroker, broker
+from conftest import auth_headers, signup_and_token
+
+
+def parse_sse(frame: bytes) -> dict:
+    fields = dict(line.split(": ", 1) for line in frame.decode().strip().splitlines() if not line.startswith(":"))
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+def test_event_stream_pushes_changes_and_resumes_from_last_event_id(client):
+    token = signup_and_token(client, "Live", "live@example.com")
+    outsider = signup_and_token(client, "Outsider", "live-outsider@example.com")
+    headers = auth_headers(token)
+    project_id = client.post(
+        "/api/projects", headers=headers, json={"name": "Live", "key": "LIVE", "description": "x"}
+    ).json()["id"]
+
+    assert client.get(f"/api/projects/{project_id}/events", headers=auth_headers(outsider)).status_code == 403
+    assert client.get("/api/issues/999/events", headers=headers).status_code == 404
+
+    stream = event_stream(("project", project_id), None, heartbeat=0.05)
+    assert client.portal.call(stream.__anext__) == b"retry: 3000\n\n"
+
+    issue_id = client.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Live", "priority": "low"}).json()["id"]
+    client.patch(f"/api/issues/{issue_id}", headers=headers, json={"status": "in_progress"})
+    client.post(f"/api/issues/{issue_id}/comments", headers=headers, json={"body": "on it"})
+    client.delete(f"/api/issues/{issue_id}", headers=headers)
+
+    frames = [parse_sse(client.portal.call(stream.__anext__)) for _ in range(4)]
+    assert [f["event"] for f in frames] == ["issue.created", "issue.updated", "comment.created", "issue.deleted"]
+    assert frames[1]["data"]["status"] == "in_progress" and frames[1]["data"]["changed"] == ["status"]
+    assert frames[2]["data"]["body"] == "on it" and frames[2]["data"]["author_name"] == "Live"
+    assert client.portal.call(stream.__anext__) == b": keepalive\n\n"
+    client.portal.call(stream.aclose)
+
+    resumed = event_stream(("project", project_id), frames[1]["id"], heartbeat=0.05)
+    client.portal.call(resumed.__anext__)
+    replayed = [parse_sse(client.portal.call(resumed.__anext__)) for _ in range(2)]
+    assert [f["id"] for f in replayed] == [frames[2]["id"], frames[3]["id"]]
+    client.portal.call(resumed.aclose)
+
+    stale = event_stream(("project", project_id), "1-1", heartbeat=0.05)
+    client.portal.call(stale.__anext__)
+    assert parse_sse(client.portal.call(stale.__anext__))["event"] == "reset"
+    client.portal.call(stale.aclose)
+
+
+def test_event_broker_evicts_slow_subscribers_and_bounds_replay():
+    broker = EventBroker(queue_size=2, history_size=3)
+    slow = broker.subscribe(("project", 1))
+    other = broker.subscribe(("issue", 7))
+    events = [broker.publish("issue.updated", 1, 5, {"n": n}) for n in range(3)]
+
+    assert slow.evicted and broker.evictions == 1
+    assert slow.queue.get_nowait() is None
+    assert not other.evicted and other.queue.empty()
+    assert broker.subscriber_count() == 1
+
+    assert [e.seq for e in broker.replay(("issue", 5), events[0].id)] == [2, 3]
+    broker.publish("issue.updated", 1, 5, {"n": 3})
+    broker.publish("issue.updated", 1, 5, {"n": 4})
+    assert broker.replay(("issue", 5), events[0].id) is None
+    assert broker.replay(("issue", 5), "0-1") is None
+
+
+def test_bulk_writes_publish_one_event_per_project(client):
+    token = signup_and_token(client, "Bulk Live", "bulk-live@example.com")
+    headers = auth_headers(token)
+    project_id = client.post(
+        "/api/projects", headers=headers, json={"name": "Bulk Live", "key": "BLIVE", "description": "x"}
+    ).json()["id"]
+    subscription = broker.subscribe(("project", project_id))
+
+    # More issues than a subscriber queue holds.
+    created = client.post(
+        f"/api/projects/{project_id}/issues/bulk",
+        headers=headers,
+        json={"issues": [{"title": f"issue {n}"} for n in range(300)]},
+    ).json()
+    ids = [r["issue"]["id"] for r in created["results"]]
+    issue_subscription = broker.subscribe(("issue", ids[0]))
+    imported = client.post(
+        f"/api/projects/{project_id}/issues/import",
+        headers=headers,
+        content=json.dumps({"title": "c", "reporter_email": "bulk-live@example.com"}),
+    )
+    assert imported.json()["imported"] == 1
+    client.patch("/api/issues/bulk", headers=headers, json={"ids": ids[:2], "patch": {"priority": "high"}})
+
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    broker.unsubscribe(subscription)
+    assert not subscription.evicted
+    assert [e.type for e in events] == ["issues.bulk_created", "issues.bulk_created", "issues.bulk_updated"]
+    assert json.loads(events[0].data)["ids"] == ids
+    assert len(json.loads(events[1].data)["ids"]) == 1
+    assert json.loads(events[2].data) == {"project_id": project_id, "ids": ids[:2], "changed": ["priority"]}
+    assert [e.type for e in [issue_subscription.queue.get_nowait()]] == ["issues.bulk_updated"]
+    assert issue_subscription.queue.empty()
+    broker.unsubscribe(issue_subscription)
@@ -0,0 +1,42 @@
+import csv
+import io
+import json
+
+from conftest import auth_headers, signup_and_token
+
+
+def test_issue_export_streams_ndjson_and_csv(client):
+    token = signup_and_token(client, "Auditor", "auditor@example.com")
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Audit", "key": "AUD1", "description": "x"},
+    ).json()["id"]
+    client.post(
+        f"/api/projects/{project_id}/issues/bulk",
+        headers=auth_headers(token),
+        json={"issues": [{"title": f"row {n}", "priority": "high" if n % 2 else "low"} for n in range(5)]},
+    )
+    first_id = client.get(f"/api/projects/{project_id}/issues?sort=priority", headers=auth_headers(token)).json()[0]["id"]
+    client.post(f"/api/issues/{first_id}/comments", headers=auth_headers(token), json={"body": "checked, with comma"})
+
+    ndjson = client.get(
+        f"/api/projects/{project_id}/issues/export?format=ndjson&priority=high&include_comments=true",
+        headers=auth_headers(token),
+    )
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [r["title"] for r in rows] == ["row 1", "row 3"]
+    assert all(r["comments"] == [] for r in rows)
+
+    exported = client.get(
+        f"/api/projects/{project_id}/issues/export?format=csv&include_comments=true",
+        headers=auth_headers(token),
+    )
+    records = list(csv.DictReader(io.StringIO(exported.text)))
+    assert len(records) == 5
+    commented = next(r for r in records if int(r["id"]) == first_id)
+    assert json.loads(commented["comments"])[0]["body"] == "checked, with comma"
+
+    assert client.get(f"/api/projects/{project_id}/issues/export?format=xml", headers=auth_headers(token)).status_code == 422
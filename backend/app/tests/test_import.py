@@ -0,0 +1,114 @@
+import json
+
+from conftest import auth_headers, signup_and_token
+
+
+def test_issue_import_streams_batches_with_dry_run_and_resume(client):
+    token = signup_and_token(client, "Migrator", "migrator@example.com")
+    signup_and_token(client, "Outsider", "outsider@example.com")
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Legacy", "key": "LEG1", "description": "x"},
+    ).json()["id"]
+    records = [
+        {"title": "ok 0", "reporter_email": "migrator@example.com", "status": "closed",
+         "comments": [{"author_email": "outsider@example.com", "body": "legacy note"}]},
+        "not json",
+        {"title": "ok 1", "reporter_email": "migrator@example.com", "assignee_email": "migrator@example.com"},
+        {"title": "bad reporter", "reporter_email": "ghost@example.com"},
+        {"title": "bad assignee", "reporter_email": "migrator@example.com", "assignee_email": "outsider@example.com"},
+        {"title": "ok 2", "reporter_email": "migrator@example.com", "created_at": "2020-01-02T03:04:05Z"},
+    ]
+    body = "\n".join(r if isinstance(r, str) else json.dumps(r) for r in records)
+    url = f"/api/projects/{project_id}/issues/import?batch_size=2"
+
+    dry = client.post(f"{url}&dry_run=true", headers=auth_headers(token), content=body)
+    assert dry.status_code == 200
+    assert dry.json()["imported"] == 3 and dry.json()["failed"] == 3
+    assert client.get(f"/api/projects/{project_id}/issues/facets", headers=auth_headers(token)).json()["total"] == 0
+
+    resumed = client.post(f"{url}&skip=2", headers=auth_headers(token), content=body).json()
+    assert resumed["records"] == 4
+    assert resumed["imported"] == 2
+    assert resumed["committed_records"] == 6
+    assert [e["record"] for e in resumed["errors"]] == [3, 4]
+
+    first = client.post(url, headers=auth_headers(token), content="\n".join(body.splitlines()[:2])).json()
+    assert first["imported"] == 1 and first["comments"] == 1
+
+    issues = client.get(f"/api/projects/{project_id}/issues?sort=created_at", headers=auth_headers(token)).json()
+    assert sorted(i["title"] for i in issues) == ["ok 0", "ok 1", "ok 2"]
+    assert issues[-1]["created_at"] == "2020-01-02T03:04:05"
+    facets = client.get(f"/api/projects/{project_id}/issues/facets", headers=auth_headers(token)).json()
+    assert facets["total"] == 3 and facets["status"] == {"open": 2, "closed": 1}
+
+    csv_body = "title,reporter_email,priority\ncsv row,migrator@example.com,high\n"
+    from_csv = client.post(
+        f"/api/projects/{project_id}/issues/import?format=csv", headers=auth_headers(token), content=csv_body
+    ).json()
+    assert from_csv["imported"] == 1
+
+
+def test_issue_import_reports_committed_records_when_a_batch_fails(client, monkeypatch):
+    from sqlalchemy.exc import OperationalError
+
+    from app.crud import issue_import
+
+    token = signup_and_token(client, "Migrator", "migrator@example.com")
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Legacy", "key": "LEG2", "description": "x"},
+    ).json()["id"]
+    body = "\n".join(json.dumps({"title": f"row {n}", "reporter_email": "migrator@example.com"}) for n in range(5))
+    url = f"/api/projects/{project_id}/issues/import?batch_size=2"
+
+    insert_issue_rows = issue_import.insert_issue_rows
+    calls = []
+
+    async def flaky_insert(db, project_id, rows):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise OperationalError("INSERT INTO issues", {}, Exception("database is locked"))
+        return await insert_issue_rows(db, project_id, rows)
+
+    monkeypatch.setattr(issue_import, "insert_issue_rows", flaky_insert)
+    failed = client.post(url, headers=auth_headers(token), content=body)
+    assert failed.status_code == 500
+    error = failed.json()["error"]
+    assert error["code"] == "import_failed"
+    assert error["details"]["committed_records"] == 2
+    assert error["details"]["imported"] == 2
+
+    resumed = client.post(f"{url}&skip=2", headers=auth_headers(token), content=body).json()
+    assert resumed["imported"] == 3 and resumed["committed_records"] == 5
+    issues = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers(token)).json()
+    assert sorted(i["title"] for i in issues) == [f"row {n}" for n in range(5)]
+
+
+def test_issue_import_reports_field_errors_and_unreadable_input(client):
+    token = signup_and_token(client, "Migrator", "migrator@example.com")
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Legacy", "key": "LEG3", "description": "x"},
+    ).json()["id"]
+    url = f"/api/projects/{project_id}/issues/import?batch_size=10"
+
+    invalid = client.post(url, headers=auth_headers(token), content=json.dumps({"reporter_email": "migrator@example.com", "priority": "urgent"}))
+    messages = invalid.json()["errors"][0]["message"].split("; ")
+    assert messages[0] == "title: Field required"
+    assert messages[1].startswith("priority: ")
+
+    # Well past the text decoder's first read, so earlier batches commit before the bad byte is reached.
+    rows = [json.dumps({"title": f"row {n}", "description": "x" * 300, "reporter_email": "migrator@example.com"}) for n in range(50)]
+    body = ("\n".join(rows) + "\n").encode() + b'{"title": "\xff"}\n'
+    r = client.post(url, headers=auth_headers(token), content=body)
+    assert r.status_code == 400
+    error = r.json()["error"]
+    assert error["code"] == "invalid_import_file" and "utf-8" in error["message"]
+    committed = error["details"]["committed_records"]
+    assert 0 < committed < 50 and committed % 10 == 0
+    issues = client.get(f"/api/projects/{project_id}/issues?limit=100", headers=auth_headers(token)).json()
+    assert len(issues) == committed
@@ -0,0 +1,27 @@
+from conftest import auth_headers, signup_and_token
+
+
+def test_metrics_endpoint_reports_route_latency_and_db_queries(client):
+    token = signup_and_token(client, "Metrics", "metrics@example.com")
+    proj = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Metrics", "key": "MET", "description": "x"},
+    )
+    project_id = proj.json()["id"]
+    for _ in range(3):
+        assert client.get(f"/api/projects/{project_id}/issues", headers=auth_headers(token)).status_code == 200
+    assert client.get("/api/projects/999/issues", headers=auth_headers(token)).status_code == 403
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = r.text.splitlines()
+    route = 'method="GET",route="/api/projects/{project_id}/issues"'
+    assert f"http_requests_total{{{route},status=\"2xx\"}} 3" in lines
+    assert f"http_requests_total{{{route},status=\"4xx\"}} 1" in lines
+    assert f"http_request_duration_seconds_count{{{route}}} 4" in lines
+    assert f'http_request_duration_seconds_bucket{{{route},le="+Inf"}} 4' in lines
+    queries = next(line for line in lines if line.startswith(f"db_queries_per_request_sum{{{route}}}"))
+    assert float(queries.split()[-1]) >= 3
+    assert any(line.startswith("db_queries_total ") for line in lines)
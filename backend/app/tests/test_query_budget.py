@@ -0,0 +1,56 @@
+import logging
+
+import pytest
+
+from app.core.config import settings
+from app.db.querycount import QueryBudgetExceeded, assert_max_queries
+from conftest import auth_headers, signup_and_token
+
+
+def test_endpoints_stay_within_query_budgets(client):
+    token = signup_and_token(client, "Budget", "budget@example.com")
+    signup_and_token(client, "Other", "budget-other@example.com")
+    headers = auth_headers(token)
+
+    with assert_max_queries(3):
+        project_id = client.post(
+            "/api/projects", headers=headers, json={"name": "Budget", "key": "BUD", "description": "x"}
+        ).json()["id"]
+    client.post(f"/api/projects/{project_id}/members", headers=headers, json={"email": "budget-other@example.com", "role": "maintainer"})
+    issue_id = client.post(f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Budget", "priority": "low"}).json()["id"]
+
+    with assert_max_queries(3):
+        assert client.post(f"/api/issues/{issue_id}/comments", headers=headers, json={"body": "hi"}).status_code == 200
+    with assert_max_queries(2):
+        assert client.get(f"/api/issues/{issue_id}/comments", headers=headers).status_code == 200
+    with assert_max_queries(2):
+        assert client.get(f"/api/projects/{project_id}/issues", headers=headers).status_code == 200
+    # 4 plus the inline activity insert of the sync writer used in tests.
+    with assert_max_queries(5):
+        assert client.patch(f"/api/issues/{issue_id}", headers=headers, json={"status": "closed"}).status_code == 200
+    other_id = next(m["user_id"] for m in client.get(f"/api/projects/{project_id}/members", headers=headers).json() if m["email"] == "budget-other@example.com")
+    with assert_max_queries(3):
+        assert client.delete(f"/api/projects/{project_id}/members/{other_id}", headers=headers).status_code == 200
+
+    with pytest.raises(QueryBudgetExceeded, match="SELECT"):
+        with assert_max_queries(1):
+            client.get(f"/api/issues/{issue_id}/comments?limit=10", headers=headers)
+
+
+def test_requests_over_query_budget_are_logged(client, monkeypatch, caplog):
+    token = signup_and_token(client, "Logged", "logged@example.com")
+    headers = auth_headers(token)
+    project_id = client.post(
+        "/api/projects", headers=headers, json={"name": "Logged", "key": "LOG", "description": "x"}
+    ).json()["id"]
+
+    monkeypatch.setattr(settings, "QUERY_BUDGET", 1)
+    monkeypatch.setattr(settings, "QUERY_BUDGET_OVERRIDES", {"GET /api/projects/{project_id}/members": 5})
+    with caplog.at_level(logging.WARNING, logger="app.query_budget"):
+        client.get(f"/api/projects/{project_id}/members", headers=headers)
+        assert not caplog.records
+        client.get(f"/api/projects/{project_id}/issues", headers=headers)
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert f"GET /api/projects/{project_id}/issues ran 2 queries (budget 1)" in message
+    assert "SELECT projects.version" in message
@@ -0,0 +1,35 @@
+import orjson
+from fastapi import Response
+
+from app.api.responses import rows_response
+from conftest import auth_headers, signup_and_token
+
+
+def test_rows_response_keeps_injected_headers():
+    injected = Response()
+    injected.headers["ETag"] = '"abc"'
+    injected.headers["X-Next-Cursor"] = "next"
+    fast = rows_response([{"id": 1, "title": "a"}], injected)
+
+    assert orjson.loads(fast.body) == [{"id": 1, "title": "a"}]
+    assert fast.headers["etag"] == '"abc"'
+    assert fast.headers["x-next-cursor"] == "next"
+    assert fast.headers["content-type"] == "application/json"
+
+
+def test_list_rows_match_the_validated_schemas(client):
+    token = signup_and_token(client, "Rows", "rows@example.com")
+    headers = auth_headers(token)
+    project_id = client.post("/api/projects", headers=headers, json={"name": "Rows", "key": "ROW", "description": "x"}).json()["id"]
+    issue_id = client.post(
+        f"/api/projects/{project_id}/issues", headers=headers, json={"title": "Row", "description": "d", "priority": "high"}
+    ).json()["id"]
+    comment = client.post(f"/api/issues/{issue_id}/comments", headers=headers, json={"body": "hello"}).json()
+
+    # Single-item routes still go through response_model; the list fast path must encode identically.
+    assert client.get(f"/api/projects/{project_id}/issues", headers=headers).json() == [
+        client.get(f"/api/issues/{issue_id}", headers=headers).json()
+    ]
+    assert client.get(f"/api/issues/{issue_id}/comments", headers=headers).json() == [comment]
+    members = client.get(f"/api/projects/{project_id}/members", headers=headers).json()
+    assert members == [{"user_id": members[0]["user_id"], "name": "Rows", "email": "rows@example.com", "role": "maintainer"}]
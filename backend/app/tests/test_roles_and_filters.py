@@ -1,14 +1,15 @@
-def signup_and_token(client, name, email):
-    r = client.post(
-        "/api/auth/signup",
-        json={"name": name, "email": email, "password": "pass123"},
-    )
-    assert r.status_code == 200
-    return r.json()["access_token"]
+from datetime import datetime
 
+from sqlalchemy import create_engine, update
 
-def auth_headers(token):
-    return {"Authorization": f"Bearer {token}"}
+from app.api.deps import get_session_factory
+from app.crud.facets import rebuild_facet_counts
+from app.crud.issue import ISSUE_COLUMNS, _apply_keyset, encode_cursor, filter_project_issues
+from app.db import base  # noqa: F401
+from app.db.querycount import count_queries
+from app.models.base import Base
+from app.models.issue_facet import IssueFacetCount
+from conftest import auth_headers, signup_and_token
 
 
 def test_maintainer_can_change_assignee_but_member_cannot(client):
@@ -168,3 +169,422 @@ def test_maintained_projects_and_onboard_member(client):
         json={"name": "New User", "email": "newuser@example.com", "password": "pass123", "role": "member"},
     )
     assert onboard.status_code == 200
+
+
+def test_issue_cursor_pagination_covers_every_sort(client):
+    token = signup_and_token(client, "Pager", "pager@example.com")
+    proj = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Pages", "key": "PGS1", "description": "x"},
+    )
+    project_id = proj.json()["id"]
+
+    priorities = ["low", "high", "medium", "critical", "high", "low", "medium"]
+    for i, priority in enumerate(priorities):
+        client.post(
+            f"/api/projects/{project_id}/issues",
+            headers=auth_headers(token),
+            json={"title": f"issue {i}", "priority": priority},
+        )
+
+    for sort in ("created_at", "priority", "status"):
+        seen = []
+        cursor = None
+        while True:
+            url = f"/api/projects/{project_id}/issues?sort={sort}&limit=3"
+            if cursor:
+                url += f"&cursor={cursor}"
+            page = client.get(url, headers=auth_headers(token))
+            assert page.status_code == 200
+            seen.extend(i["id"] for i in page.json())
+            cursor = page.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        full = client.get(f"/api/projects/{project_id}/issues?sort={sort}&limit=100", headers=auth_headers(token))
+        assert seen == [i["id"] for i in full.json()]
+        assert len(seen) == len(priorities)
+
+    bad = client.get(f"/api/projects/{project_id}/issues?cursor=garbage", headers=auth_headers(token))
+    assert bad.status_code == 400
+    assert bad.json()["error"]["code"] == "invalid_cursor"
+
+
+def test_issue_keyset_queries_are_served_by_indexes():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    base = filter_project_issues(None, 1, None, None, None, None).with_only_columns(*ISSUE_COLUMNS)
+    with engine.connect() as conn:
+        for mode, key in (("created_at", datetime(2026, 1, 1)), ("priority", 2), ("status", 3)):
+            for cursor in (None, encode_cursor(mode, key, 10)):
+                compiled = _apply_keyset(base, mode, cursor).limit(21).compile(engine)
+                params = tuple(compiled.params[name] for name in compiled.positiontup)
+                plan = " | ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params))
+                assert "TEMP B-TREE" not in plan, (mode, plan)
+                assert "USING INDEX ix_issues_project_" in plan, (mode, plan)
+    engine.dispose()
+
+
+def test_issue_search_covers_description_and_stays_in_sync(client):
+    token = signup_and_token(client, "Searcher", "searcher@example.com")
+    proj = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Search", "key": "SRC1", "description": "x"},
+    )
+    project_id = proj.json()["id"]
+
+    def create(title, description):
+        r = client.post(
+            f"/api/projects/{project_id}/issues",
+            headers=auth_headers(token),
+            json={"title": title, "description": description},
+        )
+        return r.json()["id"]
+
+    weak = create("Dashboard glitch", "Happens after a timeout on reload")
+    strong = create("Timeout on login", "Login request timeout when token expires")
+    create("Unrelated", "Nothing to see")
+
+    def search(q):
+        r = client.get(f"/api/projects/{project_id}/issues?q={q}", headers=auth_headers(token))
+        assert r.status_code == 200
+        return [i["id"] for i in r.json()]
+
+    assert search("timeout") == [strong, weak]
+    assert search("time") == [strong, weak]
+
+    client.patch(f"/api/issues/{weak}", headers=auth_headers(token), json={"description": "Renders blank"})
+    assert search("timeout") == [strong]
+    assert search("blank") == [weak]
+
+    client.delete(f"/api/issues/{strong}", headers=auth_headers(token))
+    assert search("timeout") == []
+
+
+def test_bulk_issue_create_reports_per_item(client):
+    token = signup_and_token(client, "Bulk", "bulk@example.com")
+    outsider_token = signup_and_token(client, "Outsider", "bulk-outsider@example.com")
+    me_id = client.get("/api/me", headers=auth_headers(token)).json()["id"]
+    outsider_id = client.get("/api/me", headers=auth_headers(outsider_token)).json()["id"]
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Bulk", "key": "BLK1", "description": "x"},
+    ).json()["id"]
+
+    r = client.post(
+        f"/api/projects/{project_id}/issues/bulk",
+        headers=auth_headers(token),
+        json={
+            "issues": [
+                {"title": "first", "priority": "high", "assignee_id": me_id},
+                {"title": "bad assignee", "assignee_id": outsider_id},
+                {"title": "third"},
+            ]
+        },
+    )
+    assert r.status_code == 200
+    body = r.json()
+    assert body["created"] == 2
+    assert [item["ok"] for item in body["results"]] == [True, False, True]
+    assert body["results"][0]["issue"]["assignee_id"] == me_id
+    assert body["results"][0]["issue"]["status"] == "open"
+    assert body["results"][1]["error"]["code"] == "invalid_assignee"
+    assert body["results"][2]["issue"]["priority"] == "medium"
+
+    listed = client.get(f"/api/projects/{project_id}/issues", headers=auth_headers(token)).json()
+    assert sorted(i["title"] for i in listed) == ["first", "third"]
+
+    forbidden = client.post(
+        f"/api/projects/{project_id}/issues/bulk",
+        headers=auth_headers(outsider_token),
+        json={"issues": [{"title": "nope"}]},
+    )
+    assert forbidden.status_code == 403
+
+
+def test_bulk_issue_update_by_ids_and_filter(client):
+    maintainer_token = signup_and_token(client, "Triage", "triage@example.com")
+    member_token = signup_and_token(client, "Helper", "helper@example.com")
+    member_id = client.get("/api/me", headers=auth_headers(member_token)).json()["id"]
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(maintainer_token),
+        json={"name": "Triage", "key": "TRI1", "description": "x"},
+    ).json()["id"]
+    client.post(
+        f"/api/projects/{project_id}/members",
+        headers=auth_headers(maintainer_token),
+        json={"email": "helper@example.com", "role": "member"},
+    )
+    ids = [
+        i["issue"]["id"]
+        for i in client.post(
+            f"/api/projects/{project_id}/issues/bulk",
+            headers=auth_headers(maintainer_token),
+            json={"issues": [{"title": "crash a", "priority": "high"}, {"title": "crash b", "priority": "high"}, {"title": "typo", "priority": "low"}]},
+        ).json()["results"]
+    ]
+
+    by_ids = client.patch(
+        "/api/issues/bulk",
+        headers=auth_headers(maintainer_token),
+        json={"ids": ids[:2] + [999999], "patch": {"status": "closed", "assignee_id": member_id}},
+    )
+    assert by_ids.status_code == 200
+    assert by_ids.json() == {"updated": ids[:2], "forbidden": [], "not_found": [999999]}
+    issue = client.get(f"/api/issues/{ids[0]}", headers=auth_headers(maintainer_token)).json()
+    assert issue["status"] == "closed"
+    assert issue["assignee_id"] == member_id
+
+    member_attempt = client.patch(
+        "/api/issues/bulk",
+        headers=auth_headers(member_token),
+        json={"ids": ids, "patch": {"status": "open"}},
+    )
+    assert member_attempt.json()["forbidden"] == ids
+    assert member_attempt.json()["updated"] == []
+
+    by_filter = client.patch(
+        "/api/issues/bulk",
+        headers=auth_headers(maintainer_token),
+        json={"project_id": project_id, "filter": {"priority": "low"}, "patch": {"priority": "medium"}},
+    )
+    assert by_filter.json()["updated"] == [ids[2]]
+
+    invalid = client.patch(
+        "/api/issues/bulk",
+        headers=auth_headers(maintainer_token),
+        json={"ids": ids, "filter": {"priority": "low"}, "project_id": project_id, "patch": {"priority": "low"}},
+    )
+    assert invalid.status_code == 422
+
+
+def test_comment_pagination_and_since_cursor(client):
+    token = signup_and_token(client, "Commenter", "commenter@example.com")
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Talk", "key": "TLK1", "description": "x"},
+    ).json()["id"]
+    issue_id = client.post(
+        f"/api/projects/{project_id}/issues",
+        headers=auth_headers(token),
+        json={"title": "Incident", "description": "d", "priority": "high"},
+    ).json()["id"]
+    for n in range(5):
+        created = client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers(token), json={"body": f"update {n}"})
+        assert created.json()["author_name"] == "Commenter"
+
+    first = client.get(f"/api/issues/{issue_id}/comments?limit=3", headers=auth_headers(token))
+    assert [c["body"] for c in first.json()] == ["update 0", "update 1", "update 2"]
+    assert all(c["author_name"] == "Commenter" for c in first.json())
+    second = client.get(
+        f"/api/issues/{issue_id}/comments?limit=3&cursor={first.headers['X-Next-Cursor']}",
+        headers=auth_headers(token),
+    )
+    assert [c["body"] for c in second.json()] == ["update 3", "update 4"]
+    assert "X-Next-Cursor" not in second.headers
+
+    last_seen = second.headers["X-Last-Cursor"]
+    assert client.get(f"/api/issues/{issue_id}/comments?since={last_seen}", headers=auth_headers(token)).json() == []
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers(token), json={"body": "resolved"})
+    newer = client.get(f"/api/issues/{issue_id}/comments?since={last_seen}", headers=auth_headers(token))
+    assert [c["body"] for c in newer.json()] == ["resolved"]
+    exact = client.get(
+        f"/api/issues/{issue_id}/comments?limit=3&cursor={first.headers['X-Next-Cursor']}",
+        headers=auth_headers(token),
+    )
+    assert [c["body"] for c in exact.json()] == ["update 3", "update 4", "resolved"]
+    assert "X-Next-Cursor" not in exact.headers
+
+    bad = client.get(f"/api/issues/{issue_id}/comments?cursor=nope", headers=auth_headers(token))
+    assert bad.status_code == 400
+
+
+def test_sparse_fields_trim_issue_and_comment_lists(client):
+    token = signup_and_token(client, "Sparse", "sparse@example.com")
+    headers = auth_headers(token)
+    project_id = client.post("/api/projects", headers=headers, json={"name": "Sparse", "key": "SPR", "description": "x"}).json()["id"]
+    for n, priority in enumerate(["low", "critical", "medium"]):
+        issue_id = client.post(
+            f"/api/projects/{project_id}/issues", headers=headers, json={"title": f"Issue {n}", "description": "long " * 300, "priority": priority}
+        ).json()["id"]
+    for n in range(3):
+        client.post(f"/api/issues/{issue_id}/comments", headers=headers, json={"body": f"note {n}"})
+
+    with count_queries() as log:
+        page = client.get(f"/api/projects/{project_id}/issues?fields=title,status&sort=priority&limit=2", headers=headers)
+    assert page.status_code == 200
+    assert [set(issue) for issue in page.json()] == [{"id", "title", "status"}] * 2
+    assert not any("description" in statement for statement in log.statements)
+    rest = client.get(f"/api/projects/{project_id}/issues?fields=title,status&sort=priority&cursor={page.headers['X-Next-Cursor']}", headers=headers)
+    assert [issue["title"] for issue in page.json() + rest.json()] == ["Issue 0", "Issue 2", "Issue 1"]
+    full = client.get(f"/api/projects/{project_id}/issues", headers=headers).json()
+    assert "description" in full[0]
+
+    with count_queries() as log:
+        comments = client.get(f"/api/issues/{issue_id}/comments?fields=body&limit=2", headers=headers)
+    assert comments.json() == [{"id": comments.json()[0]["id"], "body": "note 0"}, {"id": comments.json()[1]["id"], "body": "note 1"}]
+    assert not any("JOIN users" in statement for statement in log.statements)
+    rest = client.get(f"/api/issues/{issue_id}/comments?fields=body,author_name&cursor={comments.headers['X-Next-Cursor']}", headers=headers)
+    assert [(c["body"], c["author_name"]) for c in rest.json()] == [("note 2", "Sparse")]
+
+    bad = client.get(f"/api/projects/{project_id}/issues?fields=title,secret,nope", headers=headers)
+    assert bad.status_code == 400
+    assert bad.json()["error"]["code"] == "invalid_fields"
+    assert bad.json()["error"]["details"]["unknown"] == ["nope", "secret"]
+    assert client.get(f"/api/issues/{issue_id}/comments?fields=", headers=headers).status_code == 400
+
+
+def test_issue_facet_counts_follow_writes_and_rebuild(client):
+    token = signup_and_token(client, "Counter", "counter@example.com")
+    me = client.get("/api/me", headers=auth_headers(token)).json()["id"]
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Counts", "key": "CNT1", "description": "x"},
+    ).json()["id"]
+    first = client.post(
+        f"/api/projects/{project_id}/issues",
+        headers=auth_headers(token),
+        json={"title": "one", "priority": "high", "assignee_id": me},
+    ).json()
+    bulk = client.post(
+        f"/api/projects/{project_id}/issues/bulk",
+        headers=auth_headers(token),
+        json={"issues": [{"title": "two", "priority": "low"}, {"title": "three", "priority": "low"}]},
+    ).json()
+    client.patch(f"/api/issues/{first['id']}", headers=auth_headers(token), json={"status": "closed"})
+    client.patch(
+        "/api/issues/bulk",
+        headers=auth_headers(token),
+        json={"ids": [bulk["results"][0]["issue"]["id"]], "patch": {"priority": "critical", "assignee_id": me}},
+    )
+    client.delete(f"/api/issues/{bulk['results'][1]['issue']['id']}", headers=auth_headers(token))
+
+    facets = client.get(f"/api/projects/{project_id}/issues/facets", headers=auth_headers(token))
+    assert facets.status_code == 200
+    expected = {
+        "total": 2,
+        "status": {"open": 1, "closed": 1},
+        "priority": {"high": 1, "critical": 1},
+        "assignee": {str(me): 2},
+    }
+    assert facets.json() == expected
+
+    async def drift_and_rebuild():
+        # Corrupt the counters, then repair them from the issues table.
+        db = client.app.dependency_overrides[get_session_factory]()()
+        try:
+            await db.execute(update(IssueFacetCount).values(count=99))
+            await db.run_sync(rebuild_facet_counts, project_id)
+            await db.commit()
+        finally:
+            await db.close()
+
+    client.portal.call(drift_and_rebuild)
+    assert client.get(f"/api/projects/{project_id}/issues/facets", headers=auth_headers(token)).json() == expected
+
+
+def test_project_stats_are_cached_and_invalidated_by_writes(client):
+    token = signup_and_token(client, "Lead", "lead@example.com")
+    lead_id = client.get("/api/me", headers=auth_headers(token)).json()["id"]
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Dash", "key": "DSH1", "description": "x"},
+    ).json()["id"]
+    created = client.post(
+        f"/api/projects/{project_id}/issues/bulk",
+        headers=auth_headers(token),
+        json={"issues": [
+            {"title": "a", "priority": "high", "assignee_id": lead_id},
+            {"title": "b", "priority": "high"},
+            {"title": "c", "priority": "low", "assignee_id": lead_id},
+        ]},
+    ).json()["results"]
+
+    stats = client.get(f"/api/projects/{project_id}/stats", headers=auth_headers(token)).json()
+    assert stats["open_by_priority"] == {"low": 1, "medium": 0, "high": 2, "critical": 0}
+    assert stats["unassigned_open"] == 1
+    assert stats["oldest_open_age_seconds"] >= 0
+    assert stats["created_last_7_days"] == 3
+    assert stats["resolved_last_30_days"] == 0
+    assert stats["top_assignees"] == [{"user_id": lead_id, "name": "Lead", "open_issues": 2}]
+
+    client.patch(f"/api/issues/{created[0]['issue']['id']}", headers=auth_headers(token), json={"status": "resolved"})
+    stats = client.get(f"/api/projects/{project_id}/stats", headers=auth_headers(token)).json()
+    assert stats["open_by_priority"]["high"] == 1
+    assert stats["resolved_last_7_days"] == 1
+    assert stats["top_assignees"][0]["open_issues"] == 1
+
+
+def test_conditional_get_returns_304_until_data_changes(client):
+    token = signup_and_token(client, "Poller", "poller@example.com")
+    project_id = client.post(
+        "/api/projects",
+        headers=auth_headers(token),
+        json={"name": "Poll", "key": "POL1", "description": "x"},
+    ).json()["id"]
+    issue_id = client.post(
+        f"/api/projects/{project_id}/issues",
+        headers=auth_headers(token),
+        json={"title": "Watched", "priority": "medium"},
+    ).json()["id"]
+
+    urls = [
+        f"/api/issues/{issue_id}",
+        f"/api/projects/{project_id}/issues?status=open",
+        f"/api/issues/{issue_id}/comments",
+        f"/api/projects/{project_id}/members",
+    ]
+    etags = {}
+    for url in urls:
+        first = client.get(url, headers=auth_headers(token))
+        assert first.status_code == 200
+        etags[url] = first.headers["ETag"]
+        again = client.get(url, headers={**auth_headers(token), "If-None-Match": etags[url]})
+        assert again.status_code == 304
+        assert again.content == b""
+
+    client.patch(f"/api/issues/{issue_id}", headers=auth_headers(token), json={"title": "Watched closely"})
+    client.post(f"/api/issues/{issue_id}/comments", headers=auth_headers(token), json={"body": "ping"})
+    signup_and_token(client, "Watcher", "watcher@example.com")
+    client.post(
+        f"/api/projects/{project_id}/members",
+        headers=auth_headers(token),
+        json={"email": "watcher@example.com", "role": "member"},
+    )
+    for url in urls:
+        changed = client.get(url, headers={**auth_headers(token), "If-None-Match": etags[url]})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etags[url]
+
+
+def test_bulk_issue_update_rejects_nulls_and_oversized_filters(client, monkeypatch):
+    from app.api.routes import issues as issue_routes
+
+    token = signup_and_token(client, "Capped", "capped@example.com")
+    headers = auth_headers(token)
+    project_id = client.post("/api/projects", headers=headers, json={"name": "Capped", "key": "CAP", "description": "x"}).json()["id"]
+    ids = [
+        i["issue"]["id"]
+        for i in client.post(
+            f"/api/projects/{project_id}/issues/bulk", headers=headers, json={"issues": [{"title": f"t{n}"} for n in range(3)]}
+        ).json()["results"]
+    ]
+
+    for field in ("priority", "status", "title"):
+        assert client.patch("/api/issues/bulk", headers=headers, json={"ids": ids, "patch": {field: None}}).status_code == 422
+        assert client.patch(f"/api/issues/{ids[0]}", headers=headers, json={field: None}).status_code == 422
+    assert client.patch(f"/api/issues/{ids[0]}", headers=headers, json={"assignee_id": None}).status_code == 200
+
+    monkeypatch.setattr(issue_routes, "MAX_BULK_ISSUES", 2)
+    by_filter = {"project_id": project_id, "filter": {}, "patch": {"priority": "high"}}
+    r = client.patch("/api/issues/bulk", headers=headers, json=by_filter)
+    assert r.status_code == 422 and r.json()["error"]["code"] == "too_many_issues"
+    assert {i["priority"] for i in client.get(f"/api/projects/{project_id}/issues", headers=headers).json()} == {"medium"}
+    by_filter["filter"] = {"q": "t1"}
+    assert client.patch("/api/issues/bulk", headers=headers, json=by_filter).json()["updated"] == [ids[1]]
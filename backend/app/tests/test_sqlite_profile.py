@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.db.session import create_async_engines, create_engines
+
+
+@pytest.fixture()
+def production_profile(monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_PROFILE", "production")
+
+
+def test_production_profile_uses_wal_and_read_only_readers(production_profile, tmp_path):
+    writer, reader = create_engines(f"sqlite:///{tmp_path}/prod.db")
+    assert writer is not reader
+    try:
+        with writer.begin() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+            conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+
+        with reader.connect() as conn:
+            assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO t VALUES (2)"))
+    finally:
+        writer.dispose()
+        reader.dispose()
+
+
+def test_production_profile_async_engines(production_profile, tmp_path):
+    async def check():
+        writer, reader = create_async_engines(f"sqlite:///{tmp_path}/prod_async.db")
+        try:
+            async with writer.begin() as conn:
+                assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+                await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+            async with reader.connect() as conn:
+                assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+        finally:
+            await writer.dispose()
+            await reader.dispose()
+
+    asyncio.run(check())
+
+
+def test_default_profile_shares_one_engine(tmp_path):
+    writer, reader = create_engines(f"sqlite:///{tmp_path}/dev.db")
+    assert writer is reader
+    writer.dispose()
+
+
+def test_sync_sessions_share_slots_per_engine(monkeypatch):
+    from app.db import session
+
+    async def check():
+        monkeypatch.setattr(session, "read_engine", session.engine)
+        shared = session._session_slots(session.ReadSessionLocal().get_bind())
+        assert shared is session._session_slots(session.SessionLocal().get_bind())
+        assert shared._value == settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+
+        writer, reader = create_engines("sqlite://")[0], create_engines("sqlite://")[0]
+        monkeypatch.setattr(session, "engine", writer)
+        monkeypatch.setattr(session, "read_engine", reader)
+        assert session._session_slots(reader)._value == settings.SQLITE_READ_POOL_SIZE
+        assert session._session_slots(writer)._value == 1
+        writer.dispose()
+        reader.dispose()
+
+    asyncio.run(check())
+
+
+def test_get_requests_use_reader_sessions_and_writes_use_the_writer(client):
+    from app.api.deps import get_session_factory
+
+    opened = []
+    session_factory = client.app.dependency_overrides[get_session_factory]()
+
+    def recording_factory(readonly=False):
+        opened.append(readonly)
+        return session_factory(readonly=readonly)
+
+    client.app.dependency_overrides[get_session_factory] = lambda: recording_factory
+    token = client.post("/api/auth/signup", json={"name": "Rw", "email": "rw@example.com", "password": "pass123"}).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    project_id = client.post("/api/projects", headers=headers, json={"name": "Rw", "key": "RW", "description": "x"}).json()["id"]
+    assert opened == [False, False]
+
+    opened.clear()
+    client.get("/api/projects", headers=headers)
+    client.get(f"/api/projects/{project_id}/issues", headers=headers)
+    client.get(f"/api/projects/{project_id}/members", headers=headers)
+    assert opened == [True, True, True]
+
+    opened.clear()
+    client.patch(f"/api/projects/{project_id}/members/999", headers=headers, json={"role": "member"})
+    assert opened == [False]
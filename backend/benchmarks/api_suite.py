@@ -0,0 +1,333 @@
+"""Scripted load scenarios against the API, in-process (ASGI) or under uvicorn, with a stored baseline.
+
+Each scenario reports throughput and p50/p95/p99 latency. Results are written
+as JSON; ``--save-baseline`` stores them as the reference for the target, and
+later runs are compared against it so regressions fail the run (exit code 1).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from sqlalchemy import select
+
+# Allow running as: `python benchmarks/api_suite.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / "scripts"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/bench.db"
+# Admission control would turn most of this load into 429s; set ADMISSION_ENABLED=true to measure it.
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+from app.db import base as _base  # noqa: F401
+from app.core.security import create_access_token
+from app.db.session import SessionLocal, async_engine, async_read_engine, engine
+from app.main import app
+from app.models.base import Base
+from app.models.issue import Issue
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from seed import generate_data
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+LIST_FILTERS = ("all", "status", "priority", "assignee", "search")
+LIST_SORTS = ("created_at", "priority", "status")
+
+
+class UnexpectedStatus(Exception):
+    pass
+
+
+def check(response: httpx.Response, expected: int = 200) -> None:
+    if response.status_code != expected:
+        raise UnexpectedStatus(f"{response.request.method} {response.request.url.path} -> {response.status_code}")
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def seed(args) -> dict:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        dataset = generate_data(
+            db,
+            users=args.users,
+            projects=args.projects,
+            members_per_project=args.members_per_project,
+            issues_per_project=args.issues_per_project,
+            skew=1.0,
+            comments_per_issue=args.comments_per_issue,
+            seed=args.seed,
+        )
+        # Project ids start at 1 and the Zipf split gives the first project the most issues.
+        project_id = 1
+        maintainer_id = db.scalar(
+            select(ProjectMember.user_id).where(ProjectMember.project_id == project_id, ProjectMember.role == "maintainer")
+        )
+        member_ids = db.scalars(select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)).all()
+        emails = db.scalars(select(User.email).where(User.id.in_(member_ids))).all()
+        issue_ids = db.scalars(select(Issue.id).where(Issue.project_id == project_id)).all()
+    finally:
+        db.close()
+    engine.dispose()
+    return {
+        "dataset": dataset,
+        "project_id": project_id,
+        "user_id": maintainer_id,
+        "member_ids": list(member_ids),
+        "emails": list(emails),
+        "issue_ids": list(issue_ids),
+        "headers": {"Authorization": f"Bearer {create_access_token(str(maintainer_id))}"},
+    }
+
+
+def build_scenarios(fixture: dict, args) -> list[tuple[str, int, object]]:
+    """Return ``(name, requests, op)`` triples; ``op(client, rng)`` performs one timed operation."""
+    headers = fixture["headers"]
+    project_id = fixture["project_id"]
+    issue_ids = fixture["issue_ids"]
+    member_ids = fixture["member_ids"]
+    emails = fixture["emails"]
+
+    async def login(client, rng):
+        check(await client.post("/api/auth/login", json={"email": rng.choice(emails), "password": "pass123"}))
+
+    def issue_list(params: dict):
+        async def op(client, rng):
+            check(await client.get(f"/api/projects/{project_id}/issues", params=params, headers=headers))
+        return op
+
+    filter_params = {
+        "all": {},
+        "status": {"status": "open"},
+        "priority": {"priority": "high"},
+        "assignee": {"assignee": fixture["user_id"]},
+        "search": {"q": "login"},
+    }
+
+    async def issue_detail(client, rng):
+        issue_id = rng.choice(issue_ids)
+        check(await client.get(f"/api/issues/{issue_id}", headers=headers))
+        check(await client.get(f"/api/issues/{issue_id}/comments", headers=headers))
+
+    async def comment_post(client, rng):
+        body = {"body": f"Benchmark comment {rng.randrange(1_000_000)}"}
+        check(await client.post(f"/api/issues/{rng.choice(issue_ids)}/comments", json=body, headers=headers))
+
+    triage_changes = [
+        lambda rng: {"status": rng.choice(["open", "in_progress", "resolved", "closed"])},
+        lambda rng: {"priority": rng.choice(["low", "medium", "high", "critical"])},
+        lambda rng: {"assignee_id": rng.choice(member_ids)},
+        lambda rng: {"status": "in_progress", "assignee_id": rng.choice(member_ids)},
+    ]
+
+    async def triage(client, rng):
+        change = rng.choice(triage_changes)(rng)
+        check(await client.patch(f"/api/issues/{rng.choice(issue_ids)}", json=change, headers=headers))
+
+    scenarios = [("login_storm", args.login_requests, login)]
+    for name in LIST_FILTERS:
+        for sort in LIST_SORTS:
+            params = {**filter_params[name], "sort": sort, "limit": args.page}
+            scenarios.append((f"issue_list[{name},{sort}]", args.requests, issue_list(params)))
+    scenarios += [
+        ("issue_detail_comments", args.requests, issue_detail),
+        ("comment_post", args.requests, comment_post),
+        ("triage_patch", args.requests, triage),
+    ]
+    if args.only:
+        scenarios = [s for s in scenarios if any(s[0].startswith(prefix) for prefix in args.only)]
+    return scenarios
+
+
+async def run_scenario(client: httpx.AsyncClient, op, requests: int, concurrency: int, seed: int) -> dict:
+    latencies: list[float] = []
+    errors: list[str] = []
+    remaining = iter(range(requests))
+
+    async def worker(n: int):
+        rng = random.Random(seed * 1000 + n)
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                await op(client, rng)
+            except UnexpectedStatus as exc:
+                errors.append(str(exc))
+                continue
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(n) for n in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies) or [0.0]
+    return {
+        "requests": requests,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(ordered, 50), 2),
+        "p95_ms": round(percentile(ordered, 95), 2),
+        "p99_ms": round(percentile(ordered, 99), 2),
+    }
+
+
+async def run_all(client: httpx.AsyncClient, scenarios, args) -> dict:
+    results = {}
+    for name, requests, op in scenarios:
+        # One untimed pass per scenario warms caches and prepared statements.
+        await run_scenario(client, op, min(requests, args.concurrency), args.concurrency, args.seed)
+        results[name] = stats = await run_scenario(client, op, requests, args.concurrency, args.seed)
+        print(
+            f"{name:<34} {stats['throughput_rps']:9.1f} req/s  p50={stats['p50_ms']:7.1f}ms  "
+            f"p95={stats['p95_ms']:7.1f}ms  p99={stats['p99_ms']:7.1f}ms  errors={stats['errors']}"
+        )
+    return results
+
+
+async def run_asgi(scenarios, args) -> dict:
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            results = await run_all(client, scenarios, args)
+    await async_engine.dispose()
+    await async_read_engine.dispose()
+    return results
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_uvicorn(scenarios, args) -> dict:
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        cwd=ROOT,
+        env=dict(os.environ),
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=None, limits=limits) as client:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    await client.get("/openapi.json")
+                    break
+                except httpx.TransportError:
+                    if server.poll() is not None or time.monotonic() > deadline:
+                        raise SystemExit("uvicorn did not start")
+                    await asyncio.sleep(0.2)
+            return await run_all(client, scenarios, args)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Return one line per scenario whose p95 grew or throughput fell by more than ``tolerance``."""
+    regressions = []
+    for name, base in baseline["scenarios"].items():
+        current = results["scenarios"].get(name)
+        if current is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {base['p95_ms']:.1f}ms -> {current['p95_ms']:.1f}ms")
+        if current["throughput_rps"] < base["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {base['throughput_rps']:.1f} -> {current['throughput_rps']:.1f} req/s")
+        if current["errors"] > base["errors"]:
+            regressions.append(f"{name}: errors {base['errors']} -> {current['errors']} ({current['first_error']})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the API load and latency benchmark suite")
+    parser.add_argument("--target", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=300, help="Requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=60)
+    parser.add_argument("--page", type=int, default=50)
+    parser.add_argument("--only", nargs="*", help="Run only scenarios whose name starts with one of these prefixes")
+    dataset = parser.add_argument_group("dataset")
+    dataset.add_argument("--users", type=int, default=500)
+    dataset.add_argument("--projects", type=int, default=5)
+    dataset.add_argument("--members-per-project", type=int, default=50)
+    dataset.add_argument("--issues-per-project", type=int, default=10000)
+    dataset.add_argument("--comments-per-issue", type=float, default=2.0)
+    dataset.add_argument("--seed", type=int, default=42)
+    output = parser.add_argument_group("results")
+    output.add_argument("--output", help="Results file (default: benchmarks/results/<target>-<timestamp>.json)")
+    output.add_argument("--baseline", help="Baseline file (default: benchmarks/baselines/<target>.json)")
+    output.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    output.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative p95/throughput change")
+    args = parser.parse_args()
+
+    fixture = seed(args)
+    scenarios = build_scenarios(fixture, args)
+    runner = run_asgi if args.target == "asgi" else run_uvicorn
+    results = {
+        "meta": {
+            "target": args.target,
+            "workers": args.workers if args.target == "uvicorn" else None,
+            "concurrency": args.concurrency,
+            "dataset": fixture["dataset"],
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+        },
+        "scenarios": asyncio.run(runner(scenarios, args)),
+    }
+
+    output_path = Path(args.output) if args.output else RESULTS_DIR / f"{args.target}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2))
+    print(f"results written to {output_path}")
+
+    baseline_path = Path(args.baseline) if args.baseline else BASELINE_DIR / f"{args.target}.json"
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2))
+        print(f"baseline saved to {baseline_path}")
+        return
+    if not baseline_path.exists():
+        print(f"no baseline at {baseline_path}; run with --save-baseline to create one")
+        return
+
+    baseline = json.loads(baseline_path.read_text())
+    if baseline["meta"]["dataset"] != results["meta"]["dataset"] or baseline["meta"]["concurrency"] != args.concurrency:
+        print("warning: baseline was recorded with a different dataset or concurrency")
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"REGRESSIONS against {baseline_path} (tolerance {args.tolerance:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"no regressions against {baseline_path} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
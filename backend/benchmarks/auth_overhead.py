@@ -0,0 +1,74 @@
+"""Measure per-request authentication overhead: decode + user SELECT vs. cached principal."""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from jose import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# Allow running as: `python benchmarks/auth_overhead.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.db import base as _base  # noqa: F401
+from app.api.deps import principal_from_token, token_cache
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.base import Base
+from app.models.user import User
+
+
+def decode_and_load(db, token: str) -> User:
+    """The previous get_current_user: verify the JWT and SELECT the user on every call."""
+    payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
+    return db.query(User).filter(User.id == int(payload.get("sub"))).first()
+
+
+def timed(label: str, iterations: int, fn) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call_us = (time.perf_counter() - start) / iterations * 1e6
+    print(f"{label:<40} {per_call_us:9.1f} us/request")
+    return per_call_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark authentication overhead per request")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite+pysqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = Session()
+    user = User(name="Bench", email="bench@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    token = create_access_token(str(user.id))
+
+    def fresh_session_call(fn):
+        def call():
+            session = Session()
+            try:
+                fn(session)
+            finally:
+                session.close()
+        return call
+
+    before = timed("before: decode + SELECT user", args.iterations, fresh_session_call(lambda s: decode_and_load(s, token)))
+    token_cache.clear()
+    after = timed("after: cached principal (id only)", args.iterations, lambda: principal_from_token(token))
+    lazy = timed("after: cached principal + lazy user load", args.iterations, fresh_session_call(lambda s: s.get(User, principal_from_token(token).id)))
+    print(f"speedup (id-only routes): {before / after:.1f}x, (user routes): {before / lazy:.1f}x")
+    print(f"token cache: {token_cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compare creating issues one request at a time with the bulk create endpoint."""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+# Allow running as: `python benchmarks/bulk_create.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/bench.db"
+# Admission control would turn most of this load into 429s; set ADMISSION_ENABLED=true to measure it.
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+from app.db import base as _base  # noqa: F401
+from app.core.security import create_access_token
+from app.db.session import SessionLocal, async_engine, engine
+from app.main import app
+from app.models.base import Base
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from app.schemas.issue import MAX_BULK_ISSUES
+
+
+def seed() -> tuple[dict, int, int]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(name="Bench", email="bench@example.com", password_hash="x")
+        project = Project(name="Bench", key="BENCH")
+        db.add_all([user, project])
+        db.flush()
+        db.add(ProjectMember(project_id=project.id, user_id=user.id, role="maintainer"))
+        db.commit()
+        return {"Authorization": f"Bearer {create_access_token(str(user.id))}"}, project.id, user.id
+    finally:
+        db.close()
+
+
+async def main_async(args) -> None:
+    headers, project_id, user_id = seed()
+    payload = [{"title": f"Imported {i}", "priority": "high", "assignee_id": user_id} for i in range(args.issues)]
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        url = f"/api/projects/{project_id}/issues"
+
+        start = time.perf_counter()
+        for item in payload:
+            r = await client.post(url, headers=headers, json=item)
+            assert r.status_code == 200
+        single = args.issues / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for offset in range(0, args.issues, MAX_BULK_ISSUES):
+            r = await client.post(f"{url}/bulk", headers=headers, json={"issues": payload[offset:offset + MAX_BULK_ISSUES]})
+            assert r.status_code == 200 and r.json()["created"] == len(payload[offset:offset + MAX_BULK_ISSUES])
+        bulk = args.issues / (time.perf_counter() - start)
+
+    await async_engine.dispose()
+    print(f"per-issue POST: {single:9.0f} issues/s")
+    print(f"bulk POST:      {bulk:9.0f} issues/s  ({bulk / single:.0f}x)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bulk issue creation")
+    parser.add_argument("--issues", type=int, default=2000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
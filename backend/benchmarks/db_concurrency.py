@@ -0,0 +1,104 @@
+"""Compare the async (aiosqlite) and threadpool (sync driver) database paths under concurrent reads."""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+# Allow running as: `python benchmarks/db_concurrency.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/bench.db"
+# Admission control would turn most of this load into 429s; set ADMISSION_ENABLED=true to measure it.
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+from app.db import base as _base  # noqa: F401
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.session import SessionLocal, async_engine, engine
+from app.main import app
+from app.models.base import Base
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+
+
+def seed(issues: int) -> tuple[str, int]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(name="Bench", email="bench@example.com", password_hash="x")
+        project = Project(name="Bench", key="BENCH")
+        db.add_all([user, project])
+        db.flush()
+        db.add(ProjectMember(project_id=project.id, user_id=user.id, role="maintainer"))
+        db.add_all(
+            Issue(project_id=project.id, title=f"Issue {i}", reporter_id=user.id, priority="medium")
+            for i in range(issues)
+        )
+        db.commit()
+        return create_access_token(str(user.id)), project.id
+    finally:
+        db.close()
+
+
+async def run(client: httpx.AsyncClient, url: str, headers: dict, concurrency: int, requests_per_client: int) -> dict:
+    latencies: list[float] = []
+
+    async def worker():
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            r = await client.get(url, headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert r.status_code == 200, r.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    ordered = sorted(latencies)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(ordered),
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+    }
+
+
+async def main_async(args) -> None:
+    token, project_id = seed(args.issues)
+    headers = {"Authorization": f"Bearer {token}"}
+    url = f"/api/projects/{project_id}/issues?limit=20"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        for concurrency in args.concurrency:
+            for db_async in (False, True):
+                settings.DB_ASYNC = db_async
+                await run(client, url, headers, min(concurrency, 10), 2)  # warm up pools
+                result = await run(client, url, headers, concurrency, args.requests)
+                label = "async" if db_async else "sync"
+                print(
+                    f"concurrency={concurrency:<5} {label:<6} {result['rps']:8.0f} req/s  "
+                    f"p50={result['p50_ms']:.1f}ms p99={result['p99_ms']:.1f}ms"
+                )
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark async vs threadpool database access")
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20, help="Requests per concurrent client")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 500])
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
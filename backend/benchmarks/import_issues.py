@@ -0,0 +1,93 @@
+"""Measure streaming import throughput from a generated NDJSON file."""
+
+import argparse
+import asyncio
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import orjson
+
+# Allow running as: `python benchmarks/import_issues.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/bench.db"
+
+from app.db import base as _base  # noqa: F401
+from app.crud.issue_import import IssueImporter, read_records
+from app.db.session import SessionLocal, async_engine, engine, new_session
+from app.models.base import Base
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+
+
+def seed(users: int) -> tuple[int, list[str]]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        project = Project(name="Bench", key="BENCH")
+        people = [User(name=f"User {i}", email=f"user{i}@example.com", password_hash="x") for i in range(users)]
+        db.add_all([project, *people])
+        db.flush()
+        db.add_all(ProjectMember(project_id=project.id, user_id=u.id, role="member") for u in people)
+        db.commit()
+        return project.id, [u.email for u in people]
+    finally:
+        db.close()
+
+
+def write_input(path: Path, issues: int, comments: int, emails: list[str]) -> None:
+    rng = random.Random(3)
+    with path.open("wb") as out:
+        for i in range(issues):
+            out.write(orjson.dumps({
+                "title": f"Legacy issue {i}",
+                "description": "Imported from the old tracker",
+                "status": rng.choice(["open", "in_progress", "resolved", "closed"]),
+                "priority": rng.choice(["low", "medium", "high", "critical"]),
+                "reporter_email": rng.choice(emails),
+                "assignee_email": rng.choice(emails),
+                "comments": [{"author_email": rng.choice(emails), "body": "Legacy comment"} for _ in range(comments)],
+            }) + b"\n")
+
+
+async def main_async(args) -> None:
+    project_id, emails = seed(args.users)
+    source = Path(_tmpdir.name) / "issues.ndjson"
+    write_input(source, args.issues, args.comments, emails)
+
+    db = new_session()
+    try:
+        with source.open(encoding="utf-8") as stream:
+            start = time.perf_counter()
+            result = await IssueImporter(db, project_id, args.batch_size).run(read_records(stream, "ndjson"))
+            elapsed = time.perf_counter() - start
+    finally:
+        await db.close()
+        await async_engine.dispose()
+
+    assert result.imported == args.issues, result.errors[:3]
+    print(f"imported {result.imported} issues and {result.comments} comments in {elapsed:.1f}s")
+    print(f"{result.imported / elapsed:9.0f} issues/s (batch size {args.batch_size})")
+    print(f"peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the streaming issue importer")
+    parser.add_argument("--issues", type=int, default=200_000)
+    parser.add_argument("--comments", type=int, default=0, help="Comments per issue")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=2000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Measure non-auth endpoint latency while a login burst runs, with and without the bcrypt process pool."""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# Allow running as: `python benchmarks/login_contention.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Admission control would turn most of this load into 429s; set ADMISSION_ENABLED=true to measure it.
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+from app.db import base as _base  # noqa: F401
+from app.api.deps import get_db
+from app.core import security
+from app.core.config import settings
+from app.main import app
+from app.models.base import Base
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_scenario(client: httpx.AsyncClient, token: str, logins: int, readers: int, duration: float) -> dict:
+    stop = time.perf_counter() + duration
+    latencies: list[float] = []
+    login_count = 0
+
+    async def login_storm():
+        nonlocal login_count
+        while time.perf_counter() < stop:
+            r = await client.post("/api/auth/login", json={"email": "bench@example.com", "password": "pass123"})
+            assert r.status_code == 200
+            login_count += 1
+
+    async def reader():
+        headers = {"Authorization": f"Bearer {token}"}
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            r = await client.get("/api/projects", headers=headers)
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert r.status_code == 200
+
+    await asyncio.gather(*[login_storm() for _ in range(logins)], *[reader() for _ in range(readers)])
+    return {
+        "logins": login_count,
+        "reads": len(latencies),
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+async def main_async(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        Session = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+        async def override_get_db():
+            async with Session() as db:
+                yield db
+
+        app.dependency_overrides[get_db] = override_get_db
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            r = await client.post("/api/auth/signup", json={"name": "Bench", "email": "bench@example.com", "password": "pass123"})
+            token = r.json()["access_token"]
+
+            for label, workers in (("inline (threadpool)", 0), (f"process pool ({args.workers})", args.workers)):
+                security.shutdown_hash_pool()
+                settings.PASSWORD_HASH_WORKERS = workers
+                result = await run_scenario(client, token, args.logins, args.readers, args.duration)
+                print(
+                    f"{label:<22} logins={result['logins']:<5} reads={result['reads']:<6} "
+                    f"read p50={result['p50_ms']:.1f}ms p99={result['p99_ms']:.1f}ms"
+                )
+        security.shutdown_hash_pool()
+        app.dependency_overrides.clear()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark read latency under a concurrent login burst")
+    parser.add_argument("--logins", type=int, default=16, help="Concurrent login loops")
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent GET /api/projects loops")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per scenario")
+    parser.add_argument("--workers", type=int, default=2, help="Process pool size for the pooled run")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
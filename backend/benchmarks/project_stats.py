@@ -0,0 +1,115 @@
+"""Time the project dashboard aggregate on a large project, cold and cached."""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import httpx
+from sqlalchemy import insert
+
+# Allow running as: `python benchmarks/project_stats.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/bench.db"
+# Admission control would turn most of this load into 429s; set ADMISSION_ENABLED=true to measure it.
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+from app.db import base as _base  # noqa: F401
+from app.core.security import create_access_token
+from app.crud.stats import compute_project_stats, stats_cache
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.main import app
+from app.models.base import Base
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+
+STATUSES = ("open", "in_progress", "resolved", "closed")
+PRIORITIES = ("low", "medium", "high", "critical")
+BATCH = 50_000
+
+
+def seed(issues: int, members: int) -> tuple[dict, int]:
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    db = SessionLocal()
+    try:
+        project = Project(name="Bench", key="BENCH")
+        users = [User(name=f"User {i}", email=f"user{i}@example.com", password_hash="x") for i in range(members)]
+        db.add_all([project, *users])
+        db.flush()
+        db.add_all(ProjectMember(project_id=project.id, user_id=u.id, role="maintainer") for u in users)
+        user_ids = [u.id for u in users]
+        for offset in range(0, issues, BATCH):
+            rows = []
+            for _ in range(min(BATCH, issues - offset)):
+                created = now - timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+                rows.append({
+                    "project_id": project.id,
+                    "title": "Synthetic issue",
+                    "status": rng.choice(STATUSES),
+                    "priority": rng.choice(PRIORITIES),
+                    "reporter_id": user_ids[0],
+                    "assignee_id": rng.choice(user_ids) if rng.random() < 0.8 else None,
+                    "created_at": created,
+                    "updated_at": created + timedelta(minutes=rng.randrange(0, 60 * 24 * 30)),
+                })
+            db.execute(insert(Issue), rows)
+        db.commit()
+        return {"Authorization": f"Bearer {create_access_token(str(user_ids[0]))}"}, project.id
+    finally:
+        db.close()
+
+
+async def main_async(args) -> None:
+    start = time.perf_counter()
+    headers, project_id = seed(args.issues, args.members)
+    print(f"seeded {args.issues} issues in {time.perf_counter() - start:.1f}s")
+
+    async with AsyncSessionLocal() as db:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            await compute_project_stats(db, project_id)
+            timings.append(time.perf_counter() - start)
+    print(f"grouped aggregate (uncached): {min(timings) * 1000:9.1f} ms")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        url = f"/api/projects/{project_id}/stats"
+        stats_cache.clear()
+        start = time.perf_counter()
+        assert (await client.get(url, headers=headers)).status_code == 200
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args.requests):
+            assert (await client.get(url, headers=headers)).status_code == 200
+        warm = (time.perf_counter() - start) / args.requests
+
+    await async_engine.dispose()
+    print(f"GET /stats cold:             {cold * 1000:9.1f} ms")
+    print(f"GET /stats cached:           {warm * 1000:9.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the project stats endpoint")
+    parser.add_argument("--issues", type=int, default=1_000_000)
+    parser.add_argument("--members", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=200)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Compare ORM + response_model serialization with the Core row + orjson path for list pages."""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, select
+
+# Allow running as: `python benchmarks/serialization.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmpdir.name}/bench.db"
+# Admission control would turn most of this load into 429s; set ADMISSION_ENABLED=true to measure it.
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+from app.db import base as _base  # noqa: F401
+from app.api.responses import rows_response
+from app.core.security import create_access_token
+from app.crud.comment import list_issue_comments
+from app.crud.issue import ISSUE_COLUMNS
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.main import app
+from app.models.base import Base
+from app.models.comment import Comment
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from app.schemas.comment import CommentOut
+from app.schemas.issue import IssueOut
+
+
+def seed(page: int) -> tuple[dict, int, int]:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(name="Bench", email="bench@example.com", password_hash="x")
+        project = Project(name="Bench", key="BENCH")
+        db.add_all([user, project])
+        db.flush()
+        db.add(ProjectMember(project_id=project.id, user_id=user.id, role="maintainer"))
+        now = datetime.utcnow()
+        db.execute(insert(Issue), [
+            {"project_id": project.id, "title": f"Issue {i}", "description": "Steps to reproduce " * 5,
+             "reporter_id": user.id, "assignee_id": user.id, "created_at": now, "updated_at": now}
+            for i in range(page)
+        ])
+        issue_id = db.scalar(select(Issue.id).limit(1))
+        db.execute(insert(Comment), [
+            {"issue_id": issue_id, "author_id": user.id, "body": "Looked into this " * 5, "created_at": now}
+            for _ in range(page)
+        ])
+        db.commit()
+        return {"Authorization": f"Bearer {create_access_token(str(user.id))}"}, project.id, issue_id
+    finally:
+        db.close()
+
+
+def rate(rows: int, seconds: float) -> str:
+    return f"{rows / seconds:10.0f} rows/s"
+
+
+async def time_pages(fn, pages: int) -> float:
+    start = time.perf_counter()
+    for _ in range(pages):
+        await fn()
+    return time.perf_counter() - start
+
+
+async def main_async(args) -> None:
+    headers, project_id, issue_id = seed(args.page)
+    total = args.page * args.pages
+
+    async with AsyncSessionLocal() as db:
+        async def issues_orm():
+            issues = (await db.scalars(select(Issue).where(Issue.project_id == project_id).limit(args.page))).all()
+            json.dumps(jsonable_encoder([IssueOut.model_validate(i) for i in issues])).encode()
+            db.expunge_all()
+
+        async def issues_fast():
+            rows = (await db.execute(select(*ISSUE_COLUMNS).where(Issue.project_id == project_id).limit(args.page))).all()
+            rows_response(row._mapping for row in rows).body
+
+        async def comments_model():
+            rows, _ = await list_issue_comments(db, issue_id, args.page)
+            json.dumps(jsonable_encoder([CommentOut.model_validate(row._mapping) for row in rows])).encode()
+
+        async def comments_fast():
+            rows, _ = await list_issue_comments(db, issue_id, args.page)
+            rows_response(row._mapping for row in rows).body
+
+        for label, fn in [
+            ("issues   ORM + IssueOut + json", issues_orm),
+            ("issues   Core rows + orjson  ", issues_fast),
+            ("comments CommentOut + json   ", comments_model),
+            ("comments Core rows + orjson  ", comments_fast),
+        ]:
+            await fn()
+            print(f"{label}: {rate(total, await time_pages(fn, args.pages))}")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        url = f"/api/projects/{project_id}/issues?limit={min(args.page, 100)}"
+
+        async def endpoint():
+            r = await client.get(url, headers=headers)
+            assert r.status_code == 200
+
+        await endpoint()
+        print(f"GET issues endpoint          : {rate(min(args.page, 100) * args.pages, await time_pages(endpoint, args.pages))}")
+
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark list endpoint serialization")
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=300)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Mix issue creation with issue listing and compare the default and production SQLite profiles."""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Allow running as: `python benchmarks/sqlite_contention.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Admission control would turn most of this load into 429s; set ADMISSION_ENABLED=true to measure it.
+os.environ.setdefault("ADMISSION_ENABLED", "false")
+
+
+def summarize(latencies: list[float]) -> str:
+    if not latencies:
+        return "n/a"
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return f"p50={statistics.median(ordered):.1f}ms p99={p99:.1f}ms"
+
+
+async def run_profile(args) -> None:
+    import httpx
+
+    from app.db import base as _base  # noqa: F401
+    from app.core.security import create_access_token
+    from app.db.session import SessionLocal, async_engine, async_read_engine, engine
+    from app.main import app
+    from app.models.base import Base
+    from app.models.project import Project
+    from app.models.project_member import ProjectMember
+    from app.models.user import User
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = User(name="Bench", email="bench@example.com", password_hash="x")
+    project = Project(name="Bench", key="BENCH")
+    db.add_all([user, project])
+    db.flush()
+    db.add(ProjectMember(project_id=project.id, user_id=user.id, role="maintainer"))
+    db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token(str(user.id))}"}
+    project_id = project.id
+    db.close()
+
+    stop = time.perf_counter() + args.duration
+    writes: list[float] = []
+    reads: list[float] = []
+    errors = 0
+
+    async def loop(client, method, url, samples, **kwargs):
+        nonlocal errors
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            r = await client.request(method, url, headers=headers, **kwargs)
+            if r.status_code != 200:
+                errors += 1
+                continue
+            samples.append((time.perf_counter() - start) * 1000)
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        url = f"/api/projects/{project_id}/issues"
+        await asyncio.gather(
+            *[loop(client, "POST", url, writes, json={"title": "Load", "priority": "high"}) for _ in range(args.writers)],
+            *[loop(client, "GET", f"{url}?limit=20", reads) for _ in range(args.readers)],
+        )
+    await async_engine.dispose()
+    await async_read_engine.dispose()
+
+    print(
+        f"{os.environ['SQLITE_PROFILE']:<11} writes={len(writes) / args.duration:7.0f}/s ({summarize(writes)})  "
+        f"reads={len(reads) / args.duration:7.0f}/s ({summarize(reads)})  errors={errors}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent writes and reads per SQLite profile")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--profile", choices=["default", "production"], help="Run a single profile in-process")
+    args = parser.parse_args()
+
+    if args.profile:
+        asyncio.run(run_profile(args))
+        return
+
+    for profile in ("default", "production"):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, SQLITE_PROFILE=profile, DATABASE_URL=f"sqlite:///{tmp}/bench.db")
+            subprocess.run(
+                [sys.executable, __file__, "--profile", profile, "--writers", str(args.writers),
+                 "--readers", str(args.readers), "--duration", str(args.duration)],
+                env=env,
+                check=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Stream issues and their comments from an NDJSON or CSV file into a project."""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Allow running as: `python scripts/import_issues.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.db import base as _base  # noqa: F401
+from app.core.config import settings
+from app.crud.issue_import import FORMATS, ImportFailed, IssueImporter, UnreadableInput, read_records
+from app.db.session import async_engine, new_session
+from app.models.project import Project
+
+
+def load_checkpoint(path: Path, source: Path) -> int:
+    if not path.exists():
+        return 0
+    data = json.loads(path.read_text())
+    if data.get("source") != str(source.resolve()):
+        raise SystemExit(f"Checkpoint {path} belongs to {data.get('source')}, not {source}")
+    return int(data["committed_records"])
+
+
+async def run(args) -> None:
+    source = Path(args.path)
+    fmt = args.format or ("csv" if source.suffix.lower() == ".csv" else "ndjson")
+    checkpoint = Path(args.checkpoint or f"{source}.checkpoint.json")
+    if checkpoint.exists() and not args.resume:
+        raise SystemExit(f"Checkpoint {checkpoint} exists from an unfinished import; pass --resume or delete it")
+    skip = load_checkpoint(checkpoint, source) if args.resume else 0
+
+    def save_checkpoint(committed_records: int) -> None:
+        checkpoint.write_text(json.dumps({"source": str(source.resolve()), "committed_records": committed_records}))
+
+    db = new_session()
+    try:
+        if await db.get(Project, args.project) is None:
+            raise SystemExit(f"Project {args.project} not found")
+        with source.open(encoding="utf-8-sig", newline="") as stream:
+            importer = IssueImporter(db, args.project, args.batch_size, args.dry_run)
+            try:
+                result = await importer.run(read_records(stream, fmt), skip, save_checkpoint)
+            except ImportFailed as exc:
+                fix = "Fix the input, then rerun" if isinstance(exc, UnreadableInput) else "Rerun"
+                raise SystemExit(
+                    f"Import stopped after {exc.result.committed_records} records: {exc}\n"
+                    f"{fix} with --resume to continue from {checkpoint}"
+                )
+    finally:
+        await db.close()
+        await async_engine.dispose()
+
+    if not args.dry_run and checkpoint.exists():
+        checkpoint.unlink()
+    print(json.dumps(result.model_dump(), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import IssueHub issues from NDJSON or CSV")
+    parser.add_argument("path", help="Input file; one issue per line (NDJSON) or row (CSV)")
+    parser.add_argument("--project", type=int, required=True, help="Target project id")
+    parser.add_argument("--format", choices=FORMATS, help="Defaults to csv for .csv files, ndjson otherwise")
+    parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Validate and resolve users without writing")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <path>.checkpoint.json)")
+    parser.add_argument("--resume", action="store_true", help="Skip records committed by a previous run")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Rebuild issue facet counters from the issues table (consistency repair)."""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Allow running as: `python scripts/rebuild_facets.py` from backend directory.
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.db import base as _base  # noqa: F401
+from app.crud.facets import rebuild_facet_counts
+from app.db.session import SessionLocal
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild IssueHub facet counters")
+    parser.add_argument("--project", type=int, help="Only rebuild counters for this project id")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        rebuild_facet_counts(db, args.project)
+        db.commit()
+        scope = f"project {args.project}" if args.project is not None else "all projects"
+        print(f"Facet counters rebuilt for {scope}.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
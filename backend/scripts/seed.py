@@ -1,11 +1,14 @@
 """Populate local development database with demo users, projects, issues, and comments."""
 
 import argparse
+import itertools
 import random
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from sqlalchemy import func, insert, select, text
 from sqlalchemy.orm import Session
 
 # Allow running as: `python scripts/seed.py` from backend directory.
@@ -16,8 +19,12 @@ if str(ROOT) not in sys.path:
 from app.db import base as _base  # noqa: F401
 from app.core.security import get_password_hash
 from app.db.session import SessionLocal
+from app.crud.facets import rebuild_facet_counts
+from app.db.search import SqliteFtsBackend, get_search_backend
 from app.models.comment import Comment
 from app.models.issue import Issue
+from app.models.issue_activity import IssueActivity
+from app.models.issue_facet import IssueFacetCount
 from app.models.project import Project
 from app.models.project_member import ProjectMember
 from app.models.user import User
@@ -57,6 +64,8 @@ def ensure_membership(db: Session, project_id: int, user_id: int, role: str) ->
 
 def reset_data(db: Session) -> None:
     db.query(Comment).delete()
+    db.query(IssueActivity).delete()
+    db.query(IssueFacetCount).delete()
     db.query(Issue).delete()
     db.query(ProjectMember).delete()
     db.query(Project).delete()
@@ -157,9 +166,166 @@ def seed_data(db: Session, seed: int = 42) -> None:
                 )
             )
 
+    db.flush()
+    rebuild_facet_counts(db)
     db.commit()
 
 
+GEN_AREAS = ["login", "search", "export", "dashboard", "billing", "upload", "comments", "filters", "api", "sync"]
+GEN_SYMPTOMS = ["crashes", "times out", "shows stale data", "returns 500", "is slow", "loses input", "renders blank", "double submits"]
+GEN_CONTEXTS = ["on mobile", "after refresh", "for new users", "under load", "in Safari", "with large projects", "behind proxy"]
+GEN_STATUS_WEIGHTS = {"open": 35, "in_progress": 15, "resolved": 20, "closed": 30}
+GEN_PRIORITY_WEIGHTS = {"low": 30, "medium": 40, "high": 22, "critical": 8}
+
+
+def _next_id(db: Session, model) -> int:
+    return (db.scalar(select(func.max(model.id))) or 0) + 1
+
+
+def _insert_batches(db: Session, model, rows, batch_size: int) -> int:
+    """Insert an iterable of row dicts with executemany, committing every ``batch_size`` rows."""
+    # Core table insert: the ORM bulk path splits executemany batches wherever a row holds NULLs.
+    statement = insert(model.__table__)
+    batch, total = [], 0
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.connection().execute(statement, batch)
+            db.commit()
+            total += len(batch)
+            batch = []
+    if batch:
+        db.connection().execute(statement, batch)
+        db.commit()
+        total += len(batch)
+    return total
+
+
+def project_issue_counts(projects: int, issues_per_project: int, skew: float) -> list[int]:
+    """Split ``projects * issues_per_project`` issues with Zipf-like weights; ``skew=0`` is uniform."""
+    total = projects * issues_per_project
+    weights = [1 / (rank + 1) ** skew for rank in range(projects)]
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    counts[0] += total - sum(counts)
+    return counts
+
+
+def generate_data(
+    db: Session,
+    users: int,
+    projects: int,
+    members_per_project: int,
+    issues_per_project: int,
+    skew: float,
+    comments_per_issue: float,
+    seed: int = 42,
+    batch_size: int = 20000,
+    password: str = "pass123",
+) -> dict:
+    """Bulk-generate a deterministic synthetic dataset with Core executemany inserts.
+
+    Ids are assigned here (continuing after existing rows) so issues and
+    comments need no RETURNING round trips. On SQLite the FTS triggers are
+    dropped for the load and the index is rebuilt once at the end.
+    """
+    rng = random.Random(seed)
+    password_hash = get_password_hash(password)
+    now = datetime.utcnow()
+    statuses, status_weights = list(GEN_STATUS_WEIGHTS), list(itertools.accumulate(GEN_STATUS_WEIGHTS.values()))
+    priorities, priority_weights = list(GEN_PRIORITY_WEIGHTS), list(itertools.accumulate(GEN_PRIORITY_WEIGHTS.values()))
+    titles = [f"{area.capitalize()} {symptom} {context}" for area in GEN_AREAS for symptom in GEN_SYMPTOMS for context in GEN_CONTEXTS]
+
+    search = get_search_backend(db)
+    bulk_sqlite = isinstance(search, SqliteFtsBackend)
+    if bulk_sqlite:
+        search.uninstall(db.connection())
+        db.execute(text("PRAGMA synchronous=OFF"))
+
+    first_user = _next_id(db, User)
+    user_ids = list(range(first_user, first_user + users))
+    _insert_batches(db, User, (
+        {"id": uid, "name": f"Scale User {uid}", "email": f"user{uid}@scale.example.com", "password_hash": password_hash, "created_at": now}
+        for uid in user_ids
+    ), batch_size)
+
+    first_project = _next_id(db, Project)
+    project_ids = list(range(first_project, first_project + projects))
+    _insert_batches(db, Project, (
+        {"id": pid, "name": f"Scale Project {pid}", "key": f"GEN{pid}", "description": "Synthetic scale-test project", "created_at": now}
+        for pid in project_ids
+    ), batch_size)
+
+    members = {pid: rng.sample(user_ids, min(members_per_project, users)) for pid in project_ids}
+    _insert_batches(db, ProjectMember, (
+        {"project_id": pid, "user_id": uid, "role": "maintainer" if position == 0 else "member"}
+        for pid, uids in members.items()
+        for position, uid in enumerate(uids)
+    ), batch_size)
+
+    counts = project_issue_counts(projects, issues_per_project, skew)
+    first_issue = _next_id(db, Issue)
+    comment_ids = itertools.count(_next_id(db, Comment))
+    issue_comments: list[tuple[int, int, datetime, list[int]]] = []
+
+    def issue_rows():
+        issue_id = first_issue
+        for pid, count in zip(project_ids, counts):
+            pool = members[pid]
+            for _ in range(count):
+                created = now - timedelta(minutes=rng.randrange(60 * 24 * 365))
+                yield {
+                    "id": issue_id,
+                    "project_id": pid,
+                    "title": rng.choice(titles),
+                    "description": f"Synthetic issue {issue_id} generated for scale testing.",
+                    "status": rng.choices(statuses, cum_weights=status_weights)[0],
+                    "priority": rng.choices(priorities, cum_weights=priority_weights)[0],
+                    "reporter_id": rng.choice(pool),
+                    "assignee_id": rng.choice(pool) if rng.random() < 0.8 else None,
+                    "created_at": created,
+                    "updated_at": created + timedelta(minutes=rng.randrange(60 * 24 * 14)),
+                }
+                if comments_per_issue > 0:
+                    issue_comments.append((issue_id, round(rng.expovariate(1 / comments_per_issue)), created, pool))
+                issue_id += 1
+
+    def comment_rows():
+        for issue_id, count, created, pool in issue_comments:
+            for n in range(count):
+                yield {
+                    "id": next(comment_ids),
+                    "issue_id": issue_id,
+                    "author_id": rng.choice(pool),
+                    "body": f"Synthetic comment {n + 1}",
+                    "created_at": created + timedelta(minutes=n + 1),
+                }
+
+    issues_total = comments_total = 0
+    try:
+        # Interleave issues and their comments one chunk at a time so pending comment work stays bounded.
+        rows = issue_rows()
+        while True:
+            chunk = [row for _, row in zip(range(batch_size), rows)]
+            if not chunk:
+                break
+            issues_total += _insert_batches(db, Issue, chunk, batch_size)
+            comments_total += _insert_batches(db, Comment, comment_rows(), batch_size)
+            issue_comments.clear()
+    finally:
+        db.rollback()
+        if bulk_sqlite:
+            search.install(db.connection())
+            search.rebuild(db.connection())
+        if db.get_bind().dialect.name == "postgresql":
+            # Ids were assigned explicitly, so move the serial sequences past them.
+            for table in ("users", "projects", "issues", "comments"):
+                db.execute(text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}))"))
+        rebuild_facet_counts(db)
+        db.commit()
+    return {"users": users, "projects": projects, "issues": issues_total, "comments": comments_total}
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Seed IssueHub demo data")
     parser.add_argument(
@@ -167,12 +333,38 @@ def main() -> None:
         action="store_true",
         help="Delete current users/projects/issues/comments before seeding",
     )
+    generator = parser.add_argument_group("generator mode", "Build a large synthetic dataset instead of the demo data")
+    generator.add_argument("--generate", action="store_true", help="Enable generator mode")
+    generator.add_argument("--users", type=int, default=1000)
+    generator.add_argument("--projects", type=int, default=20)
+    generator.add_argument("--members-per-project", type=int, default=50)
+    generator.add_argument("--issues-per-project", type=int, default=10000, help="Mean issues per project")
+    generator.add_argument("--skew", type=float, default=1.0, help="Zipf exponent for issues across projects (0 = uniform)")
+    generator.add_argument("--comments-per-issue", type=float, default=2.0, help="Mean comments per issue")
+    generator.add_argument("--seed", type=int, default=42)
+    generator.add_argument("--batch-size", type=int, default=20000)
     args = parser.parse_args()
 
     db = SessionLocal()
     try:
         if args.reset:
             reset_data(db)
+        if args.generate:
+            started = time.perf_counter()
+            counts = generate_data(
+                db,
+                users=args.users,
+                projects=args.projects,
+                members_per_project=args.members_per_project,
+                issues_per_project=args.issues_per_project,
+                skew=args.skew,
+                comments_per_issue=args.comments_per_issue,
+                seed=args.seed,
+                batch_size=args.batch_size,
+            )
+            print(f"Generated {counts} in {time.perf_counter() - started:.1f}s.")
+            print("Generated users: user<id>@scale.example.com, password: pass123")
+            return
         seed_data(db)
         print("Seed complete.")
         print("Demo users: alice@example.com, bob@example.com, carol@example.com, dave@example.com")
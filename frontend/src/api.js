@@ -39,3 +39,17 @@ export async function api(path, options = {}) {
   if (res.status === 204) return null;
   return res.json();
 }
+
+// batch fetches several GET paths in one round trip and returns their { status, headers, body } items in order, throwing on the first failed item.
+export async function batch(paths) {
+  const { responses } = await api("/batch", {
+    method: "POST",
+    body: JSON.stringify({ requests: paths.map((path) => ({ path: `/api${path}` })) }),
+  });
+  return responses.map((item) => {
+    if (item.status >= 400) {
+      throw new Error(item.body?.error?.message || `Request failed (${item.status})`);
+    }
+    return item;
+  });
+}
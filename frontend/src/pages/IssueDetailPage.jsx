@@ -1,12 +1,13 @@
 ﻿import React, { useEffect, useState } from "react";
 import { useParams } from "react-router-dom";
-import { api } from "../api";
+import { api, batch } from "../api";
 
 // IssueDetailPage handles single-issue metadata, status/assignee controls, and the comment thread with timestamps.
 export default function IssueDetailPage({ me, notify }) {
   const { issueId } = useParams();
   const [issue, setIssue] = useState(null);
   const [comments, setComments] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [members, setMembers] = useState([]);
   const [body, setBody] = useState("");
   const [error, setError] = useState("");
@@ -16,10 +17,11 @@ export default function IssueDetailPage({ me, notify }) {
     setLoading(true);
     setError("");
     try {
-      const i = await api(`/issues/${issueId}`);
+      const [issueItem, commentPage] = await batch([`/issues/${issueId}`, `/issues/${issueId}/comments?limit=200`]);
+      const i = issueItem.body;
       setIssue(i);
-      const c = await api(`/issues/${issueId}/comments`);
-      setComments(c);
+      setComments(commentPage.body);
+      setNextCursor(commentPage.headers["x-next-cursor"] || null);
       const mems = await api(`/projects/${i.project_id}/members`);
       setMembers(mems);
     } catch (err) {
@@ -32,6 +34,17 @@ export default function IssueDetailPage({ me, notify }) {
 
   useEffect(() => { load(); }, [issueId]);
 
+  const loadMoreComments = async () => {
+    try {
+      const [page] = await batch([`/issues/${issueId}/comments?limit=200&cursor=${encodeURIComponent(nextCursor)}`]);
+      setComments((prev) => [...prev, ...page.body]);
+      setNextCursor(page.headers["x-next-cursor"] || null);
+    } catch (err) {
+      setError(err.message);
+      notify(err.message, "error");
+    }
+  };
+
   const addComment = async (e) => {
     e.preventDefault();
     setError("");
@@ -114,12 +127,15 @@ export default function IssueDetailPage({ me, notify }) {
           {comments.map((c) => (
             <li key={c.id}>
               <div>{c.body}</div>
-              <div className="muted">Author: {memberNameById[c.author_id] || `User ${c.author_id}`}</div>
+              <div className="muted">Author: {c.author_name || memberNameById[c.author_id] || `User ${c.author_id}`}</div>
               <div className="muted">Posted: {formatTs(c.created_at)}</div>
             </li>
           ))}
           {comments.length === 0 && <li className="muted">No comments yet</li>}
         </ul>
+        {nextCursor && (
+          <button className="btn secondary" type="button" onClick={loadMoreComments}>Load more comments</button>
+        )}
 
         <form onSubmit={addComment}>
           <label>Add Comment</label>
@@ -26,6 +26,7 @@ export default function ProjectIssuesPage({ me, notify }) {
       if (filters.sort) params.set("sort", filters.sort);
       params.set("limit", String(pageSize));
       params.set("offset", String(page * pageSize));
+      params.set("fields", "title,status,priority,assignee_id");
       const data = await api(`/projects/${projectId}/issues?${params.toString()}`);
       setIssues(data);
       const mems = await api(`/projects/${projectId}/members`);